@@ -0,0 +1,41 @@
+"""add covering index for report queries
+
+Revision ID: a4e9c2d71b35
+Revises: 5c0782cc772f
+Create Date: 2026-02-14 10:12:47.318265
+
+This migration adds a composite index on (user_id, type, date) that INCLUDEs
+category_id, account_id and amount, so the report aggregations (SUM/COUNT by
+category or account over a user's transactions of one type in a date range)
+can be answered with index-only scans.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9c2d71b35'
+down_revision: Union[str, None] = '5c0782cc772f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create covering index for report aggregations
+    # This index optimizes:
+    # 1. Filtering transactions by user_id and type (income vs expenses)
+    # 2. Range scans on date for report periods
+    # 3. Reading category_id/account_id/amount from the index (INCLUDE)
+    op.create_index(
+        'idx_transactions_report_cover',
+        'transactions',
+        ['user_id', 'type', 'date'],
+        unique=False,
+        postgresql_include=['category_id', 'account_id', 'amount']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_transactions_report_cover', table_name='transactions')
@@ -0,0 +1,40 @@
+"""add transfer account index
+
+Revision ID: b7d24e0f5a19
+Revises: d3f81a6c92e4
+Create Date: 2026-02-15 09:21:05.447310
+
+This migration adds a partial index on transactions.transfer_account_id.
+Account balances add transfers into an account by looking transactions up
+on transfer_account_id, which had no index, so every balance calculation
+(and every account delete, via ON DELETE SET NULL) scanned the whole table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d24e0f5a19'
+down_revision: Union[str, None] = 'd3f81a6c92e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only transfers have a destination account, so the index stays small.
+    # The INCLUDE columns let the balance query read transfers in from the
+    # index alone.
+    op.create_index(
+        'idx_transactions_transfer_account',
+        'transactions',
+        ['transfer_account_id'],
+        unique=False,
+        postgresql_include=['date', 'type', 'amount', 'account_id'],
+        postgresql_where=sa.text('transfer_account_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_transactions_transfer_account', table_name='transactions')
@@ -0,0 +1,89 @@
+"""add monthly category rollups
+
+Revision ID: d3f81a6c92e4
+Revises: a4e9c2d71b35
+Create Date: 2026-02-14 16:48:31.902114
+
+This migration adds the monthly_category_rollups table, a trigger on
+transactions that keeps it in sync, and backfills it from existing
+transactions. The multi-month reports read closed months from the rollup
+instead of re-aggregating the full transaction history.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f81a6c92e4'
+down_revision: Union[str, None] = 'a4e9c2d71b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('monthly_category_rollups',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('type', postgresql.ENUM('DEBIT', 'CREDIT', 'TRANSFER', name='transactiontype', create_type=False), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('user_id', 'account_id', 'category_id', 'type', 'month')
+    )
+
+    # Keep the rollup in sync on every insert/update/delete of transactions,
+    # including bulk statements and FK cascades that bypass the ORM
+    op.execute("""
+        CREATE OR REPLACE FUNCTION apply_monthly_category_rollup() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.category_id IS NOT NULL THEN
+                INSERT INTO monthly_category_rollups
+                    (user_id, account_id, category_id, type, month, total_amount, transaction_count)
+                VALUES
+                    (OLD.user_id, OLD.account_id, OLD.category_id, OLD.type,
+                     date_trunc('month', OLD.date)::date, -OLD.amount, -1)
+                ON CONFLICT (user_id, account_id, category_id, type, month) DO UPDATE SET
+                    total_amount = monthly_category_rollups.total_amount + EXCLUDED.total_amount,
+                    transaction_count = monthly_category_rollups.transaction_count + EXCLUDED.transaction_count;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.category_id IS NOT NULL THEN
+                INSERT INTO monthly_category_rollups
+                    (user_id, account_id, category_id, type, month, total_amount, transaction_count)
+                VALUES
+                    (NEW.user_id, NEW.account_id, NEW.category_id, NEW.type,
+                     date_trunc('month', NEW.date)::date, NEW.amount, 1)
+                ON CONFLICT (user_id, account_id, category_id, type, month) DO UPDATE SET
+                    total_amount = monthly_category_rollups.total_amount + EXCLUDED.total_amount,
+                    transaction_count = monthly_category_rollups.transaction_count + EXCLUDED.transaction_count;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER transactions_monthly_category_rollup
+        AFTER INSERT OR DELETE OR UPDATE OF user_id, account_id, category_id, type, amount, date
+        ON transactions
+        FOR EACH ROW EXECUTE PROCEDURE apply_monthly_category_rollup()
+    """)
+
+    # Backfill from existing transactions
+    op.execute("""
+        INSERT INTO monthly_category_rollups
+            (user_id, account_id, category_id, type, month, total_amount, transaction_count)
+        SELECT user_id, account_id, category_id, type, date_trunc('month', date)::date,
+               SUM(amount), COUNT(*)
+        FROM transactions
+        WHERE category_id IS NOT NULL
+        GROUP BY user_id, account_id, category_id, type, date_trunc('month', date)::date
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS transactions_monthly_category_rollup ON transactions")
+    op.execute("DROP FUNCTION IF EXISTS apply_monthly_category_rollup()")
+    op.drop_table('monthly_category_rollups')
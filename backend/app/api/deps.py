@@ -10,13 +10,16 @@ from app.schemas.token import TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-async def get_current_user(
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> UserModel:
     """
     Dependency to get the current authenticated user from JWT token.
 
+    Declared as a plain function so FastAPI runs the blocking user lookup
+    in its threadpool rather than on the event loop.
+
     Args:
         token: JWT access token from request header
         db: Database session
@@ -1,18 +1,26 @@
-from typing import List
+from typing import List, Optional
+from decimal import Decimal
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.api.deps import get_current_active_user
+from app.services.report_cache_service import invalidate_report_cache
 from app.models.user import User as UserModel
 from app.models.account import Account as AccountModel
+from app.services.account_balance_service import AccountBalanceService
 from app.schemas.account import Account, AccountCreate, AccountUpdate
 
 router = APIRouter()
 
 
-def _account_to_response(account: AccountModel, db: Session) -> dict:
-    """Convert account model to response dict with calculated balance."""
+def _account_to_response(account: AccountModel, db: Session, balance: Optional[Decimal] = None) -> dict:
+    """Convert account model to response dict with calculated balance.
+
+    Pass a precomputed ``balance`` to skip the per-account balance query.
+    """
+    if balance is None:
+        balance = account.calculate_balance(db)
     return {
         "id": account.id,
         "user_id": account.user_id,
@@ -23,7 +31,7 @@ def _account_to_response(account: AccountModel, db: Session) -> dict:
         "currency": account.currency,
         "opening_balance": account.opening_balance,
         "opening_balance_date": account.opening_balance_date,
-        "current_balance": account.calculate_balance(db),  # Calculated field
+        "current_balance": balance,  # Calculated field
         "is_active": account.is_active,
         "notes": account.notes,
         "created_at": account.created_at,
@@ -55,6 +63,7 @@ def create_account(
 
     db.add(db_account)
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(db_account)
 
     return _account_to_response(db_account, db)
@@ -82,8 +91,9 @@ def get_accounts(
     accounts = db.query(AccountModel).filter(
         AccountModel.user_id == current_user.id
     ).offset(skip).limit(limit).all()
+    balances = AccountBalanceService(db).get_balances(accounts)
 
-    return [_account_to_response(account, db) for account in accounts]
+    return [_account_to_response(account, db, balances[account.id]) for account in accounts]
 
 
 @router.get("/{account_id}", response_model=Account)
@@ -159,6 +169,7 @@ def update_account(
         setattr(account, field, value)
 
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(account)
 
     return _account_to_response(account, db)
@@ -194,5 +205,6 @@ def delete_account(
 
     db.delete(account)
     db.commit()
+    invalidate_report_cache(current_user.id)
 
     return None
@@ -6,6 +6,7 @@ from sqlalchemy import func
 
 from app.core.database import get_db
 from app.api.deps import get_current_active_user
+from app.services.report_cache_service import invalidate_report_cache
 from app.models.user import User as UserModel
 from app.models.budget import Budget as BudgetModel
 from app.models.transaction import Transaction as TransactionModel, TransactionType
@@ -27,6 +28,7 @@ def create_budget(
     )
     db.add(db_budget)
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(db_budget)
     return db_budget
 
@@ -148,6 +150,7 @@ def update_budget(
         setattr(budget, field, value)
 
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(budget)
     return budget
 
@@ -172,4 +175,5 @@ def delete_budget(
 
     db.delete(budget)
     db.commit()
+    invalidate_report_cache(current_user.id)
     return None
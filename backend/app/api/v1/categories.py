@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.api.deps import get_current_active_user
+from app.services.report_cache_service import invalidate_report_cache
 from app.models.user import User as UserModel
 from app.models.category import Category as CategoryModel, CategoryType
 from app.schemas.category import Category, CategoryCreate, CategoryUpdate
@@ -24,6 +25,7 @@ def create_category(
     )
     db.add(db_category)
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(db_category)
     return db_category
 
@@ -89,6 +91,7 @@ def update_category(
         setattr(category, field, value)
 
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(category)
     return category
 
@@ -113,4 +116,5 @@ def delete_category(
 
     db.delete(category)
     db.commit()
+    invalidate_report_cache(current_user.id)
     return None
@@ -1,15 +1,22 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Form
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
-from typing import List, Optional
-import gzip
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, defer
+from typing import Callable, Iterable, List, Optional, Tuple
+from collections import Counter
+import asyncio
+import hashlib
+from io import BytesIO
 import logging
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 from app.api.deps import get_current_active_user, get_db
+from app.services.report_cache_service import invalidate_report_cache
 from app.models.user import User
 from app.models.account import Account
-from app.models.transaction import Transaction, TransactionType
+from app.models.transaction import Transaction
 from app.models.import_history import ImportHistory, ImportedTransaction
 from app.models.payee import Payee as PayeeModel
 from app.models.category import Category
@@ -40,188 +47,302 @@ from app.services.import_service import ImportService
 from app.services.ofx_service import OFXService
 from app.services.duplicate_detection_service import DuplicateDetectionService
 from app.services.smart_rule_suggestion_service import SmartRuleSuggestionService
-from app.services.payee_service import PayeeService
+from app.services.payee_service import PayeeService, bump_payee_generation, payee_generation
 from app.services.payee_extraction_service import PayeeExtractionService
 from app.services.intelligent_payee_matching_service import IntelligentPayeeMatchingService
-import json
+import orjson
+from isal import igzip
+from cachetools import TTLCache
 
-router = APIRouter()
+# Import payloads (payee analyses, sample rows) can be large - serialize with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Largest import file accepted by the upload endpoints
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+UPLOAD_READ_CHUNK_SIZE = 64 * 1024
 
-def find_category_by_name(db: Session, user_id: int, category_name: str) -> Optional[int]:
+CSV_EXTENSIONS = ('.csv',)
+OFX_EXTENSIONS = ('.ofx', '.qfx')
+CSV_FORMAT_ERROR = "File must be CSV format"
+OFX_FORMAT_ERROR = "File must be OFX or QFX format"
+
+
+def upload_too_large() -> HTTPException:
+    """Build the 413 error for an upload over MAX_UPLOAD_BYTES"""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)}MB upload limit"
+    )
+
+
+def validate_upload(file: UploadFile, extensions: Tuple[str, ...], format_error: str) -> None:
     """
-    Find a user's category by name, with flexible matching.
-    Supports: exact match, case-insensitive match, and common aliases.
+    Reject an upload by extension and reported size before any of it is read.
 
     Args:
-        db: Database session
-        user_id: User ID to search within
-        category_name: Category name to find (from known_merchants.json or user input)
+        file: Uploaded file
+        extensions: Accepted filename extensions
+        format_error: Error detail for a wrong extension
+
+    Raises:
+        HTTPException: 400 for a wrong extension, 413 when over MAX_UPLOAD_BYTES
+    """
+    if not file.filename or not file.filename.endswith(extensions):
+        raise HTTPException(status_code=400, detail=format_error)
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise upload_too_large()
+
+
+async def read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload in chunks, aborting as soon as it exceeds MAX_UPLOAD_BYTES.
+
+    Raises:
+        HTTPException: 413 when the file is too large
+    """
+    chunks = []
+    total = 0
+    while chunk := await file.read(UPLOAD_READ_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_UPLOAD_BYTES:
+            raise upload_too_large()
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+# Row errors listed in the log line / ImportHistory.error_message
+ROW_ERROR_SUMMARY_LIMIT = 20
+
+
+def report_row_errors(import_type: str, row_errors: List[Tuple[object, str]]) -> Optional[str]:
+    """
+    Log the rows that failed during an import in one warning.
+
+    Errors are collected during the import loop instead of being printed per
+    row, then summarized here once.
+
+    Args:
+        import_type: csv, ofx or qfx
+        row_errors: (row number, error text) pairs
 
     Returns:
-        Category ID if found, None otherwise
+        Summary for ImportHistory.error_message, or None if there were no errors
     """
-    if not category_name:
+    if not row_errors:
         return None
 
-    # Comprehensive category name mappings
-    # Maps suggested category names -> possible user category names
-    category_aliases = {
-        # Financial Institutions
-        'bank': ['Bank', 'Banking', 'Finance', 'Financial', 'Bank Fees', 'Fees & Charges'],
-        'credit_union': ['Credit Union', 'Bank', 'Banking', 'Finance'],
-        'investment': ['Investment', 'Investments', 'Finance', 'Brokerage', 'Stocks'],
-        'credit_card': ['Credit Card', 'Credit Cards', 'Finance', 'Fees & Charges'],
-        'payment_processor': ['Transfer', 'Transfers', 'Finance', 'Payment'],
-
-        # Transportation & Auto
-        'transportation': ['Transportation', 'Transport', 'Auto & Transport', 'Travel'],
-        'auto & transport': ['Auto & Transport', 'Transportation', 'Auto', 'Car'],
-        'gas': ['Gas & Fuel', 'Gas', 'Fuel', 'Auto & Transport', 'Transportation'],
-        'gas_station': ['Gas & Fuel', 'Gas', 'Fuel', 'Auto & Transport', 'Transportation'],
-        'gas & fuel': ['Gas & Fuel', 'Gas', 'Fuel', 'Auto & Transport', 'Transportation'],
-        'ev_charging': ['Gas & Fuel', 'Electric', 'Auto & Transport', 'Transportation'],
-        'rideshare': ['Transportation', 'Rideshare', 'Auto & Transport', 'Travel'],
-        'car_rental': ['Car Rental', 'Transportation', 'Travel', 'Auto & Transport'],
-        'public_transit': ['Transportation', 'Public Transit', 'Transit', 'Auto & Transport'],
-        'parking': ['Parking', 'Transportation', 'Auto & Transport'],
-        'toll': ['Toll', 'Transportation', 'Auto & Transport'],
-
-        # Food & Dining
-        'restaurants': ['Restaurants', 'Restaurant', 'Dining', 'Food & Dining', 'Eating Out'],
-        'restaurant': ['Restaurants', 'Restaurant', 'Dining', 'Food & Dining'],
-        'fast_food': ['Restaurants', 'Fast Food', 'Food & Dining', 'Dining'],
-        'casual_dining': ['Restaurants', 'Dining', 'Food & Dining'],
-        'fine_dining': ['Restaurants', 'Dining', 'Food & Dining'],
-        'coffee_shop': ['Coffee Shops', 'Coffee', 'Restaurants', 'Dining', 'Food & Dining'],
-        'coffee shops': ['Coffee Shops', 'Coffee', 'Restaurants', 'Dining', 'Food & Dining'],
-        'bakery': ['Bakery', 'Coffee Shops', 'Restaurants', 'Food & Dining'],
-        'food delivery': ['Food Delivery', 'Restaurants', 'Dining', 'Delivery'],
-        'food_delivery': ['Food Delivery', 'Restaurants', 'Dining', 'Delivery'],
-
-        # Grocery
-        'groceries': ['Groceries', 'Grocery', 'Food & Dining', 'Food'],
-        'grocery': ['Groceries', 'Grocery', 'Food & Dining', 'Food'],
-        'supermarket': ['Groceries', 'Grocery', 'Supermarket', 'Food'],
-        'convenience_store': ['Groceries', 'Convenience', 'Shopping'],
-
-        # Shopping & Retail
-        'shopping': ['Shopping', 'Retail', 'General Merchandise', 'Stores'],
-        'retail': ['Shopping', 'Retail', 'General Merchandise'],
-        'department_store': ['Shopping', 'Department Store', 'Retail'],
-        'discount_store': ['Shopping', 'Discount', 'Retail'],
-        'online_retail': ['Shopping', 'Online Shopping', 'Retail'],
-        'specialty_retail': ['Shopping', 'Retail', 'Specialty'],
-
-        # Entertainment
-        'entertainment': ['Entertainment', 'Fun', 'Recreation', 'Leisure'],
-        'streaming': ['Entertainment', 'Streaming', 'Subscriptions'],
-        'music_streaming': ['Entertainment', 'Music', 'Subscriptions'],
-        'gaming': ['Entertainment', 'Gaming', 'Games', 'Subscriptions'],
-
-        # Bills & Utilities
-        'utilities': ['Utilities', 'Bills & Utilities', 'Bills', 'Home'],
-        'electric': ['Utilities', 'Electric', 'Bills & Utilities', 'Bills'],
-        'gas_utility': ['Utilities', 'Gas', 'Bills & Utilities', 'Bills'],
-        'water': ['Utilities', 'Water', 'Bills & Utilities', 'Bills'],
-        'internet': ['Phone & Internet', 'Internet', 'Utilities', 'Bills'],
-        'phone': ['Phone & Internet', 'Phone', 'Mobile', 'Utilities', 'Bills'],
-        'cable': ['Phone & Internet', 'Cable', 'TV', 'Utilities', 'Bills'],
-        'phone & internet': ['Phone & Internet', 'Phone', 'Internet', 'Utilities', 'Bills'],
-
-        # Software & Subscriptions
-        'subscriptions': ['Subscriptions', 'Entertainment', 'Software', 'Monthly'],
-        'software': ['Software', 'Subscriptions', 'Technology'],
-        'cloud_services': ['Software', 'Cloud', 'Subscriptions', 'Technology'],
-
-        # Health & Medical
-        'health & medical': ['Health & Medical', 'Healthcare', 'Medical', 'Health'],
-        'pharmacy': ['Pharmacy', 'Health & Medical', 'Healthcare', 'Medical'],
-        'hospital': ['Health & Medical', 'Hospital', 'Medical', 'Healthcare'],
-        'clinic': ['Health & Medical', 'Clinic', 'Medical', 'Healthcare'],
-        'dental': ['Dental', 'Health & Medical', 'Healthcare'],
-        'vision': ['Vision', 'Eye Care', 'Health & Medical', 'Healthcare'],
-        'gym & fitness': ['Gym & Fitness', 'Fitness', 'Gym', 'Health'],
-        'gym': ['Gym & Fitness', 'Fitness', 'Gym', 'Health'],
-        'fitness_app': ['Gym & Fitness', 'Fitness', 'Subscriptions', 'Health'],
-        'wellness': ['Wellness', 'Health & Medical', 'Personal Care'],
-
-        # Insurance
-        'insurance': ['Insurance', 'Bills', 'Auto Insurance', 'Health Insurance'],
-        'auto_insurance': ['Insurance', 'Auto Insurance', 'Auto & Transport'],
-        'health_insurance': ['Insurance', 'Health Insurance', 'Health & Medical'],
-        'home_insurance': ['Insurance', 'Home Insurance', 'Home'],
-        'life_insurance': ['Insurance', 'Life Insurance'],
-
-        # Travel
-        'travel': ['Travel', 'Vacation', 'Transportation', 'Hotels'],
-        'airline': ['Travel', 'Airlines', 'Air Travel', 'Transportation'],
-        'hotel': ['Travel', 'Hotels', 'Lodging', 'Vacation'],
-        'travel_booking': ['Travel', 'Vacation', 'Hotels', 'Airlines'],
-
-        # Personal
-        'personal care': ['Personal Care', 'Personal', 'Beauty', 'Self Care'],
-
-        # Home
-        'home services': ['Home Services', 'Home', 'Home Improvement', 'Services'],
-        'home_services': ['Home Services', 'Home', 'Home Improvement', 'Services'],
-
-        # Professional Services
-        'professional_services': ['Professional Services', 'Services', 'Business'],
-
-        # Education
-        'education': ['Education', 'Learning', 'Books', 'School'],
-
-        # Fees & Finance
-        'fees & charges': ['Fees & Charges', 'Fees', 'Bank Fees', 'Finance'],
-        'fees': ['Fees & Charges', 'Fees', 'Bank Fees', 'Finance'],
-
-        # Gifts & Donations
-        'gifts & donations': ['Gifts & Donations', 'Gifts', 'Donations', 'Charity'],
-
-        # Pets
-        'pets': ['Pets', 'Pet Care', 'Pet Supplies'],
-
-        # Childcare
-        'childcare': ['Childcare', 'Kids', 'Children', 'Family'],
-
-        # Taxes & Legal
-        'taxes': ['Taxes', 'Tax', 'Tax Preparation'],
-        'tax': ['Taxes', 'Tax', 'Tax Preparation'],
-        'legal': ['Legal', 'Legal Services', 'Attorney'],
-    }
+    shown = "; ".join(f"row {row}: {error}" for row, error in row_errors[:ROW_ERROR_SUMMARY_LIMIT])
+    more = len(row_errors) - ROW_ERROR_SUMMARY_LIMIT
+    summary = f"{len(row_errors)} {import_type.upper()} row(s) failed to import - {shown}"
+    if more > 0:
+        summary += f" (and {more} more)"
+
+    logger.warning(summary)
+    return summary
+
+
+# Comprehensive category name mappings
+# Maps suggested category names -> possible user category names
+CATEGORY_ALIASES = {
+    # Financial Institutions
+    'bank': ['Bank', 'Banking', 'Finance', 'Financial', 'Bank Fees', 'Fees & Charges'],
+    'credit_union': ['Credit Union', 'Bank', 'Banking', 'Finance'],
+    'investment': ['Investment', 'Investments', 'Finance', 'Brokerage', 'Stocks'],
+    'credit_card': ['Credit Card', 'Credit Cards', 'Finance', 'Fees & Charges'],
+    'payment_processor': ['Transfer', 'Transfers', 'Finance', 'Payment'],
+
+    # Transportation & Auto
+    'transportation': ['Transportation', 'Transport', 'Auto & Transport', 'Travel'],
+    'auto & transport': ['Auto & Transport', 'Transportation', 'Auto', 'Car'],
+    'gas': ['Gas & Fuel', 'Gas', 'Fuel', 'Auto & Transport', 'Transportation'],
+    'gas_station': ['Gas & Fuel', 'Gas', 'Fuel', 'Auto & Transport', 'Transportation'],
+    'gas & fuel': ['Gas & Fuel', 'Gas', 'Fuel', 'Auto & Transport', 'Transportation'],
+    'ev_charging': ['Gas & Fuel', 'Electric', 'Auto & Transport', 'Transportation'],
+    'rideshare': ['Transportation', 'Rideshare', 'Auto & Transport', 'Travel'],
+    'car_rental': ['Car Rental', 'Transportation', 'Travel', 'Auto & Transport'],
+    'public_transit': ['Transportation', 'Public Transit', 'Transit', 'Auto & Transport'],
+    'parking': ['Parking', 'Transportation', 'Auto & Transport'],
+    'toll': ['Toll', 'Transportation', 'Auto & Transport'],
+
+    # Food & Dining
+    'restaurants': ['Restaurants', 'Restaurant', 'Dining', 'Food & Dining', 'Eating Out'],
+    'restaurant': ['Restaurants', 'Restaurant', 'Dining', 'Food & Dining'],
+    'fast_food': ['Restaurants', 'Fast Food', 'Food & Dining', 'Dining'],
+    'casual_dining': ['Restaurants', 'Dining', 'Food & Dining'],
+    'fine_dining': ['Restaurants', 'Dining', 'Food & Dining'],
+    'coffee_shop': ['Coffee Shops', 'Coffee', 'Restaurants', 'Dining', 'Food & Dining'],
+    'coffee shops': ['Coffee Shops', 'Coffee', 'Restaurants', 'Dining', 'Food & Dining'],
+    'bakery': ['Bakery', 'Coffee Shops', 'Restaurants', 'Food & Dining'],
+    'food delivery': ['Food Delivery', 'Restaurants', 'Dining', 'Delivery'],
+    'food_delivery': ['Food Delivery', 'Restaurants', 'Dining', 'Delivery'],
+
+    # Grocery
+    'groceries': ['Groceries', 'Grocery', 'Food & Dining', 'Food'],
+    'grocery': ['Groceries', 'Grocery', 'Food & Dining', 'Food'],
+    'supermarket': ['Groceries', 'Grocery', 'Supermarket', 'Food'],
+    'convenience_store': ['Groceries', 'Convenience', 'Shopping'],
+
+    # Shopping & Retail
+    'shopping': ['Shopping', 'Retail', 'General Merchandise', 'Stores'],
+    'retail': ['Shopping', 'Retail', 'General Merchandise'],
+    'department_store': ['Shopping', 'Department Store', 'Retail'],
+    'discount_store': ['Shopping', 'Discount', 'Retail'],
+    'online_retail': ['Shopping', 'Online Shopping', 'Retail'],
+    'specialty_retail': ['Shopping', 'Retail', 'Specialty'],
+
+    # Entertainment
+    'entertainment': ['Entertainment', 'Fun', 'Recreation', 'Leisure'],
+    'streaming': ['Entertainment', 'Streaming', 'Subscriptions'],
+    'music_streaming': ['Entertainment', 'Music', 'Subscriptions'],
+    'gaming': ['Entertainment', 'Gaming', 'Games', 'Subscriptions'],
+
+    # Bills & Utilities
+    'utilities': ['Utilities', 'Bills & Utilities', 'Bills', 'Home'],
+    'electric': ['Utilities', 'Electric', 'Bills & Utilities', 'Bills'],
+    'gas_utility': ['Utilities', 'Gas', 'Bills & Utilities', 'Bills'],
+    'water': ['Utilities', 'Water', 'Bills & Utilities', 'Bills'],
+    'internet': ['Phone & Internet', 'Internet', 'Utilities', 'Bills'],
+    'phone': ['Phone & Internet', 'Phone', 'Mobile', 'Utilities', 'Bills'],
+    'cable': ['Phone & Internet', 'Cable', 'TV', 'Utilities', 'Bills'],
+    'phone & internet': ['Phone & Internet', 'Phone', 'Internet', 'Utilities', 'Bills'],
+
+    # Software & Subscriptions
+    'subscriptions': ['Subscriptions', 'Entertainment', 'Software', 'Monthly'],
+    'software': ['Software', 'Subscriptions', 'Technology'],
+    'cloud_services': ['Software', 'Cloud', 'Subscriptions', 'Technology'],
+
+    # Health & Medical
+    'health & medical': ['Health & Medical', 'Healthcare', 'Medical', 'Health'],
+    'pharmacy': ['Pharmacy', 'Health & Medical', 'Healthcare', 'Medical'],
+    'hospital': ['Health & Medical', 'Hospital', 'Medical', 'Healthcare'],
+    'clinic': ['Health & Medical', 'Clinic', 'Medical', 'Healthcare'],
+    'dental': ['Dental', 'Health & Medical', 'Healthcare'],
+    'vision': ['Vision', 'Eye Care', 'Health & Medical', 'Healthcare'],
+    'gym & fitness': ['Gym & Fitness', 'Fitness', 'Gym', 'Health'],
+    'gym': ['Gym & Fitness', 'Fitness', 'Gym', 'Health'],
+    'fitness_app': ['Gym & Fitness', 'Fitness', 'Subscriptions', 'Health'],
+    'wellness': ['Wellness', 'Health & Medical', 'Personal Care'],
+
+    # Insurance
+    'insurance': ['Insurance', 'Bills', 'Auto Insurance', 'Health Insurance'],
+    'auto_insurance': ['Insurance', 'Auto Insurance', 'Auto & Transport'],
+    'health_insurance': ['Insurance', 'Health Insurance', 'Health & Medical'],
+    'home_insurance': ['Insurance', 'Home Insurance', 'Home'],
+    'life_insurance': ['Insurance', 'Life Insurance'],
+
+    # Travel
+    'travel': ['Travel', 'Vacation', 'Transportation', 'Hotels'],
+    'airline': ['Travel', 'Airlines', 'Air Travel', 'Transportation'],
+    'hotel': ['Travel', 'Hotels', 'Lodging', 'Vacation'],
+    'travel_booking': ['Travel', 'Vacation', 'Hotels', 'Airlines'],
+
+    # Personal
+    'personal care': ['Personal Care', 'Personal', 'Beauty', 'Self Care'],
+
+    # Home
+    'home services': ['Home Services', 'Home', 'Home Improvement', 'Services'],
+    'home_services': ['Home Services', 'Home', 'Home Improvement', 'Services'],
+
+    # Professional Services
+    'professional_services': ['Professional Services', 'Services', 'Business'],
+
+    # Education
+    'education': ['Education', 'Learning', 'Books', 'School'],
+
+    # Fees & Finance
+    'fees & charges': ['Fees & Charges', 'Fees', 'Bank Fees', 'Finance'],
+    'fees': ['Fees & Charges', 'Fees', 'Bank Fees', 'Finance'],
+
+    # Gifts & Donations
+    'gifts & donations': ['Gifts & Donations', 'Gifts', 'Donations', 'Charity'],
+
+    # Pets
+    'pets': ['Pets', 'Pet Care', 'Pet Supplies'],
+
+    # Childcare
+    'childcare': ['Childcare', 'Kids', 'Children', 'Family'],
+
+    # Taxes & Legal
+    'taxes': ['Taxes', 'Tax', 'Tax Preparation'],
+    'tax': ['Taxes', 'Tax', 'Tax Preparation'],
+    'legal': ['Legal', 'Legal Services', 'Attorney'],
+}
+
+
+def load_user_categories(db: Session, user_id: int) -> List[Tuple[int, str]]:
+    """
+    Load a user's categories as (id, name) pairs for in-memory name matching.
 
-    # Get all user categories for matching
-    user_categories = db.query(Category).filter(
+    Lets import loops resolve many category names with a single query.
+    """
+    return db.query(Category.id, Category.name).filter(
         Category.user_id == user_id
     ).all()
 
+
+def match_category_name(
+    user_categories: List[Tuple[int, str]],
+    category_name: str
+) -> Optional[int]:
+    """
+    Match a category name against preloaded (id, name) pairs, with flexible matching.
+    Supports: exact match, case-insensitive match, and common aliases.
+
+    Args:
+        user_categories: Result of load_user_categories
+        category_name: Category name to find (from known_merchants.json or user input)
+
+    Returns:
+        Category ID if found, None otherwise
+    """
+    if not category_name:
+        return None
+
     # Try exact match first
-    for cat in user_categories:
-        if cat.name == category_name:
-            return cat.id
+    for cat_id, name in user_categories:
+        if name == category_name:
+            return cat_id
 
     # Try case-insensitive match
     category_lower = category_name.lower()
-    for cat in user_categories:
-        if cat.name.lower() == category_lower:
-            return cat.id
+    for cat_id, name in user_categories:
+        if name.lower() == category_lower:
+            return cat_id
 
     # Try alias mapping
-    if category_lower in category_aliases:
-        for alias in category_aliases[category_lower]:
-            for cat in user_categories:
-                if cat.name.lower() == alias.lower():
-                    return cat.id
+    if category_lower in CATEGORY_ALIASES:
+        for alias in CATEGORY_ALIASES[category_lower]:
+            for cat_id, name in user_categories:
+                if name.lower() == alias.lower():
+                    return cat_id
 
     # Try partial match (category_name is substring of actual name)
-    for cat in user_categories:
-        if category_lower in cat.name.lower():
-            return cat.id
+    for cat_id, name in user_categories:
+        if category_lower in name.lower():
+            return cat_id
 
     return None
 
 
+def find_category_by_name(db: Session, user_id: int, category_name: str) -> Optional[int]:
+    """
+    Find a user's category by name, with flexible matching.
+    Supports: exact match, case-insensitive match, and common aliases.
+
+    Args:
+        db: Database session
+        user_id: User ID to search within
+        category_name: Category name to find (from known_merchants.json or user input)
+
+    Returns:
+        Category ID if found, None otherwise
+    """
+    if not category_name:
+        return None
+
+    return match_category_name(load_user_categories(db, user_id), category_name)
+
+
 def get_user_icon_provider(user: User) -> Optional[str]:
     """
     Get the user's preferred icon provider from their UI preferences.
@@ -240,21 +361,80 @@ def get_user_icon_provider(user: User) -> Optional[str]:
     return None
 
 
+def extract_import_payee_name(
+    extraction_service: PayeeExtractionService,
+    trans_data: dict,
+    payee_overrides: Optional[dict] = None
+) -> Optional[str]:
+    """
+    Work out the payee name an imported transaction should be linked to.
+
+    Uses the SAME extraction logic as analyze-all-payees, then applies any
+    user rename from the review screen.
+
+    Args:
+        extraction_service: Shared PayeeExtractionService
+        trans_data: Mapped transaction dict
+        payee_overrides: Optional map of suggested_name -> final_name
+
+    Returns:
+        Final payee name, or None when there is nothing to extract from
+    """
+    description = trans_data.get('description', '')
+    payee = trans_data.get('payee', '')
+    text_to_extract = description or payee
+
+    if not (text_to_extract and text_to_extract.strip()):
+        return None
+
+    extracted_name, _ = extraction_service.extract_payee_name(text_to_extract)
+    if payee_overrides:
+        return payee_overrides.get(extracted_name, extracted_name) or None
+    return extracted_name or None
+
+
+def get_column_mapping(column_mapping: str = Form(...)) -> CSVColumnMapping:
+    """
+    Parse the multipart ``column_mapping`` JSON field into a CSVColumnMapping.
+
+    Uses Pydantic's native JSON parser so the payload is decoded and validated
+    in a single pass.
+    """
+    try:
+        return CSVColumnMapping.model_validate_json(column_mapping)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid column mapping: {str(e)}")
+
+
+def get_import_service(db: Session = Depends(get_db)) -> ImportService:
+    """Per-request ImportService bound to the request's DB session"""
+    return ImportService(db)
+
+
+def get_payee_decisions_request(request_data: str = Form(...)) -> ImportWithPayeeDecisionsRequest:
+    """
+    Parse the multipart ``request_data`` JSON field into an ImportWithPayeeDecisionsRequest.
+
+    Large ``payee_assignments`` arrays are decoded and validated in a single pass.
+    """
+    try:
+        return ImportWithPayeeDecisionsRequest.model_validate_json(request_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import request: {str(e)}")
+
+
 @router.post("/csv/preview", response_model=CSVPreviewResponse)
 async def preview_csv(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    service: ImportService = Depends(get_import_service),
+    current_user: User = Depends(get_current_active_user)
 ):
     """Upload CSV and get preview with suggested column mapping"""
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be CSV format")
-
-    contents = await file.read()
+    validate_upload(file, CSV_EXTENSIONS, CSV_FORMAT_ERROR)
 
     try:
-        service = ImportService(db)
-        df = service.parse_csv(contents)
+        # Only the head of the file is needed for columns, samples and format
+        df, row_count = await asyncio.to_thread(service.parse_csv_preview, file.file)
 
         # Detect format and suggest mapping
         format_type = service.detect_csv_format(df)
@@ -265,7 +445,7 @@ async def preview_csv(
             sample_rows=df.head(5).fillna('').to_dict('records'),
             detected_format=format_type,
             suggested_mapping=suggested_mapping,
-            row_count=len(df)
+            row_count=row_count
         )
     except Exception as e:
         raise HTTPException(
@@ -280,13 +460,12 @@ async def preview_ofx(
     current_user: User = Depends(get_current_active_user)
 ):
     """Upload OFX/QFX and get preview"""
-    if not (file.filename.endswith('.ofx') or file.filename.endswith('.qfx')):
-        raise HTTPException(status_code=400, detail="File must be OFX or QFX format")
+    validate_upload(file, OFX_EXTENSIONS, OFX_FORMAT_ERROR)
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        result = OFXService.parse_ofx(contents)
+        result = await asyncio.to_thread(ImportService.parse_ofx_upload, current_user.id, contents)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse OFX file: {str(e)}")
 
@@ -314,13 +493,12 @@ async def analyze_all_ofx_payees(
     This returns payee analysis for the FULL file, not just a sample.
     Used by the PayeeReviewStep in the import wizard.
     """
-    if not (file.filename.endswith('.ofx') or file.filename.endswith('.qfx')):
-        raise HTTPException(status_code=400, detail="File must be OFX or QFX format")
+    validate_upload(file, OFX_EXTENSIONS, OFX_FORMAT_ERROR)
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        result = OFXService.parse_ofx(contents)
+        result = await asyncio.to_thread(ImportService.parse_ofx_upload, current_user.id, contents)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse OFX file: {str(e)}")
 
@@ -357,7 +535,8 @@ async def analyze_all_ofx_payees(
 @router.post("/csv/analyze-all-payees", response_model=AnalyzePayeesResponse)
 async def analyze_all_csv_payees(
     file: UploadFile = File(...),
-    column_mapping: str = Form(...),  # JSON string
+    column_map: CSVColumnMapping = Depends(get_column_mapping),
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -367,15 +546,11 @@ async def analyze_all_csv_payees(
     This returns payee analysis for the FULL file, not just a sample.
     Used by the PayeeReviewStep in the import wizard.
     """
-    contents = await file.read()
+    validate_upload(file, CSV_EXTENSIONS, CSV_FORMAT_ERROR)
 
     try:
-        # Parse column mapping from JSON string
-        mapping_dict = json.loads(column_mapping)
-        column_map = CSVColumnMapping(**mapping_dict)
-
-        service = ImportService(db)
-        df = service.parse_csv(contents)
+        # Parse straight from the spooled upload file (cached across wizard steps)
+        df = await asyncio.to_thread(service.parse_csv_upload, current_user.id, file.file)
 
         # Map CSV to transactions (gets ALL rows)
         mapped_transactions = service.map_csv_to_transactions(df, column_map)
@@ -419,11 +594,14 @@ async def analyze_all_csv_payees(
 async def detect_csv_duplicates(
     file: UploadFile = File(...),
     account_id: int = Form(...),
-    column_mapping: str = Form(...),  # JSON string
+    column_map: CSVColumnMapping = Depends(get_column_mapping),
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Check for duplicate transactions before importing CSV"""
+    validate_upload(file, CSV_EXTENSIONS, CSV_FORMAT_ERROR)
+
     # Verify account ownership
     account = db.query(Account).filter(
         Account.id == account_id,
@@ -432,15 +610,9 @@ async def detect_csv_duplicates(
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    contents = await file.read()
-
     try:
-        # Parse column mapping from JSON string
-        mapping_dict = json.loads(column_mapping)
-        column_map = CSVColumnMapping(**mapping_dict)
-
-        service = ImportService(db)
-        df = service.parse_csv(contents)
+        # Parse straight from the spooled upload file (cached across wizard steps)
+        df = await asyncio.to_thread(service.parse_csv_upload, current_user.id, file.file)
 
         # Map CSV to transactions
         mapped_transactions = service.map_csv_to_transactions(df, column_map)
@@ -468,10 +640,13 @@ async def detect_csv_duplicates(
 async def detect_ofx_duplicates(
     file: UploadFile = File(...),
     account_id: int = Form(...),
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Check for duplicate transactions before importing OFX"""
+    validate_upload(file, OFX_EXTENSIONS, OFX_FORMAT_ERROR)
+
     # Verify account ownership
     account = db.query(Account).filter(
         Account.id == account_id,
@@ -480,15 +655,13 @@ async def detect_ofx_duplicates(
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        ofx_service = OFXService()
-        parsed = ofx_service.parse_ofx(contents)
+        parsed = await asyncio.to_thread(service.parse_ofx_upload, current_user.id, contents)
         transactions = parsed['transactions']
 
         # Find duplicates
-        service = ImportService(db)
         duplicates = service.duplicate_detector.find_duplicates(
             current_user.id,
             account_id,
@@ -511,13 +684,16 @@ async def detect_ofx_duplicates(
 async def execute_csv_import(
     file: UploadFile = File(...),
     account_id: int = Form(...),
-    column_mapping: str = Form(...),  # JSON string
+    column_map: CSVColumnMapping = Depends(get_column_mapping),
     skip_rows: str = Form(default="[]"),  # JSON array of row numbers to skip
     payee_name_overrides: str = Form(default="{}"),  # JSON object of suggested_name -> final_name
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Execute CSV import after user confirmation"""
+    validate_upload(file, CSV_EXTENSIONS, CSV_FORMAT_ERROR)
+
     # Verify account ownership
     account = db.query(Account).filter(
         Account.id == account_id,
@@ -526,17 +702,19 @@ async def execute_csv_import(
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    contents = await file.read()
-
     try:
         # Parse parameters
-        mapping_dict = json.loads(column_mapping)
-        column_map = CSVColumnMapping(**mapping_dict)
-        skip_row_list = json.loads(skip_rows)
-        payee_overrides = json.loads(payee_name_overrides)
-
-        service = ImportService(db)
-        df = service.parse_csv(contents)
+        skip_row_list = orjson.loads(skip_rows)
+        skip_count = len(skip_row_list)
+        skip_row_set = frozenset(skip_row_list)
+        payee_overrides = orjson.loads(payee_name_overrides)
+
+        # Parse and compress straight from the spooled upload file
+        df = await asyncio.to_thread(service.parse_csv_upload, current_user.id, file.file)
+        # Compress off the event loop
+        compressed_file, file_size = await asyncio.to_thread(
+            ImportService.compress_file, file.file
+        )
 
         # Create import record with original file data
         import_record = service.create_import_record(
@@ -545,90 +723,79 @@ async def execute_csv_import(
             filename=file.filename,
             import_type="csv",
             total_rows=len(df),
-            file_size=len(contents),
-            file_data=contents  # Store compressed original file
+            file_size=file_size,
+            compressed_file_data=compressed_file  # Store compressed original file
         )
 
         # Map and import transactions
-        mapped_transactions = service.map_csv_to_transactions(df, column_map, skip_row_list)
+        mapped_transactions = service.map_csv_to_transactions(df, column_map, skip_row_set)
 
-        imported_count = 0
         error_count = 0
+        row_errors = []  # (row, error) pairs, logged once after the loop
+        transaction_rows = []
+        row_numbers = []
+        payee_usage = Counter()  # payee_id -> new transactions
         payee_service = PayeeService(db)
         extraction_service = PayeeExtractionService(db)
         user_icon_provider = get_user_icon_provider(current_user)
 
-        for trans_data in mapped_transactions:
+        # Resolve every payee up front: one lookup query plus one batched insert,
+        # committed together with the transactions below
+        final_payee_names = [
+            extract_import_payee_name(extraction_service, trans_data, payee_overrides)
+            for trans_data in mapped_transactions
+        ]
+        payees_by_name = payee_service.get_or_create_many(
+            user_id=current_user.id,
+            canonical_names=final_payee_names,
+            icon_provider=user_icon_provider,
+            commit=False
+        )
+
+        for trans_data, final_payee_name in zip(mapped_transactions, final_payee_names):
             try:
-                # Handle payee entity creation with overrides
-                payee_id = None
-                payee_entity = None
-                description = trans_data.get('description', '')
-                payee = trans_data.get('payee', '')
-                text_to_extract = description or payee
-
-                if text_to_extract and text_to_extract.strip():
-                    # Extract canonical name using SAME logic as analyze-all-payees
-                    extracted_name, _ = extraction_service.extract_payee_name(text_to_extract)
-
-                    # Apply user override if exists
-                    final_payee_name = payee_overrides.get(extracted_name, extracted_name)
-
-                    # Create or get payee with final name (respecting user's icon provider preference)
-                    payee_entity = payee_service.get_or_create(
-                        user_id=current_user.id,
-                        canonical_name=final_payee_name,
-                        icon_provider=user_icon_provider
-                    )
-                    payee_id = payee_entity.id
+                payee_entity = payees_by_name.get(final_payee_name)
+                payee_id = payee_entity.id if payee_entity else None
 
                 # Get category from payee's default_category if available
                 category_id = None
                 if payee_entity and payee_entity.default_category_id:
                     category_id = payee_entity.default_category_id
 
-                # Create transaction
-                transaction = Transaction(
+                # Queue transaction
+                transaction_rows.append(service.build_transaction_row(
                     user_id=current_user.id,
                     account_id=account_id,
-                    amount=trans_data['amount'],
-                    type=TransactionType[trans_data['type']],
-                    date=trans_data['date'],
-                    description=trans_data.get('description'),
-                    payee=trans_data.get('payee'),
+                    trans_data=trans_data,
                     payee_id=payee_id,
-                    category_id=category_id,
-                    notes=trans_data.get('notes'),
-                )
-                db.add(transaction)
-                db.flush()  # Get transaction ID
+                    category_id=category_id
+                ))
+                row_numbers.append(trans_data.get('row'))
 
-                # Increment payee usage
                 if payee_id:
-                    payee_service.increment_usage(payee_id)
-
-                # Link to import
-                imported_txn = ImportedTransaction(
-                    import_id=import_record.id,
-                    transaction_id=transaction.id,
-                    row_number=trans_data.get('row')
-                )
-                db.add(imported_txn)
-                imported_count += 1
+                    payee_usage[payee_id] += 1
 
             except Exception as e:
                 error_count += 1
-                print(f"Error importing transaction: {e}")
+                row_errors.append((trans_data.get('row'), str(e)))
+
+        # Insert all transactions and import links in bulk, then update payee usage once per payee
+        service.bulk_insert_transactions(import_record.id, transaction_rows, row_numbers)
+        imported_count = len(transaction_rows)
+        payee_service.increment_usage_bulk(payee_usage)
 
         # Commit all transactions
         db.commit()
+        invalidate_report_cache(current_user.id)
+        invalidate_analysis_cache(current_user.id)
 
         # Update import record
         service.complete_import_record(
             import_id=import_record.id,
             imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
-            error_count=error_count
+            duplicate_count=skip_count,
+            error_count=error_count,
+            error_message=report_row_errors("csv", row_errors)
         )
 
         return ImportExecuteResponse(
@@ -636,7 +803,7 @@ async def execute_csv_import(
             status=ImportStatus.COMPLETED,
             total_rows=len(df),
             imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
+            duplicate_count=skip_count,
             error_count=error_count,
             message=f"Successfully imported {imported_count} transactions"
         )
@@ -655,10 +822,13 @@ async def execute_ofx_import(
     account_id: int = Form(...),
     skip_rows: str = Form(default="[]"),  # JSON array of row numbers to skip
     payee_name_overrides: str = Form(default="{}"),  # JSON object of suggested_name -> final_name
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """Execute OFX/QFX import after user confirmation"""
+    validate_upload(file, OFX_EXTENSIONS, OFX_FORMAT_ERROR)
+
     # Verify account ownership
     account = db.query(Account).filter(
         Account.id == account_id,
@@ -667,17 +837,19 @@ async def execute_ofx_import(
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        skip_row_list = json.loads(skip_rows)
-        payee_overrides = json.loads(payee_name_overrides)
+        skip_row_list = orjson.loads(skip_rows)
+        skip_count = len(skip_row_list)
+        skip_row_set = frozenset(skip_row_list)
+        payee_overrides = orjson.loads(payee_name_overrides)
 
-        ofx_service = OFXService()
-        parsed = ofx_service.parse_ofx(contents)
+        parsed = await asyncio.to_thread(service.parse_ofx_upload, current_user.id, contents)
         transactions = parsed['transactions']
 
-        service = ImportService(db)
+        # Compress off the event loop
+        compressed_file = await asyncio.to_thread(ImportService.compress_bytes, contents)
 
         # Create import record with original file data
         import_type = "qfx" if file.filename.endswith('.qfx') else "ofx"
@@ -688,89 +860,96 @@ async def execute_ofx_import(
             import_type=import_type,
             total_rows=len(transactions),
             file_size=len(contents),
-            file_data=contents  # Store compressed original file
+            compressed_file_data=compressed_file  # Store compressed original file
         )
 
-        imported_count = 0
         error_count = 0
+        row_errors = []  # (row, error) pairs, logged once after the loop
+        transaction_rows = []
+        row_numbers = []
+        payee_usage = Counter()  # payee_id -> new transactions
         payee_service = PayeeService(db)
         extraction_service = PayeeExtractionService(db)
         user_icon_provider = get_user_icon_provider(current_user)
 
+        # Prefetch FITIDs already in this account (one IN query)
+        existing_fitids = service.duplicate_detector.get_existing_fitids(
+            current_user.id,
+            account_id,
+            (t.get('fitid') for t in transactions)
+        )
+        fitid_duplicate_count = 0
+
+        # Rows that will actually be imported
+        import_indexes = []
         for idx, trans_data in enumerate(transactions):
-            if idx in skip_row_list:
+            if idx in skip_row_set:
+                continue
+
+            if trans_data.get('fitid') in existing_fitids:
+                fitid_duplicate_count += 1
                 continue
 
+            import_indexes.append(idx)
+
+        # Resolve every payee up front: one lookup query plus one batched insert,
+        # committed together with the transactions below
+        final_payee_names = {
+            idx: extract_import_payee_name(extraction_service, transactions[idx], payee_overrides)
+            for idx in import_indexes
+        }
+        payees_by_name = payee_service.get_or_create_many(
+            user_id=current_user.id,
+            canonical_names=final_payee_names.values(),
+            icon_provider=user_icon_provider,
+            commit=False
+        )
+
+        for idx in import_indexes:
+            trans_data = transactions[idx]
             try:
-                # Handle payee entity creation with overrides
-                payee_id = None
-                payee_entity = None
-                description = trans_data.get('description', '')
-                payee = trans_data.get('payee', '')
-                text_to_extract = description or payee
-
-                if text_to_extract and text_to_extract.strip():
-                    # Extract canonical name using SAME logic as analyze-all-payees
-                    extracted_name, _ = extraction_service.extract_payee_name(text_to_extract)
-
-                    # Apply user override if exists
-                    final_payee_name = payee_overrides.get(extracted_name, extracted_name)
-
-                    # Create or get payee with final name (respecting user's icon provider preference)
-                    payee_entity = payee_service.get_or_create(
-                        user_id=current_user.id,
-                        canonical_name=final_payee_name,
-                        icon_provider=user_icon_provider
-                    )
-                    payee_id = payee_entity.id
+                payee_entity = payees_by_name.get(final_payee_names[idx])
+                payee_id = payee_entity.id if payee_entity else None
 
                 # Get category from payee's default_category if available
                 category_id = None
                 if payee_entity and payee_entity.default_category_id:
                     category_id = payee_entity.default_category_id
 
-                # Create transaction
-                transaction = Transaction(
+                # Queue transaction (FITID goes in its dedicated column)
+                transaction_rows.append(service.build_transaction_row(
                     user_id=current_user.id,
                     account_id=account_id,
-                    amount=trans_data['amount'],
-                    type=TransactionType[trans_data['type']],
-                    date=trans_data['date'],
-                    description=trans_data.get('description'),
-                    payee=trans_data.get('payee'),
+                    trans_data=trans_data,
                     payee_id=payee_id,
-                    category_id=category_id,
-                    fitid=trans_data.get('fitid'),  # Store FITID in dedicated column
-                    notes=trans_data.get('notes'),
-                )
-                db.add(transaction)
-                db.flush()
+                    category_id=category_id
+                ))
+                row_numbers.append(idx)
 
-                # Increment payee usage
                 if payee_id:
-                    payee_service.increment_usage(payee_id)
-
-                # Link to import
-                imported_txn = ImportedTransaction(
-                    import_id=import_record.id,
-                    transaction_id=transaction.id,
-                    row_number=idx
-                )
-                db.add(imported_txn)
-                imported_count += 1
+                    payee_usage[payee_id] += 1
 
             except Exception as e:
                 error_count += 1
-                print(f"Error importing transaction: {e}")
+                row_errors.append((idx, str(e)))
+
+        # Insert all transactions and import links in bulk, then update payee usage once per payee
+        service.bulk_insert_transactions(import_record.id, transaction_rows, row_numbers)
+        imported_count = len(transaction_rows)
+        payee_service.increment_usage_bulk(payee_usage)
 
         db.commit()
+        invalidate_report_cache(current_user.id)
+        invalidate_analysis_cache(current_user.id)
 
         # Update import record
+        duplicate_count = skip_count + fitid_duplicate_count
         service.complete_import_record(
             import_id=import_record.id,
             imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
-            error_count=error_count
+            duplicate_count=duplicate_count,
+            error_count=error_count,
+            error_message=report_row_errors(import_type, row_errors)
         )
 
         return ImportExecuteResponse(
@@ -778,7 +957,7 @@ async def execute_ofx_import(
             status=ImportStatus.COMPLETED,
             total_rows=len(transactions),
             imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
+            duplicate_count=duplicate_count,
             error_count=error_count,
             message=f"Successfully imported {imported_count} transactions"
         )
@@ -799,19 +978,22 @@ async def get_import_history(
     limit: int = 50
 ):
     """Get user's import history"""
-    imports = db.query(ImportHistory).filter(
+    # Account names come from the same query (no per-row lookup), and the
+    # stored file blobs are left unloaded - only their presence is needed
+    rows = db.query(
+        ImportHistory,
+        Account.name,
+        ImportHistory.original_file_data.isnot(None)
+    ).outerjoin(
+        Account, Account.id == ImportHistory.account_id
+    ).options(
+        defer(ImportHistory.original_file_data)
+    ).filter(
         ImportHistory.user_id == current_user.id
     ).order_by(ImportHistory.started_at.desc()).offset(skip).limit(limit).all()
 
-    # Enrich with account names
     result = []
-    for imp in imports:
-        account_name = None
-        if imp.account_id:
-            account = db.query(Account).filter(Account.id == imp.account_id).first()
-            if account:
-                account_name = account.name
-
+    for imp, account_name, has_file_data in rows:
         result.append(ImportHistoryResponse(
             id=imp.id,
             import_type=imp.import_type,
@@ -829,7 +1011,7 @@ async def get_import_history(
             can_rollback=imp.can_rollback,
             original_file_name=imp.original_file_name,
             original_file_size=imp.original_file_size,
-            has_file_data=imp.original_file_data is not None
+            has_file_data=has_file_data
         ))
 
     return result
@@ -852,17 +1034,20 @@ async def rollback_import(
         raise HTTPException(status_code=404, detail="Import not found or cannot be rolled back")
 
     try:
-        # Delete all transactions from this import
-        deleted_count = 0
-        for imported_txn in import_record.imported_transactions:
-            if imported_txn.transaction:
-                db.delete(imported_txn.transaction)
-                deleted_count += 1
+        # Delete all transactions from this import in one statement
+        # (import links are nulled by the ON DELETE SET NULL foreign key)
+        imported_ids = db.query(ImportedTransaction.transaction_id).filter(
+            ImportedTransaction.import_id == import_record.id
+        )
+        deleted_count = db.query(Transaction).filter(
+            Transaction.id.in_(imported_ids.scalar_subquery())
+        ).delete(synchronize_session=False)
 
         import_record.status = "cancelled"
         import_record.can_rollback = False
-        import_record.completed_at = import_record.completed_at or db.func.now()
+        import_record.completed_at = import_record.completed_at or func.now()
         db.commit()
+        invalidate_report_cache(current_user.id)
 
         return {
             "message": f"Import rolled back successfully. Deleted {deleted_count} transactions.",
@@ -876,6 +1061,44 @@ async def rollback_import(
         )
 
 
+def build_pattern_overlap_matcher(existing_patterns: Iterable[str]) -> Callable[[str], bool]:
+    """
+    Build a case-insensitive check for patterns overlapping existing rule patterns.
+
+    A pattern overlaps when it contains, or is contained in, any existing
+    pattern. Both directions are answered with one C-level scan each instead
+    of looping over every existing pattern:
+    - existing inside pattern: one compiled alternation of the escaped patterns
+    - pattern inside existing: substring search in the patterns joined by a
+      separator that can't occur in them, so matches never span two patterns
+
+    Args:
+        existing_patterns: Existing rule payee patterns (empty/None ignored)
+
+    Returns:
+        Function taking a pattern and returning True if it overlaps
+    """
+    # Longest first so the alternation prefers the most specific pattern
+    patterns = sorted(
+        {p.upper() for p in existing_patterns if p},
+        key=lambda p: (-len(p), p)
+    )
+    if not patterns:
+        return lambda pattern: False
+
+    contains_existing = re.compile('|'.join(re.escape(p) for p in patterns))
+    joined_patterns = '\x00'.join(patterns)
+
+    def overlaps(pattern: str) -> bool:
+        pattern_upper = pattern.upper()
+        return (
+            pattern_upper in joined_patterns
+            or contains_existing.search(pattern_upper) is not None
+        )
+
+    return overlaps
+
+
 @router.post("/analyze-for-rules", response_model=AnalyzeImportForRulesResponse)
 async def analyze_import_for_rules(
     request: AnalyzeImportForRulesRequest,
@@ -902,35 +1125,26 @@ async def analyze_import_for_rules(
         min_confidence=request.min_confidence
     )
 
-    # Get existing user rules to filter out duplicates
-    existing_rules = db.query(CategorizationRule).filter(
-        CategorizationRule.user_id == current_user.id,
-        CategorizationRule.enabled == True
-    ).all()
+    # Filter out suggestions already covered by an existing rule. Patterns are
+    # uppercased and de-duplicated by Postgres so only distinct values come back.
+    filtered_suggestions = suggestions
+    if suggestions:
+        existing_patterns = db.query(
+            func.upper(CategorizationRule.payee_pattern)
+        ).filter(
+            CategorizationRule.user_id == current_user.id,
+            CategorizationRule.enabled == True,
+            CategorizationRule.payee_pattern.isnot(None),
+            CategorizationRule.payee_pattern != ''
+        ).distinct().all()
+        overlaps_existing = build_pattern_overlap_matcher(
+            pattern for (pattern,) in existing_patterns
+        )
 
-    # Create a set of existing patterns (case-insensitive)
-    existing_patterns = set()
-    for rule in existing_rules:
-        if rule.payee_pattern:
-            existing_patterns.add(rule.payee_pattern.upper())
-
-    # Filter out suggestions that match existing rules
-    filtered_suggestions = []
-    for s in suggestions:
-        pattern_upper = s.payee_pattern.upper()
-
-        # Check if this pattern is already covered by an existing rule
-        pattern_exists = False
-        for existing_pattern in existing_patterns:
-            # Check if patterns overlap significantly
-            if (pattern_upper in existing_pattern or
-                existing_pattern in pattern_upper or
-                pattern_upper == existing_pattern):
-                pattern_exists = True
-                break
-
-        if not pattern_exists:
-            filtered_suggestions.append(s)
+        filtered_suggestions = [
+            s for s in suggestions
+            if not overlaps_existing(s.payee_pattern)
+        ]
 
     # Convert to response format
     suggestion_responses = [
@@ -1004,6 +1218,10 @@ async def analyze_payees(
     )
 
 
+# Chunk size for streaming stored import files back to the client
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
 @router.get("/{import_id}/download")
 async def download_import_file(
     import_id: int,
@@ -1030,16 +1248,25 @@ async def download_import_file(
             detail="Original file not available for this import"
         )
 
-    # Decompress the file data
-    file_data = import_record.original_file_data
+    # Stream the file, decompressing chunk by chunk so the whole decompressed
+    # file is never held in memory
+    file_obj = BytesIO(import_record.original_file_data)
     if import_record.is_compressed:
-        try:
-            file_data = gzip.decompress(file_data)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to decompress file: {str(e)}"
-            )
+        file_obj = igzip.GzipFile(fileobj=file_obj, mode='rb')
+
+    try:
+        # Read the first chunk now so a corrupt file still fails with a 500
+        first_chunk = file_obj.read(DOWNLOAD_CHUNK_SIZE)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to decompress file: {str(e)}"
+        )
+
+    def iter_file():
+        yield first_chunk
+        with file_obj:
+            yield from iter(lambda: file_obj.read(DOWNLOAD_CHUNK_SIZE), b'')
 
     # Determine media type based on file type
     media_type_map = {
@@ -1051,12 +1278,16 @@ async def download_import_file(
 
     # Return file with appropriate headers
     filename = import_record.original_file_name or import_record.filename
-    return Response(
-        content=file_data,
+    headers = {
+        'Content-Disposition': f'attachment; filename="{filename}"'
+    }
+    if not import_record.is_compressed:
+        headers['Content-Length'] = str(len(import_record.original_file_data))
+
+    return StreamingResponse(
+        iter_file(),
         media_type=media_type,
-        headers={
-            'Content-Disposition': f'attachment; filename="{filename}"'
-        }
+        headers=headers
     )
 
 
@@ -1064,10 +1295,455 @@ async def download_import_file(
 # INTELLIGENT PAYEE MATCHING ENDPOINTS
 # ============================================================================
 
+# Intelligent analysis results keyed by (user_id, payee generation, file
+# digest, column mapping). Re-submitting the same file skips parsing and fuzzy
+# matching entirely; any payee or pattern write bumps the generation (shared
+# by all workers), so an analysis never refers to payees that have since been
+# renamed or deleted. Results are only cached while the generation is known.
+ANALYSIS_CACHE_SIZE = 64
+ANALYSIS_CACHE_TTL_SECONDS = 600
+_analysis_cache = TTLCache(maxsize=ANALYSIS_CACHE_SIZE, ttl=ANALYSIS_CACHE_TTL_SECONDS)
+_analysis_cache_lock = threading.Lock()
+
+
+def _analysis_cache_key(
+    user_id: int,
+    contents: bytes,
+    mapping: Optional[CSVColumnMapping] = None
+) -> Tuple[int, Optional[int], str, Optional[str]]:
+    """
+    Build the analysis cache key for an uploaded file.
+
+    Args:
+        user_id: User running the analysis
+        contents: Raw uploaded file
+        mapping: CSV column mapping (None for OFX/QFX)
+
+    Returns:
+        Tuple of (user_id, payee generation, content digest, serialized
+        mapping); the generation is None if the shared cache is unavailable
+    """
+    digest = hashlib.blake2b(contents, digest_size=16).hexdigest()
+    mapping_key = mapping.model_dump_json() if mapping else None
+    return user_id, payee_generation(user_id), digest, mapping_key
+
+
+def invalidate_analysis_cache(user_id: int) -> None:
+    """
+    Drop cached analyses for a user.
+
+    Called after an import creates payees/patterns, since those change the
+    matches a fresh analysis would produce. Bumping the payee generation
+    also invalidates the analyses cached by other workers.
+    """
+    bump_payee_generation(user_id)
+    with _analysis_cache_lock:
+        for key in [k for k in _analysis_cache if k[0] == user_id]:
+            _analysis_cache.pop(key, None)
+
+
+def _run_cached_intelligent_analysis(
+    db: Session,
+    user: User,
+    contents: bytes,
+    parse_transactions: Callable[[bytes], List[dict]],
+    mapping: Optional[CSVColumnMapping] = None
+) -> Tuple[List[TransactionPayeeAnalysisSchema], IntelligentAnalysisSummarySchema]:
+    """
+    Run intelligent analysis, serving repeat uploads from the analysis cache.
+
+    Args:
+        db: Database session
+        user: User running the analysis
+        contents: Raw uploaded file
+        parse_transactions: Callable turning contents into parsed transactions
+            (only invoked on a cache miss)
+        mapping: CSV column mapping (None for OFX/QFX)
+
+    Returns:
+        Tuple of (analysis_schemas, summary)
+    """
+    key = _analysis_cache_key(user.id, contents, mapping)
+    if key[1] is None:
+        return _run_intelligent_analysis(db, user, parse_transactions(contents))
+
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = _run_intelligent_analysis(db, user, parse_transactions(contents))
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+    return result
+
+
+def _run_intelligent_analysis(
+    db: Session,
+    user: User,
+    parsed_transactions: List[dict]
+) -> Tuple[List[TransactionPayeeAnalysisSchema], IntelligentAnalysisSummarySchema]:
+    """
+    Run intelligent payee matching over parsed transactions.
+
+    Shared by the CSV and OFX analyze endpoints.
+
+    Args:
+        db: Database session
+        user: User running the analysis
+        parsed_transactions: Transactions from the CSV/OFX mapper
+
+    Returns:
+        Tuple of (analysis_schemas, summary)
+    """
+    matching_service = IntelligentPayeeMatchingService(db)
+    analyses = matching_service.analyze_transactions_for_import(
+        user_id=user.id,
+        transactions=parsed_transactions
+    )
+
+    # Convert to Pydantic schemas
+    analysis_schemas = [
+        TransactionPayeeAnalysisSchema(
+            transaction_index=a.transaction_index,
+            original_description=a.original_description,
+            extracted_payee_name=a.extracted_payee_name,
+            extraction_confidence=a.extraction_confidence,
+            match_type=a.match_type,
+            matched_payee_id=a.matched_payee_id,
+            matched_payee_name=a.matched_payee_name,
+            match_confidence=a.match_confidence,
+            match_reason=a.match_reason,
+            suggested_category=a.suggested_category,
+            alternative_matches=[
+                AlternativeMatchSchema(
+                    payee_id=alt.payee_id,
+                    payee_name=alt.payee_name,
+                    confidence=alt.confidence
+                )
+                for alt in a.alternative_matches
+            ]
+        )
+        for a in analyses
+    ]
+
+    # Generate summary
+    match_type_counts = Counter(a.match_type for a in analyses)
+    high_confidence_count = match_type_counts.get('HIGH_CONFIDENCE', 0)
+    low_confidence_count = match_type_counts.get('LOW_CONFIDENCE', 0)
+    no_match_count = match_type_counts.get('NO_MATCH', 0)
+
+    # Count which existing payees were matched
+    payee_match_counts = {}
+    for a in analyses:
+        if a.matched_payee_id:
+            if a.matched_payee_id not in payee_match_counts:
+                payee_match_counts[a.matched_payee_id] = {
+                    'payee_id': a.matched_payee_id,
+                    'name': a.matched_payee_name,
+                    'count': 0
+                }
+            payee_match_counts[a.matched_payee_id]['count'] += 1
+
+    summary = IntelligentAnalysisSummarySchema(
+        high_confidence_matches=high_confidence_count,
+        low_confidence_matches=low_confidence_count,
+        new_payees_needed=no_match_count,
+        total_transactions=len(analyses),
+        existing_payees_matched=list(payee_match_counts.values())
+    )
+
+    return analysis_schemas, summary
+
+
+def _execute_import_with_decisions(
+    db: Session,
+    import_service: ImportService,
+    user: User,
+    parsed_transactions: List[dict],
+    request: ImportWithPayeeDecisionsRequest,
+    import_type: str,
+    contents: bytes,
+    filename: str,
+    compressed_file: Optional[bytes] = None
+) -> ImportExecuteResponse:
+    """
+    Import parsed transactions using the user's payee decisions.
+
+    Shared by the CSV and OFX execute endpoints.
+
+    Flow:
+    1. Create any new payees based on user's decisions
+    2. Create initial patterns for new payees (learning)
+    3. Import transactions with assigned payee_ids
+    4. Strengthen patterns for accepted matches
+
+    Args:
+        db: Database session
+        import_service: The request's ImportService (bound to ``db``)
+        user: User running the import
+        parsed_transactions: Transactions from the CSV/OFX mapper
+        request: Account, skip rows and payee decisions from the UI
+        import_type: "csv", "ofx" or "qfx"
+        contents: Raw uploaded file (stored on the import record)
+        filename: Original upload filename
+        compressed_file: contents already gzipped by the caller (compressed
+            here when omitted)
+
+    Returns:
+        ImportExecuteResponse for the completed import
+    """
+    # Verify account belongs to user
+    account = db.query(Account).filter(
+        Account.id == request.account_id,
+        Account.user_id == user.id
+    ).first()
+
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[%s Execute] payee_assignments=%d, parsed_transactions=%d",
+            import_type.upper(), len(request.payee_assignments), len(parsed_transactions)
+        )
+
+    # Services
+    payee_service = PayeeService(db)
+    matching_service = IntelligentPayeeMatchingService(db)
+    extraction_service = matching_service.extraction_service
+    user_icon_provider = get_user_icon_provider(user)
+
+    # Steps 1-2 only flush their payees and patterns; they are committed
+    # together with the import record instead of once per decision
+    # Step 1: Create new payees and patterns
+    new_payees = {}  # Map transaction_index -> payee_id
+    user_categories = load_user_categories(db, user.id)
+    for decision in request.payee_assignments:
+        if decision.new_payee_name:
+            # Look up category ID by name with flexible matching
+            default_category_id = match_category_name(
+                user_categories, decision.new_payee_category
+            )
+
+            # User wants to create new payee (respecting user's icon provider preference)
+            payee = payee_service.get_or_create(
+                user_id=user.id,
+                canonical_name=decision.new_payee_name,
+                default_category_id=default_category_id,
+                icon_provider=user_icon_provider,
+                commit=False
+            )
+            new_payees[decision.transaction_index] = payee.id
+
+            # Create initial pattern if requested
+            if decision.create_pattern:
+                matching_service.create_pattern_from_match(
+                    user_id=user.id,
+                    payee_id=payee.id,
+                    description=decision.original_description,
+                    pattern_type='description_contains',
+                    source='import_learning',
+                    commit=False
+                )
+
+    # Step 2: Build payee override map for import
+    skip_rows = set(request.skip_rows or [])
+
+    # Index decisions once; the first decision for a row wins
+    decisions_by_index = {}
+    for decision in request.payee_assignments:
+        decisions_by_index.setdefault(decision.transaction_index, decision)
+
+    # Load the payees the user picked or just created (for their default
+    # categories) in one query. A picked payee may have been deleted or merged
+    # since the analysis, or may not be the user's; those rows fall back to
+    # extraction instead of failing the insert on the payee foreign key.
+    wanted_payee_ids = set(new_payees.values())
+    wanted_payee_ids.update(d.payee_id for d in decisions_by_index.values() if d.payee_id)
+    decided_payees = {}
+    if wanted_payee_ids:
+        decided_payees = {
+            payee.id: payee
+            for payee in db.query(PayeeModel).filter(
+                PayeeModel.id.in_(wanted_payee_ids),
+                PayeeModel.user_id == user.id
+            )
+        }
+
+    payee_overrides = {}  # Map transaction_index -> final_payee_id
+    for idx in range(len(parsed_transactions)):
+        if idx in skip_rows:
+            continue
+
+        decision = decisions_by_index.get(idx)
+        if decision:
+            # Use user's decision
+            if decision.payee_id:
+                if decision.payee_id not in decided_payees:
+                    logger.warning(
+                        "[%s Execute] Payee %s for row %d no longer exists; using extracted payee",
+                        import_type.upper(), decision.payee_id, idx
+                    )
+                    continue
+
+                # User selected existing payee
+                payee_overrides[idx] = decision.payee_id
+
+                # Strengthen pattern if requested
+                if decision.create_pattern:
+                    matching_service.create_pattern_from_match(
+                        user_id=user.id,
+                        payee_id=decision.payee_id,
+                        description=decision.original_description,
+                        pattern_type='description_contains',
+                        source='import_learning',
+                        commit=False
+                    )
+            elif idx in new_payees:
+                # New payee was created
+                payee_overrides[idx] = new_payees[idx]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[%s Execute] Resolved %d payee overrides",
+            import_type.upper(), len(payee_overrides)
+        )
+
+    # Step 3: Execute import - create transactions directly
+    import_record = import_service.create_import_record(
+        user_id=user.id,
+        account_id=request.account_id,
+        filename=filename,
+        import_type=import_type,
+        total_rows=len(parsed_transactions),
+        file_size=len(contents),
+        file_data=contents,
+        compressed_file_data=compressed_file
+    )
+
+    error_count = 0
+    row_errors = []  # (row, error) pairs, logged once after the loop
+    transaction_rows = []
+    row_numbers = []
+    payee_usage = Counter()  # payee_id -> new transactions
+
+    # CSV payee text comes from the linked Payee entity; OFX keeps the raw NAME
+    include_payee_text = import_type != "csv"
+
+    # Validate all amounts in one vectorized pass (NaN, inf, None)
+    valid_amounts = import_service.finite_amount_mask(parsed_transactions)
+
+    # Prefetch FITIDs already in this account (one IN query, no-op for CSV)
+    existing_fitids = import_service.duplicate_detector.get_existing_fitids(
+        user.id,
+        request.account_id,
+        (t.get('fitid') for t in parsed_transactions)
+    )
+    fitid_duplicate_count = 0
+
+    # Rows that will actually be imported
+    import_indexes = []
+    for idx, trans_data in enumerate(parsed_transactions):
+        if idx in skip_rows:
+            continue
+
+        if trans_data.get('fitid') in existing_fitids:
+            fitid_duplicate_count += 1
+            continue
+
+        # Skip transactions with invalid amounts (NaN, None, etc.)
+        if not valid_amounts[idx]:
+            error_count += 1
+            continue
+
+        import_indexes.append(idx)
+
+    # Rows without a decision fall back to extraction; resolve those payees in bulk
+    fallback_names = {
+        idx: extract_import_payee_name(extraction_service, parsed_transactions[idx])
+        for idx in import_indexes
+        if idx not in payee_overrides
+    }
+    fallback_payees = payee_service.get_or_create_many(
+        user_id=user.id,
+        canonical_names=fallback_names.values(),
+        icon_provider=user_icon_provider,
+        commit=False
+    )
+
+    for idx in import_indexes:
+        trans_data = parsed_transactions[idx]
+        try:
+            # Determine payee_id from user decisions
+            payee_id = payee_overrides.get(idx)
+
+            if payee_id is None:
+                # No decision was made - use the extracted payee
+                payee_entity = fallback_payees.get(fallback_names[idx])
+                payee_id = payee_entity.id if payee_entity else None
+            else:
+                payee_entity = decided_payees.get(payee_id)
+
+            # Get category from payee's default_category if available
+            category_id = None
+            if payee_entity and payee_entity.default_category_id:
+                category_id = payee_entity.default_category_id
+
+            # Queue transaction
+            transaction_rows.append(import_service.build_transaction_row(
+                user_id=user.id,
+                account_id=request.account_id,
+                trans_data=trans_data,
+                payee_id=payee_id,
+                category_id=category_id,
+                include_payee_text=include_payee_text
+            ))
+            row_numbers.append(idx)
+
+            if payee_id:
+                payee_usage[payee_id] += 1
+
+        except Exception as e:
+            error_count += 1
+            row_errors.append((idx, str(e)))
+
+    # Insert all transactions and import links in bulk, then update payee usage once per payee
+    import_service.bulk_insert_transactions(import_record.id, transaction_rows, row_numbers)
+    imported_count = len(transaction_rows)
+    payee_service.increment_usage_bulk(payee_usage)
+    db.commit()
+    invalidate_report_cache(user.id)
+
+    # New payees/patterns change what the next analysis would return
+    invalidate_analysis_cache(user.id)
+
+    # Update import record
+    duplicate_count = len(skip_rows) + fitid_duplicate_count
+    import_service.complete_import_record(
+        import_id=import_record.id,
+        imported_count=imported_count,
+        duplicate_count=duplicate_count,
+        error_count=error_count,
+        error_message=report_row_errors(import_type, row_errors)
+    )
+
+    return ImportExecuteResponse(
+        import_id=import_record.id,
+        status=ImportStatus.COMPLETED,
+        total_rows=len(parsed_transactions),
+        imported_count=imported_count,
+        duplicate_count=duplicate_count,
+        error_count=error_count,
+        message=f"Successfully imported {imported_count} transactions"
+    )
+
+
 @router.post("/csv/analyze-payees-intelligent", response_model=IntelligentPayeeAnalysisResponse)
 async def analyze_csv_payees_intelligent(
     file: UploadFile = File(...),
-    column_mapping: str = Form(...),
+    mapping: CSVColumnMapping = Depends(get_column_mapping),
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -1081,76 +1757,20 @@ async def analyze_csv_payees_intelligent(
 
     Returns analysis with HIGH/LOW/NO_MATCH classifications for UI display.
     """
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be CSV format")
+    validate_upload(file, CSV_EXTENSIONS, CSV_FORMAT_ERROR)
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        # Parse column mapping
-        mapping_dict = json.loads(column_mapping)
-        mapping = CSVColumnMapping(**mapping_dict)
-
-        # Parse CSV and map to transactions
-        service = ImportService(db)
-        df = service.parse_csv(contents)
-        parsed_transactions = service.map_csv_to_transactions(df, mapping, [])
-
-        # Run intelligent analysis
-        matching_service = IntelligentPayeeMatchingService(db)
-        analyses = matching_service.analyze_transactions_for_import(
-            user_id=current_user.id,
-            transactions=parsed_transactions
-        )
-
-        # Convert to Pydantic schemas
-        analysis_schemas = [
-            TransactionPayeeAnalysisSchema(
-                transaction_index=a.transaction_index,
-                original_description=a.original_description,
-                extracted_payee_name=a.extracted_payee_name,
-                extraction_confidence=a.extraction_confidence,
-                match_type=a.match_type,
-                matched_payee_id=a.matched_payee_id,
-                matched_payee_name=a.matched_payee_name,
-                match_confidence=a.match_confidence,
-                match_reason=a.match_reason,
-                suggested_category=a.suggested_category,
-                alternative_matches=[
-                    AlternativeMatchSchema(
-                        payee_id=alt.payee_id,
-                        payee_name=alt.payee_name,
-                        confidence=alt.confidence
-                    )
-                    for alt in a.alternative_matches
-                ]
-            )
-            for a in analyses
-        ]
-
-        # Generate summary
-        high_confidence_count = len([a for a in analyses if a.match_type == 'HIGH_CONFIDENCE'])
-        low_confidence_count = len([a for a in analyses if a.match_type == 'LOW_CONFIDENCE'])
-        no_match_count = len([a for a in analyses if a.match_type == 'NO_MATCH'])
-
-        # Count which existing payees were matched
-        payee_match_counts = {}
-        for a in analyses:
-            if a.matched_payee_id:
-                if a.matched_payee_id not in payee_match_counts:
-                    payee_match_counts[a.matched_payee_id] = {
-                        'payee_id': a.matched_payee_id,
-                        'name': a.matched_payee_name,
-                        'count': 0
-                    }
-                payee_match_counts[a.matched_payee_id]['count'] += 1
-
-        summary = IntelligentAnalysisSummarySchema(
-            high_confidence_matches=high_confidence_count,
-            low_confidence_matches=low_confidence_count,
-            new_payees_needed=no_match_count,
-            total_transactions=len(analyses),
-            existing_payees_matched=list(payee_match_counts.values())
+        def parse_transactions(data: bytes) -> List[dict]:
+            # Parse CSV and map to transactions
+            df = service.parse_csv_upload(current_user.id, BytesIO(data))
+            return service.map_csv_to_transactions(df, mapping, [])
+
+        # Parsing, fuzzy matching and the payee queries run off the event loop
+        analysis_schemas, summary = await asyncio.to_thread(
+            _run_cached_intelligent_analysis,
+            db, current_user, contents, parse_transactions, mapping
         )
 
         return IntelligentPayeeAnalysisResponse(
@@ -1183,71 +1803,21 @@ async def analyze_ofx_payees_intelligent(
 
     Returns analysis with HIGH/LOW/NO_MATCH classifications for UI display.
     """
-    if not (file.filename.endswith('.ofx') or file.filename.endswith('.qfx')):
-        raise HTTPException(status_code=400, detail="File must be OFX or QFX format")
+    validate_upload(file, OFX_EXTENSIONS, OFX_FORMAT_ERROR)
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        # Parse OFX transactions
-        parsed_ofx = OFXService.parse_ofx(contents)
-        parsed_transactions = OFXService.map_ofx_to_transactions(parsed_ofx)
-
-        # Run intelligent analysis
-        matching_service = IntelligentPayeeMatchingService(db)
-        analyses = matching_service.analyze_transactions_for_import(
-            user_id=current_user.id,
-            transactions=parsed_transactions
-        )
-
-        # Convert to Pydantic schemas
-        analysis_schemas = [
-            TransactionPayeeAnalysisSchema(
-                transaction_index=a.transaction_index,
-                original_description=a.original_description,
-                extracted_payee_name=a.extracted_payee_name,
-                extraction_confidence=a.extraction_confidence,
-                match_type=a.match_type,
-                matched_payee_id=a.matched_payee_id,
-                matched_payee_name=a.matched_payee_name,
-                match_confidence=a.match_confidence,
-                match_reason=a.match_reason,
-                suggested_category=a.suggested_category,
-                alternative_matches=[
-                    AlternativeMatchSchema(
-                        payee_id=alt.payee_id,
-                        payee_name=alt.payee_name,
-                        confidence=alt.confidence
-                    )
-                    for alt in a.alternative_matches
-                ]
+        def parse_transactions(data: bytes) -> List[dict]:
+            # Parse OFX transactions
+            return OFXService.map_ofx_to_transactions(
+                ImportService.parse_ofx_upload(current_user.id, data)
             )
-            for a in analyses
-        ]
 
-        # Generate summary
-        high_confidence_count = len([a for a in analyses if a.match_type == 'HIGH_CONFIDENCE'])
-        low_confidence_count = len([a for a in analyses if a.match_type == 'LOW_CONFIDENCE'])
-        no_match_count = len([a for a in analyses if a.match_type == 'NO_MATCH'])
-
-        # Count which existing payees were matched
-        payee_match_counts = {}
-        for a in analyses:
-            if a.matched_payee_id:
-                if a.matched_payee_id not in payee_match_counts:
-                    payee_match_counts[a.matched_payee_id] = {
-                        'payee_id': a.matched_payee_id,
-                        'name': a.matched_payee_name,
-                        'count': 0
-                    }
-                payee_match_counts[a.matched_payee_id]['count'] += 1
-
-        summary = IntelligentAnalysisSummarySchema(
-            high_confidence_matches=high_confidence_count,
-            low_confidence_matches=low_confidence_count,
-            new_payees_needed=no_match_count,
-            total_transactions=len(analyses),
-            existing_payees_matched=list(payee_match_counts.values())
+        # Parsing, fuzzy matching and the payee queries run off the event loop
+        analysis_schemas, summary = await asyncio.to_thread(
+            _run_cached_intelligent_analysis,
+            db, current_user, contents, parse_transactions
         )
 
         return IntelligentPayeeAnalysisResponse(
@@ -1267,8 +1837,9 @@ async def analyze_ofx_payees_intelligent(
 @router.post("/csv/execute-with-payee-decisions", response_model=ImportExecuteResponse)
 async def execute_csv_import_with_decisions(
     file: UploadFile = File(...),
-    column_mapping: str = Form(...),
-    request_data: str = Form(...),
+    mapping: CSVColumnMapping = Depends(get_column_mapping),
+    request: ImportWithPayeeDecisionsRequest = Depends(get_payee_decisions_request),
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -1281,222 +1852,28 @@ async def execute_csv_import_with_decisions(
     3. Import transactions with assigned payee_ids
     4. Strengthen patterns for accepted matches
     """
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be CSV format")
+    validate_upload(file, CSV_EXTENSIONS, CSV_FORMAT_ERROR)
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        # Parse inputs
-        mapping_dict = json.loads(column_mapping)
-        mapping = CSVColumnMapping(**mapping_dict)
-        request_dict = json.loads(request_data)
-        request = ImportWithPayeeDecisionsRequest(**request_dict)
-
-        # Verify account belongs to user
-        account = db.query(Account).filter(
-            Account.id == request.account_id,
-            Account.user_id == current_user.id
-        ).first()
-
-        if not account:
-            raise HTTPException(status_code=404, detail="Account not found")
-
         # Parse CSV and map to transactions
-        import_service = ImportService(db)
-        df = import_service.parse_csv(contents)
-        parsed_transactions = import_service.map_csv_to_transactions(df, mapping, [])
-
-        # Debug logging
-        print(f"[CSV Execute] Total payee_assignments: {len(request.payee_assignments)}")
-        print(f"[CSV Execute] Total parsed_transactions: {len(parsed_transactions)}")
-        for i, d in enumerate(request.payee_assignments[:5]):  # First 5
-            print(f"[CSV Execute] Assignment {i}: idx={d.transaction_index}, payee_id={d.payee_id}, new_name={d.new_payee_name}, category={d.new_payee_category}")
-
-        # Services
-        payee_service = PayeeService(db)
-        matching_service = IntelligentPayeeMatchingService(db)
-        user_icon_provider = get_user_icon_provider(current_user)
-
-        # Step 1: Create new payees and patterns
-        new_payees = {}  # Map transaction_index -> payee_id
-        new_payee_categories = {}  # Map transaction_index -> category_id
-        for decision in request.payee_assignments:
-            if decision.new_payee_name:
-                # Look up category ID by name with flexible matching
-                default_category_id = find_category_by_name(
-                    db, current_user.id, decision.new_payee_category
-                )
-
-                # User wants to create new payee (respecting user's icon provider preference)
-                payee = payee_service.get_or_create(
-                    user_id=current_user.id,
-                    canonical_name=decision.new_payee_name,
-                    default_category_id=default_category_id,
-                    icon_provider=user_icon_provider
-                )
-                new_payees[decision.transaction_index] = payee.id
-                if default_category_id:
-                    new_payee_categories[decision.transaction_index] = default_category_id
-
-                # Create initial pattern if requested
-                if decision.create_pattern:
-                    matching_service.create_pattern_from_match(
-                        user_id=current_user.id,
-                        payee_id=payee.id,
-                        description=decision.original_description,
-                        pattern_type='description_contains',
-                        source='import_learning'
-                    )
-
-        # Step 2: Build payee override map for import
-        payee_overrides = {}  # Map transaction_index -> final_payee_id
-        print(f"[CSV Execute] Step 2 - new_payees keys: {list(new_payees.keys())}")
-        for idx, txn in enumerate(parsed_transactions):
-            if idx in request.skip_rows:
-                continue
-
-            # Find decision for this transaction
-            decision = next(
-                (d for d in request.payee_assignments if d.transaction_index == idx),
-                None
-            )
-
-            if decision:
-                # Use user's decision
-                if decision.payee_id:
-                    # User selected existing payee
-                    payee_overrides[str(idx)] = decision.payee_id
-                    print(f"[CSV Execute] Override idx={idx}: existing payee_id={decision.payee_id}")
-
-                    # Strengthen pattern if requested
-                    if decision.create_pattern:
-                        matching_service.create_pattern_from_match(
-                            user_id=current_user.id,
-                            payee_id=decision.payee_id,
-                            description=decision.original_description,
-                            pattern_type='description_contains',
-                            source='import_learning'
-                        )
-                elif idx in new_payees:
-                    # New payee was created
-                    payee_overrides[str(idx)] = new_payees[idx]
-                    print(f"[CSV Execute] Override idx={idx}: new payee_id={new_payees[idx]}")
-            else:
-                print(f"[CSV Execute] No decision found for idx={idx}")
+        df = await asyncio.to_thread(service.parse_csv_upload, current_user.id, BytesIO(contents))
+        parsed_transactions = service.map_csv_to_transactions(df, mapping, [])
 
-        print(f"[CSV Execute] Final payee_overrides: {payee_overrides}")
+        # Compress off the event loop
+        compressed_file = await asyncio.to_thread(ImportService.compress_bytes, contents)
 
-        # Step 3: Execute import - create transactions directly
-        # Create import record
-        import_record = import_service.create_import_record(
-            user_id=current_user.id,
-            account_id=request.account_id,
-            filename=file.filename,
+        return _execute_import_with_decisions(
+            db=db,
+            import_service=service,
+            user=current_user,
+            parsed_transactions=parsed_transactions,
+            request=request,
             import_type="csv",
-            total_rows=len(parsed_transactions),
-            file_size=len(contents),
-            file_data=contents
-        )
-
-        imported_count = 0
-        error_count = 0
-        skip_row_list = request.skip_rows or []
-
-        for idx, trans_data in enumerate(parsed_transactions):
-            if idx in skip_row_list:
-                continue
-
-            try:
-                # Skip transactions with invalid amounts (NaN, None, etc.)
-                import math
-                amount = trans_data.get('amount')
-                if amount is None or (isinstance(amount, float) and (math.isnan(amount) or math.isinf(amount))):
-                    error_count += 1
-                    continue
-
-                # Determine payee_id from user decisions
-                payee_id = payee_overrides.get(str(idx))
-                payee_entity = None
-
-                # If no decision was made, fall back to extraction
-                if payee_id is None:
-                    description = trans_data.get('description', '')
-                    payee = trans_data.get('payee', '')
-                    text_to_extract = description or payee
-
-                    if text_to_extract and text_to_extract.strip():
-                        extraction_service = PayeeExtractionService(db)
-                        extracted_name, _ = extraction_service.extract_payee_name(text_to_extract)
-                        if extracted_name:
-                            payee_entity = payee_service.get_or_create(
-                                user_id=current_user.id,
-                                canonical_name=extracted_name,
-                                icon_provider=user_icon_provider
-                            )
-                            payee_id = payee_entity.id
-                else:
-                    # Look up the payee entity to get its default category
-                    payee_entity = db.query(PayeeModel).filter(
-                        PayeeModel.id == payee_id,
-                        PayeeModel.user_id == current_user.id
-                    ).first()
-
-                # Get category from payee's default_category if available (CSV intelligent import)
-                category_id = None
-                if payee_entity and payee_entity.default_category_id:
-                    category_id = payee_entity.default_category_id
-
-                # Create transaction - payee name comes from linked Payee entity via API
-                transaction = Transaction(
-                    user_id=current_user.id,
-                    account_id=request.account_id,
-                    amount=amount,
-                    type=TransactionType[trans_data['type']],
-                    date=trans_data['date'],
-                    description=trans_data.get('description'),
-                    payee_id=payee_id,
-                    category_id=category_id,
-                    notes=trans_data.get('notes'),
-                )
-                db.add(transaction)
-                db.flush()
-
-                # Increment payee usage
-                if payee_id:
-                    payee_service.increment_usage(payee_id)
-
-                # Link to import
-                imported_txn = ImportedTransaction(
-                    import_id=import_record.id,
-                    transaction_id=transaction.id,
-                    row_number=idx
-                )
-                db.add(imported_txn)
-                imported_count += 1
-
-            except Exception as e:
-                error_count += 1
-                print(f"Error importing CSV transaction {idx}: {e}")
-
-        db.commit()
-
-        # Update import record
-        import_service.complete_import_record(
-            import_id=import_record.id,
-            imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
-            error_count=error_count
-        )
-
-        return ImportExecuteResponse(
-            import_id=import_record.id,
-            status=ImportStatus.COMPLETED,
-            total_rows=len(parsed_transactions),
-            imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
-            error_count=error_count,
-            message=f"Successfully imported {imported_count} transactions"
+            contents=contents,
+            filename=file.filename,
+            compressed_file=compressed_file
         )
 
     except Exception as e:
@@ -1510,7 +1887,8 @@ async def execute_csv_import_with_decisions(
 @router.post("/ofx/execute-with-payee-decisions", response_model=ImportExecuteResponse)
 async def execute_ofx_import_with_decisions(
     file: UploadFile = File(...),
-    request_data: str = Form(...),
+    request: ImportWithPayeeDecisionsRequest = Depends(get_payee_decisions_request),
+    service: ImportService = Depends(get_import_service),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -1523,204 +1901,29 @@ async def execute_ofx_import_with_decisions(
     3. Import transactions with assigned payee_ids
     4. Strengthen patterns for accepted matches
     """
-    if not (file.filename.endswith('.ofx') or file.filename.endswith('.qfx')):
-        raise HTTPException(status_code=400, detail="File must be OFX or QFX format")
+    validate_upload(file, OFX_EXTENSIONS, OFX_FORMAT_ERROR)
 
-    contents = await file.read()
+    contents = await read_upload(file)
 
     try:
-        # Parse request
-        request_dict = json.loads(request_data)
-        request = ImportWithPayeeDecisionsRequest(**request_dict)
-
-        # Verify account belongs to user
-        account = db.query(Account).filter(
-            Account.id == request.account_id,
-            Account.user_id == current_user.id
-        ).first()
-
-        if not account:
-            raise HTTPException(status_code=404, detail="Account not found")
-
         # Parse OFX transactions
-        parsed_ofx = OFXService.parse_ofx(contents)
+        parsed_ofx = await asyncio.to_thread(ImportService.parse_ofx_upload, current_user.id, contents)
         parsed_transactions = OFXService.map_ofx_to_transactions(parsed_ofx)
 
-        # Services
-        payee_service = PayeeService(db)
-        matching_service = IntelligentPayeeMatchingService(db)
-        user_icon_provider = get_user_icon_provider(current_user)
-
-        # Step 1: Create new payees and patterns
-        new_payees = {}  # Map transaction_index -> payee_id
-        new_payee_categories = {}  # Map transaction_index -> category_id
-        for decision in request.payee_assignments:
-            if decision.new_payee_name:
-                # Look up category ID by name with flexible matching
-                default_category_id = find_category_by_name(
-                    db, current_user.id, decision.new_payee_category
-                )
-
-                # User wants to create new payee (respecting user's icon provider preference)
-                payee = payee_service.get_or_create(
-                    user_id=current_user.id,
-                    canonical_name=decision.new_payee_name,
-                    default_category_id=default_category_id,
-                    icon_provider=user_icon_provider
-                )
-                new_payees[decision.transaction_index] = payee.id
-                if default_category_id:
-                    new_payee_categories[decision.transaction_index] = default_category_id
-
-                # Create initial pattern if requested
-                if decision.create_pattern:
-                    matching_service.create_pattern_from_match(
-                        user_id=current_user.id,
-                        payee_id=payee.id,
-                        description=decision.original_description,
-                        pattern_type='description_contains',
-                        source='import_learning'
-                    )
-
-        # Step 2: Build payee override map for import
-        payee_overrides = {}  # Map extracted_name -> final_payee_id
-        for idx, txn in enumerate(parsed_transactions):
-            if idx in request.skip_rows:
-                continue
-
-            # Find decision for this transaction
-            decision = next(
-                (d for d in request.payee_assignments if d.transaction_index == idx),
-                None
-            )
+        # Compress off the event loop
+        compressed_file = await asyncio.to_thread(ImportService.compress_bytes, contents)
 
-            if decision:
-                # Use user's decision
-                if decision.payee_id:
-                    # User selected existing payee
-                    payee_overrides[str(idx)] = decision.payee_id
-
-                    # Strengthen pattern if requested
-                    if decision.create_pattern:
-                        matching_service.create_pattern_from_match(
-                            user_id=current_user.id,
-                            payee_id=decision.payee_id,
-                            description=decision.original_description,
-                            pattern_type='description_contains',
-                            source='import_learning'
-                        )
-                elif idx in new_payees:
-                    # New payee was created
-                    payee_overrides[str(idx)] = new_payees[idx]
-
-        # Step 3: Execute import - create transactions directly
-        import_service = ImportService(db)
-
-        # Create import record
         import_type = "qfx" if file.filename.endswith('.qfx') else "ofx"
-        import_record = import_service.create_import_record(
-            user_id=current_user.id,
-            account_id=request.account_id,
-            filename=file.filename,
+        return _execute_import_with_decisions(
+            db=db,
+            import_service=service,
+            user=current_user,
+            parsed_transactions=parsed_transactions,
+            request=request,
             import_type=import_type,
-            total_rows=len(parsed_transactions),
-            file_size=len(contents),
-            file_data=contents
-        )
-
-        imported_count = 0
-        error_count = 0
-        skip_row_list = request.skip_rows or []
-
-        for idx, trans_data in enumerate(parsed_transactions):
-            if idx in skip_row_list:
-                continue
-
-            try:
-                # Determine payee_id from user decisions
-                payee_id = payee_overrides.get(str(idx))
-                payee_entity = None
-
-                # If no decision was made, fall back to extraction
-                if payee_id is None:
-                    description = trans_data.get('description', '')
-                    payee = trans_data.get('payee', '')
-                    text_to_extract = description or payee
-
-                    if text_to_extract and text_to_extract.strip():
-                        extraction_service = PayeeExtractionService(db)
-                        extracted_name, _ = extraction_service.extract_payee_name(text_to_extract)
-                        if extracted_name:
-                            payee_entity = payee_service.get_or_create(
-                                user_id=current_user.id,
-                                canonical_name=extracted_name,
-                                icon_provider=user_icon_provider
-                            )
-                            payee_id = payee_entity.id
-                else:
-                    # Look up the payee entity to get its default category
-                    payee_entity = db.query(PayeeModel).filter(
-                        PayeeModel.id == payee_id,
-                        PayeeModel.user_id == current_user.id
-                    ).first()
-
-                # Get category from payee's default_category if available (OFX intelligent import)
-                category_id = None
-                if payee_entity and payee_entity.default_category_id:
-                    category_id = payee_entity.default_category_id
-
-                # Create transaction
-                transaction = Transaction(
-                    user_id=current_user.id,
-                    account_id=request.account_id,
-                    amount=trans_data['amount'],
-                    type=TransactionType[trans_data['type']],
-                    date=trans_data['date'],
-                    description=trans_data.get('description'),
-                    payee=trans_data.get('payee'),
-                    payee_id=payee_id,
-                    category_id=category_id,
-                    fitid=trans_data.get('fitid'),
-                    notes=trans_data.get('notes'),
-                )
-                db.add(transaction)
-                db.flush()
-
-                # Increment payee usage
-                if payee_id:
-                    payee_service.increment_usage(payee_id)
-
-                # Link to import
-                imported_txn = ImportedTransaction(
-                    import_id=import_record.id,
-                    transaction_id=transaction.id,
-                    row_number=idx
-                )
-                db.add(imported_txn)
-                imported_count += 1
-
-            except Exception as e:
-                error_count += 1
-                print(f"Error importing transaction: {e}")
-
-        db.commit()
-
-        # Update import record
-        import_service.complete_import_record(
-            import_id=import_record.id,
-            imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
-            error_count=error_count
-        )
-
-        return ImportExecuteResponse(
-            import_id=import_record.id,
-            status=ImportStatus.COMPLETED,
-            total_rows=len(parsed_transactions),
-            imported_count=imported_count,
-            duplicate_count=len(skip_row_list),
-            error_count=error_count,
-            message=f"Successfully imported {imported_count} transactions"
+            contents=contents,
+            filename=file.filename,
+            compressed_file=compressed_file
         )
 
     except Exception as e:
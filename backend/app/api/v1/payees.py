@@ -1,5 +1,9 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+import threading
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.api import deps
@@ -7,20 +11,37 @@ from app.models.user import User
 from app.schemas.payee import (
     Payee, PayeeCreate, PayeeUpdate, PayeeWithCategory,
     PayeeTransaction, PayeeStats,
-    PayeePattern, PayeePatternCreate, PayeePatternUpdate,
+    PayeePattern, PayeePatternCreate, PayeePatternUpdate, PatternType,
     PatternTestRequest, PatternTestResult,
     IconSuggestion, IconParsed
 )
-from app.services.payee_service import PayeeService
+from app.services.payee_service import PayeeService, encode_payee_cursor, payee_generation
 from app.services.payee_icon_service import payee_icon_service
 
-router = APIRouter()
+# Payee pages and the brand list are large - serialize with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# The brand list only changes on deploy; browsers revalidate via ETag after a day.
+# "private" because the endpoint requires authentication.
+BRANDS_CACHE_CONTROL = "private, max-age=86400"
+
+# Serialized autocomplete responses keyed by (user_id, payee generation,
+# upper-cased query, limit). Typing sends the same prefixes repeatedly; the
+# generation in the key drops entries as soon as the user's payees change,
+# and the short TTL bounds staleness from usage-count updates.
+AUTOCOMPLETE_CACHE_SIZE = 10_000
+AUTOCOMPLETE_CACHE_TTL_SECONDS = 30
+_autocomplete_cache = TTLCache(maxsize=AUTOCOMPLETE_CACHE_SIZE, ttl=AUTOCOMPLETE_CACHE_TTL_SECONDS)
+_autocomplete_cache_lock = threading.Lock()
+_payee_list_adapter = TypeAdapter(List[PayeeWithCategory])
 
 
 @router.get("", response_model=List[PayeeWithCategory])
 def get_payees(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    skip: int = Query(0, ge=0, deprecated=True, description="Offset pagination; use cursor instead"),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     q: Optional[str] = Query(None, description="Search query for payee name"),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
@@ -28,54 +49,42 @@ def get_payees(
     """
     Get all payees for the current user.
 
-    - **skip**: Number of records to skip (pagination)
+    - **skip**: Number of records to skip (deprecated offset pagination)
     - **limit**: Maximum number of records to return (default: 100, max: 500)
+    - **cursor**: Keyset cursor from the previous page's X-Next-Cursor header
     - **q**: Optional search query to filter by payee name
 
-    Returns payees with default_category_name included for display.
+    Returns payees with default_category_name included for display. When more
+    payees may follow, the X-Next-Cursor response header holds the cursor for
+    the next page.
     """
     service = PayeeService(db)
 
     if q:
-        # If search query provided, use search_payees
-        payees = service.search_payees(
+        # If search query provided, use search_payee_rows
+        payees = service.search_payee_rows(
             user_id=current_user.id,
             query=q,
             limit=limit
         )
     else:
         # Otherwise, get all payees with pagination
-        payees = service.get_all(
-            user_id=current_user.id,
-            skip=skip,
-            limit=limit
-        )
+        try:
+            payees = service.get_all_rows(
+                user_id=current_user.id,
+                skip=skip,
+                limit=limit,
+                cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-    # Enrich with category information
-    results = []
-    for payee in payees:
-        payee_dict = {
-            "id": payee.id,
-            "user_id": payee.user_id,
-            "canonical_name": payee.canonical_name,
-            "default_category_id": payee.default_category_id,
-            "payee_type": payee.payee_type,
-            "logo_url": payee.logo_url,
-            "notes": payee.notes,
-            "transaction_count": payee.transaction_count,
-            "last_used_at": payee.last_used_at,
-            "created_at": payee.created_at,
-            "updated_at": payee.updated_at,
-            "default_category_name": None
-        }
-
-        # Add category name if available
-        if payee.default_category:
-            payee_dict["default_category_name"] = payee.default_category.name
-
-        results.append(PayeeWithCategory(**payee_dict))
-
-    return results
+        if len(payees) == limit:
+            response.headers["X-Next-Cursor"] = encode_payee_cursor(payees[-1])
+
+    # Plain rows, validated once by response_model (from_attributes);
+    # default_category_name is a joined column
+    return payees
 
 
 @router.get("/autocomplete", response_model=List[PayeeWithCategory])
@@ -96,38 +105,30 @@ def autocomplete_payees(
 
     Includes default category information for each payee.
     """
-    service = PayeeService(db)
-    payees = service.search_payees(
-        user_id=current_user.id,
-        query=q,
-        limit=limit
-    )
+    # search_payees matches on upper-cased names, so the key does too
+    generation = payee_generation(current_user.id)
+    key = (current_user.id, generation, q.upper(), limit)
+    body = None
+    if generation is not None:
+        with _autocomplete_cache_lock:
+            body = _autocomplete_cache.get(key)
+
+    if body is None:
+        service = PayeeService(db)
+        payees = service.search_payee_rows(
+            user_id=current_user.id,
+            query=q,
+            limit=limit
+        )
+        # default_category_name is a joined column on each row
+        body = _payee_list_adapter.dump_json(
+            _payee_list_adapter.validate_python(payees, from_attributes=True)
+        )
+        if generation is not None:
+            with _autocomplete_cache_lock:
+                _autocomplete_cache[key] = body
 
-    # Enrich with category information
-    results = []
-    for payee in payees:
-        payee_dict = {
-            "id": payee.id,
-            "user_id": payee.user_id,
-            "canonical_name": payee.canonical_name,
-            "default_category_id": payee.default_category_id,
-            "payee_type": payee.payee_type,
-            "logo_url": payee.logo_url,
-            "notes": payee.notes,
-            "transaction_count": payee.transaction_count,
-            "last_used_at": payee.last_used_at,
-            "created_at": payee.created_at,
-            "updated_at": payee.updated_at,
-            "default_category_name": None
-        }
-
-        # Add category name if available
-        if payee.default_category:
-            payee_dict["default_category_name"] = payee.default_category.name
-
-        results.append(PayeeWithCategory(**payee_dict))
-
-    return results
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=Payee)
@@ -191,7 +192,7 @@ def update_payee(
         payee_data=payee_data
     )
 
-    if not payee:
+    if payee is None:
         raise HTTPException(status_code=404, detail="Payee not found")
 
     return payee
@@ -213,18 +214,15 @@ def get_payee_transactions(
     Returns transactions sorted by date (newest first) with account and category names.
     """
     service = PayeeService(db)
-
-    # Verify payee exists first
-    payee = service.get_by_id(payee_id, current_user.id)
-    if not payee:
-        raise HTTPException(status_code=404, detail="Payee not found")
-
     transactions = service.get_transactions(
         payee_id=payee_id,
         user_id=current_user.id,
         limit=limit
     )
 
+    if transactions is None:
+        raise HTTPException(status_code=404, detail="Payee not found")
+
     return [PayeeTransaction(**txn) for txn in transactions]
 
 
@@ -298,13 +296,11 @@ def get_payee_patterns(
     - **description_regex**: Regex pattern match (advanced)
     """
     service = PayeeService(db)
+    patterns = service.get_patterns(payee_id, current_user.id)
 
-    # Verify payee exists first
-    payee = service.get_by_id(payee_id, current_user.id)
-    if not payee:
+    if patterns is None:
         raise HTTPException(status_code=404, detail="Payee not found")
 
-    patterns = service.get_patterns(payee_id, current_user.id)
     return patterns
 
 
@@ -329,27 +325,6 @@ def create_payee_pattern(
     """
     service = PayeeService(db)
 
-    # Verify payee exists first
-    payee = service.get_by_id(payee_id, current_user.id)
-    if not payee:
-        raise HTTPException(status_code=404, detail="Payee not found")
-
-    # Validate pattern type
-    valid_types = ["description_contains", "exact_match", "fuzzy_match_base", "description_regex"]
-    if pattern_data.pattern_type not in valid_types:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid pattern type. Must be one of: {', '.join(valid_types)}"
-        )
-
-    # Validate pattern value length for description_contains
-    if (pattern_data.pattern_type == "description_contains" and
-            len(pattern_data.pattern_value) < 4):
-        raise HTTPException(
-            status_code=400,
-            detail="Pattern value must be at least 4 characters for description_contains type"
-        )
-
     pattern = service.create_pattern(
         payee_id=payee_id,
         user_id=current_user.id,
@@ -358,6 +333,9 @@ def create_payee_pattern(
         confidence_score=float(pattern_data.confidence_score)
     )
 
+    if pattern is None:
+        raise HTTPException(status_code=404, detail="Payee not found")
+
     return pattern
 
 
@@ -378,15 +356,6 @@ def update_payee_pattern(
     """
     service = PayeeService(db)
 
-    # Validate pattern type if provided
-    if pattern_data.pattern_type is not None:
-        valid_types = ["description_contains", "exact_match", "fuzzy_match_base", "description_regex"]
-        if pattern_data.pattern_type not in valid_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid pattern type. Must be one of: {', '.join(valid_types)}"
-            )
-
     pattern = service.update_pattern(
         pattern_id=pattern_id,
         user_id=current_user.id,
@@ -423,7 +392,7 @@ def delete_payee_pattern(
 
 @router.post("/patterns/test", response_model=PatternTestResult)
 def test_pattern(
-    pattern_type: str = Query(
+    pattern_type: PatternType = Query(
         ...,
         description="Pattern type to test"
     ),
@@ -444,14 +413,6 @@ def test_pattern(
     """
     service = PayeeService(db)
 
-    # Validate pattern type
-    valid_types = ["description_contains", "exact_match", "fuzzy_match_base", "description_regex"]
-    if pattern_type not in valid_types:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid pattern type. Must be one of: {', '.join(valid_types)}"
-        )
-
     result = service.test_pattern(
         pattern_type=pattern_type,
         pattern_value=pattern_value,
@@ -589,6 +550,7 @@ def parse_icon(
 
 @router.get("/icons/brands", response_model=List[dict])
 def list_brands(
+    request: Request,
     current_user: User = Depends(deps.get_current_user),
 ) -> List[dict]:
     """
@@ -596,5 +558,22 @@ def list_brands(
 
     Returns brands with their Simple Icons slugs and CDN URLs.
     Useful for documentation or brand picker UI.
+
+    The response carries an ETag; clients sending it back in If-None-Match
+    get an empty 304 Not Modified.
     """
-    return payee_icon_service.get_all_brands()
+    etag = payee_icon_service.get_all_brands_etag()
+    headers = {"ETag": etag, "Cache-Control": BRANDS_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    # The list is static, so serve the pre-serialized body as-is
+    return Response(
+        content=payee_icon_service.get_all_brands_json(),
+        media_type="application/json",
+        headers=headers
+    )
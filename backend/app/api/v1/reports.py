@@ -1,14 +1,17 @@
-from typing import Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from decimal import Decimal
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import csv
+import functools
 import io
+import re
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import func, and_, or_, case, literal, select, union_all
 
+from app.core import cache
 from app.core.database import get_db
 from app.api.deps import get_current_active_user
 from app.models.user import User as UserModel
@@ -16,6 +19,10 @@ from app.models.account import Account as AccountModel, AccountType
 from app.models.transaction import Transaction as TransactionModel, TransactionType
 from app.models.category import Category as CategoryModel, CategoryType
 from app.models.budget import Budget as BudgetModel
+from app.models.payee import Payee as PayeeModel
+from app.models.monthly_category_rollup import MonthlyCategoryRollup
+from app.services.account_balance_service import AccountBalanceService
+from app.services.report_cache_service import report_generation
 from app.schemas.dashboard import (
     DashboardSummary,
     AccountSummary,
@@ -44,8 +51,408 @@ from app.schemas.dashboard import (
 
 router = APIRouter()
 
+# Comma-separated ID lists (e.g. spending trends' category_ids)
+ID_LIST_PATTERN = r"^[\d,\s]*$"
+_ID_RE = re.compile(r"\d+")
+
+# Account columns the balance reports read; loading these as rows skips ORM
+# instance construction and identity-map bookkeeping for every account
+BALANCE_ACCOUNT_COLUMNS = (AccountModel.id, AccountModel.type, AccountModel.opening_balance)
+
+
+# Serialized report responses per (endpoint, user, report generation, today,
+# params), kept in the shared cache so every worker sees them. Dashboards
+# poll these endpoints and each response runs several aggregations; writes
+# that change report data call invalidate_report_cache, which bumps the
+# generation on all workers.
+REPORT_CACHE_TTL_SECONDS = 30
+
+# Rows encoded per chunk of a streamed CSV export
+CSV_STREAM_BATCH_ROWS = 500
+
+
+def _cached_report(endpoint: Callable) -> Callable:
+    """
+    Serve an endpoint's response from the report cache.
+
+    The wrapper keeps the endpoint's signature (via functools.wraps), so
+    FastAPI resolves the same parameters and dependencies. Today's date is
+    part of the key because omitted date parameters default to it. Hits and
+    misses both return the serialized JSON, so the body is encoded once.
+    """
+    @functools.wraps(endpoint)
+    def wrapper(*, db: Session, current_user: UserModel, **params):
+        generation = report_generation(current_user.id)
+        if generation is None:
+            return endpoint(db=db, current_user=current_user, **params)
+
+        key = (
+            f"reports:{endpoint.__name__}:{current_user.id}:{generation}:"
+            f"{date.today().isoformat()}:{sorted(params.items())!r}"
+        )
+        body = cache.get_value(key)
+        if body is None:
+            response = endpoint(db=db, current_user=current_user, **params)
+            body = response.model_dump_json(by_alias=True).encode()
+            cache.set_value(key, body, REPORT_CACHE_TTL_SECONDS)
+
+        return Response(content=body, media_type="application/json")
+
+    return wrapper
+
+
+def _csv_response(filename: str, header: Sequence[str], rows: Iterable[Sequence]) -> StreamingResponse:
+    """
+    Stream rows as a CSV attachment, encoding CSV_STREAM_BATCH_ROWS rows per
+    chunk instead of rendering the whole file into memory first.
+
+    The generator is async so Starlette iterates it on the event loop rather
+    than hopping to the threadpool for every chunk; ``rows`` must therefore
+    not touch the database (the request's session is closed by the time the
+    response body is sent).
+
+    Args:
+        filename: Attachment filename
+        header: Header row
+        rows: Data rows, already computed
+
+    Returns:
+        Streaming text/csv response
+    """
+    async def chunks():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        for count, row in enumerate(rows, 1):
+            writer.writerow(row)
+            if count % CSV_STREAM_BATCH_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    return StreamingResponse(
+        chunks(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+def _sum_of_type(transaction_type: TransactionType):
+    """
+    SUM of transaction amounts of one type, for fusing income and expense
+    totals into a single scan. NULL (not 0) when no rows match, like a
+    filtered SUM, so callers keep their ``or Decimal("0.00")`` defaults.
+    """
+    return func.sum(case((TransactionModel.type == transaction_type, TransactionModel.amount)))
+
+
+def _percentage_of(amount, total: Decimal):
+    """
+    SQL expression for ``amount`` as a percentage of a precomputed total,
+    so grouped queries return each row's share directly. 0 when the total
+    is not positive, matching the reports' Python-side guards.
+    """
+    if total > 0:
+        return amount * 100 / total
+    return literal(Decimal("0.00"))
+
+
+def _income_expense_totals(
+    db: Session,
+    filters: list,
+    start_date: date,
+    end_date: date
+) -> Tuple[Decimal, Decimal]:
+    """
+    Income and expense totals for a period in a single scan.
+
+    Args:
+        db: Database session
+        filters: Transaction filters (user, account, ...) besides type and date
+        start_date: First day of the period (inclusive)
+        end_date: Last day of the period (inclusive)
+
+    Returns:
+        Tuple of (total_income, total_expenses)
+    """
+    row = db.query(
+        _sum_of_type(TransactionType.CREDIT).label("income"),
+        _sum_of_type(TransactionType.DEBIT).label("expenses")
+    ).filter(
+        *filters,
+        TransactionModel.date >= start_date,
+        TransactionModel.date <= end_date
+    ).one()
+    return row.income or Decimal("0.00"), row.expenses or Decimal("0.00")
+
+
+def _category_spending(db: Session, filters: list, *group_columns) -> Tuple[Decimal, list]:
+    """
+    Spending per category and the period total in one grouped query.
+
+    The total and each category's percentage come from a window over the
+    grouped sums, so no separate total query is needed. Uncategorized
+    spending counts towards the total but is not returned as a row.
+
+    Args:
+        db: Database session
+        filters: DEBIT transaction filters (user, type, dates, ...)
+        group_columns: Category columns to group and return (e.g. id, name)
+
+    Returns:
+        Tuple of (total_spending, rows); rows hold the group columns followed
+        by total, count and percentage, largest total first
+    """
+    amount = func.sum(TransactionModel.amount)
+    period_total = func.sum(amount).over()
+    rows = db.query(
+        *group_columns,
+        amount.label("total"),
+        func.count(TransactionModel.id).label("count"),
+        case(
+            (period_total > 0, amount * 100 / period_total),
+            else_=literal(Decimal("0.00"))
+        ).label("percentage"),
+        period_total.label("period_total")
+    ).select_from(TransactionModel).outerjoin(
+        CategoryModel,
+        TransactionModel.category_id == CategoryModel.id
+    ).filter(
+        *filters
+    ).group_by(
+        *group_columns
+    ).order_by(
+        amount.desc()
+    ).all()
+
+    total_spending = rows[0].period_total if rows else Decimal("0.00")
+    return total_spending, [row[:-1] for row in rows if row[0] is not None]
+
+
+def _month_ranges(end_date: date, months: int) -> List[Tuple[str, date, date]]:
+    """
+    The ``months`` calendar months ending with end_date's month, oldest first.
+
+    Built with integer year/month arithmetic, since the reports call this on
+    every request and relativedelta is comparatively expensive.
+
+    Args:
+        end_date: Any day in the last month
+        months: Number of months
+
+    Returns:
+        List of (YYYY-MM, first day, last day) tuples; the last day is the
+        calendar month end, not clipped to end_date
+    """
+    ranges = []
+    year, month = end_date.year, end_date.month
+    for _ in range(months):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        ranges.append((
+            f"{year:04d}-{month:02d}",
+            date(year, month, 1),
+            date(next_year, next_month, 1) - timedelta(days=1)
+        ))
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    ranges.reverse()
+    return ranges
+
+
+def _monthly_income_expenses(
+    db: Session,
+    filters: list,
+    month_ranges: List[Tuple[str, date, date]]
+) -> Dict[Tuple[int, int], Tuple[Decimal, Decimal]]:
+    """
+    Income and expense totals per calendar month in one grouped query.
+
+    Args:
+        db: Database session
+        filters: Transaction filters (user, account, ...) besides type and date
+        month_ranges: Months to cover, oldest first (from _month_ranges)
+
+    Returns:
+        Map of (year, month) -> (income, expenses) for months with any
+        transactions; missing months had none
+    """
+    year = func.extract("year", TransactionModel.date)
+    month = func.extract("month", TransactionModel.date)
+    rows = db.query(
+        year.label("year"),
+        month.label("month"),
+        _sum_of_type(TransactionType.CREDIT).label("income"),
+        _sum_of_type(TransactionType.DEBIT).label("expenses")
+    ).filter(
+        *filters,
+        TransactionModel.date >= month_ranges[0][1],
+        TransactionModel.date <= month_ranges[-1][2]
+    ).group_by(year, month).all()
+
+    return {
+        (int(row.year), int(row.month)): (
+            row.income or Decimal("0.00"),
+            row.expenses or Decimal("0.00")
+        )
+        for row in rows
+    }
+
+
+def _category_month_totals(
+    user_id: int,
+    account_id: Optional[int],
+    types: List[TransactionType],
+    start_date: date,
+    end_date: date
+):
+    """
+    Categorized transaction totals per (category, calendar month, type).
+
+    Whole months inside the period that have already ended are read from
+    monthly_category_rollups; the rest (a partial first or last month and
+    the current month) are aggregated live from transactions. Each month
+    comes from exactly one side, so every (category, year, month, type)
+    appears at most once.
+
+    Args:
+        user_id: User whose transactions to total
+        account_id: Optional account filter
+        types: Transaction types to include
+        start_date: First day of the period (inclusive)
+        end_date: Last day of the period (inclusive)
+
+    Returns:
+        Subquery with columns category_id, year, month, type, total, count
+    """
+    year = func.extract("year", TransactionModel.date)
+    month = func.extract("month", TransactionModel.date)
+    live_filters = [
+        TransactionModel.user_id == user_id,
+        TransactionModel.type.in_(types),
+        TransactionModel.category_id.isnot(None),
+        TransactionModel.date >= start_date,
+        TransactionModel.date <= end_date
+    ]
+    if account_id:
+        live_filters.append(TransactionModel.account_id == account_id)
+
+    # Closed months: [closed_start, closed_end), whole months only
+    closed_start = date(start_date.year, start_date.month, 1)
+    if closed_start < start_date:
+        closed_start += relativedelta(months=1)
+    after_end = end_date + relativedelta(days=1)
+    today = date.today()
+    closed_end = min(date(after_end.year, after_end.month, 1), date(today.year, today.month, 1))
+
+    live = select(
+        TransactionModel.category_id.label("category_id"),
+        year.label("year"),
+        month.label("month"),
+        TransactionModel.type.label("type"),
+        func.sum(TransactionModel.amount).label("total"),
+        func.count(TransactionModel.id).label("count")
+    ).where(*live_filters).group_by(
+        TransactionModel.category_id, year, month, TransactionModel.type
+    )
+
+    if closed_end <= closed_start:
+        return live.subquery()
+
+    live = live.where(
+        or_(TransactionModel.date < closed_start, TransactionModel.date >= closed_end)
+    )
+
+    rollup_year = func.extract("year", MonthlyCategoryRollup.month)
+    rollup_month = func.extract("month", MonthlyCategoryRollup.month)
+    rollup_filters = [
+        MonthlyCategoryRollup.user_id == user_id,
+        MonthlyCategoryRollup.type.in_(types),
+        MonthlyCategoryRollup.month >= closed_start,
+        MonthlyCategoryRollup.month < closed_end,
+        MonthlyCategoryRollup.transaction_count > 0
+    ]
+    if account_id:
+        rollup_filters.append(MonthlyCategoryRollup.account_id == account_id)
+
+    # Rollup rows are per account; sum them per category
+    rolled = select(
+        MonthlyCategoryRollup.category_id,
+        rollup_year,
+        rollup_month,
+        MonthlyCategoryRollup.type,
+        func.sum(MonthlyCategoryRollup.total_amount),
+        func.sum(MonthlyCategoryRollup.transaction_count)
+    ).where(*rollup_filters).group_by(
+        MonthlyCategoryRollup.category_id,
+        rollup_year,
+        rollup_month,
+        MonthlyCategoryRollup.type
+    )
+
+    return union_all(live, rolled).subquery()
+
+
+def _monthly_top_categories(
+    db: Session,
+    user_id: int,
+    account_id: Optional[int],
+    month_ranges: List[Tuple[str, date, date]],
+    limit: int = 5
+) -> Dict[Tuple[int, int, TransactionType], list]:
+    """
+    Top categories by amount per calendar month and type in one query.
+
+    Category totals per month and type (from _category_month_totals) are
+    ranked within each (month, type) with ROW_NUMBER(), and only the top
+    ``limit`` of each are returned.
+
+    Args:
+        db: Database session
+        user_id: User whose transactions to rank
+        account_id: Optional account filter
+        month_ranges: Months to cover, oldest first (from _month_ranges)
+        limit: Categories to keep per month and type
+
+    Returns:
+        Map of (year, month, type) -> [(category_id, category_name, total, count)]
+        for CREDIT and DEBIT, largest first; missing keys had no transactions
+    """
+    totals = _category_month_totals(
+        user_id,
+        account_id,
+        [TransactionType.CREDIT, TransactionType.DEBIT],
+        month_ranges[0][1],
+        month_ranges[-1][2]
+    )
+    ranked = db.query(
+        totals.c.category_id,
+        CategoryModel.name.label("category_name"),
+        totals.c.year,
+        totals.c.month,
+        totals.c.type,
+        totals.c.total,
+        totals.c.count,
+        func.row_number().over(
+            partition_by=[totals.c.year, totals.c.month, totals.c.type],
+            order_by=totals.c.total.desc()
+        ).label("rank")
+    ).join(
+        CategoryModel,
+        CategoryModel.id == totals.c.category_id
+    ).subquery()
+
+    rows = db.query(ranked).filter(ranked.c.rank <= limit).order_by(ranked.c.rank).all()
+
+    top_categories: Dict[Tuple[int, int, TransactionType], list] = {}
+    for row in rows:
+        top_categories.setdefault((int(row.year), int(row.month), row.type), []).append(
+            (row.category_id, row.category_name, row.total, row.count)
+        )
+    return top_categories
+
 
 @router.get("/dashboard", response_model=DashboardSummary)
+@_cached_report
 def get_dashboard_summary(
     start_date: Optional[date] = Query(None, description="Start date for period (defaults to current month)"),
     end_date: Optional[date] = Query(None, description="End date for period (defaults to today)"),
@@ -60,15 +467,19 @@ def get_dashboard_summary(
     if not start_date:
         start_date = date(end_date.year, end_date.month, 1)
 
-    # Account Summary
-    accounts = db.query(AccountModel).filter(AccountModel.user_id == current_user.id).all()
+    # Account Summary (plain rows: only the balance inputs are needed)
+    accounts = db.query(*BALANCE_ACCOUNT_COLUMNS).filter(
+        AccountModel.user_id == current_user.id
+    ).all()
 
     total_assets = Decimal("0.00")
     total_liabilities = Decimal("0.00")
 
+    # Calculate balances on-the-fly from opening_balance + transactions
+    balances = AccountBalanceService(db).get_balances(accounts)
+
     for account in accounts:
-        # Calculate balance on-the-fly from opening_balance + transactions
-        balance = account.calculate_balance(db)
+        balance = balances[account.id]
         if account.type in [AccountType.CHECKING, AccountType.SAVINGS, AccountType.INVESTMENT, AccountType.CASH]:
             total_assets += balance
         elif account.type in [AccountType.CREDIT_CARD, AccountType.LOAN]:
@@ -83,21 +494,9 @@ def get_dashboard_summary(
     )
 
     # Income vs Expenses for current period
-    income_query = db.query(func.sum(TransactionModel.amount)).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.CREDIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
+    total_income, total_expenses = _income_expense_totals(
+        db, [TransactionModel.user_id == current_user.id], start_date, end_date
     )
-    total_income = income_query.scalar() or Decimal("0.00")
-
-    expense_query = db.query(func.sum(TransactionModel.amount)).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    )
-    total_expenses = expense_query.scalar() or Decimal("0.00")
 
     net = total_income - total_expenses
     savings_rate = (net / total_income * 100) if total_income > 0 else Decimal("0.00")
@@ -110,37 +509,52 @@ def get_dashboard_summary(
     )
 
     # Budget Status
-    budgets = db.query(BudgetModel).filter(
+    # Category names are joined in rather than looked up per budget; lazy
+    # loads of budget relationships raise instead of querying per budget
+    budgets = db.query(BudgetModel, CategoryModel.name).options(raiseload("*")).outerjoin(
+        CategoryModel, CategoryModel.id == BudgetModel.category_id
+    ).filter(
         BudgetModel.user_id == current_user.id,
         BudgetModel.start_date <= end_date,
         or_(BudgetModel.end_date.is_(None), BudgetModel.end_date >= start_date)
     ).all()
 
-    budget_status_list = []
-    for budget in budgets:
-        # Calculate spent for budget period
+    # Clip each budget to the dashboard period; budgets sharing a window
+    # (usually all of them) get their spending from one grouped query
+    budget_windows: Dict[Tuple[date, date], List[int]] = {}
+    for budget, _ in budgets:
         budget_start = max(budget.start_date, start_date)
         budget_end = min(budget.end_date, end_date) if budget.end_date else end_date
+        budget_windows.setdefault((budget_start, budget_end), []).append(budget.category_id)
 
-        spent_query = db.query(func.sum(TransactionModel.amount)).filter(
+    spent_by_window: Dict[Tuple[date, date], Dict[int, Decimal]] = {}
+    for (budget_start, budget_end), category_ids in budget_windows.items():
+        spent_by_window[(budget_start, budget_end)] = dict(db.query(
+            TransactionModel.category_id,
+            func.sum(TransactionModel.amount)
+        ).filter(
             TransactionModel.user_id == current_user.id,
-            TransactionModel.category_id == budget.category_id,
+            TransactionModel.category_id.in_(set(category_ids)),
             TransactionModel.type == TransactionType.DEBIT,
             TransactionModel.date >= budget_start,
             TransactionModel.date <= budget_end
-        )
-        spent = spent_query.scalar() or Decimal("0.00")
+        ).group_by(TransactionModel.category_id).all())
+
+    budget_status_list = []
+    for budget, category_name in budgets:
+        # Look up spent for budget period
+        budget_start = max(budget.start_date, start_date)
+        budget_end = min(budget.end_date, end_date) if budget.end_date else end_date
+        spent = spent_by_window[(budget_start, budget_end)].get(budget.category_id) or Decimal("0.00")
 
         remaining = budget.amount - spent
         percentage = (spent / budget.amount * 100) if budget.amount > 0 else Decimal("0.00")
         is_over_budget = spent > budget.amount
 
-        category = db.query(CategoryModel).filter(CategoryModel.id == budget.category_id).first()
-
         budget_status_list.append(BudgetStatus(
             budget_id=budget.id,
             budget_name=budget.name,
-            category_name=category.name if category else "Unknown",
+            category_name=category_name or "Unknown",
             amount=budget.amount,
             spent=spent,
             remaining=remaining,
@@ -154,7 +568,8 @@ def get_dashboard_summary(
         CategoryModel.id,
         CategoryModel.name,
         func.sum(TransactionModel.amount).label("total"),
-        func.count(TransactionModel.id).label("count")
+        func.count(TransactionModel.id).label("count"),
+        _percentage_of(func.sum(TransactionModel.amount), total_expenses).label("percentage")
     ).join(
         TransactionModel,
         TransactionModel.category_id == CategoryModel.id
@@ -171,8 +586,7 @@ def get_dashboard_summary(
     ).limit(5).all()
 
     top_spending = []
-    for cat_id, cat_name, total, count in category_spending:
-        percentage = (total / total_expenses * 100) if total_expenses > 0 else Decimal("0.00")
+    for cat_id, cat_name, total, count, percentage in category_spending:
         top_spending.append(CategorySpending(
             category_id=cat_id,
             category_name=cat_name,
@@ -192,6 +606,7 @@ def get_dashboard_summary(
 
 
 @router.get("/spending-by-category", response_model=SpendingByCategoryResponse)
+@_cached_report
 def get_spending_by_category(
     start_date: Optional[date] = Query(None, description="Start date (defaults to current month)"),
     end_date: Optional[date] = Query(None, description="End date (defaults to today)"),
@@ -206,39 +621,20 @@ def get_spending_by_category(
     if not start_date:
         start_date = date(end_date.year, end_date.month, 1)
 
-    # Get total spending
-    total_query = db.query(func.sum(TransactionModel.amount)).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    )
-    total_spending = total_query.scalar() or Decimal("0.00")
-
-    # Get spending by category
-    category_spending = db.query(
-        CategoryModel.id,
-        CategoryModel.name,
-        func.sum(TransactionModel.amount).label("total"),
-        func.count(TransactionModel.id).label("count")
-    ).join(
-        TransactionModel,
-        TransactionModel.category_id == CategoryModel.id
-    ).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    ).group_by(
+    total_spending, category_spending = _category_spending(
+        db,
+        [
+            TransactionModel.user_id == current_user.id,
+            TransactionModel.type == TransactionType.DEBIT,
+            TransactionModel.date >= start_date,
+            TransactionModel.date <= end_date
+        ],
         CategoryModel.id,
         CategoryModel.name
-    ).order_by(
-        func.sum(TransactionModel.amount).desc()
-    ).all()
+    )
 
     categories = []
-    for cat_id, cat_name, total, count in category_spending:
-        percentage = (total / total_spending * 100) if total_spending > 0 else Decimal("0.00")
+    for cat_id, cat_name, total, count, percentage in category_spending:
         categories.append(CategorySpending(
             category_id=cat_id,
             category_name=cat_name,
@@ -256,6 +652,7 @@ def get_spending_by_category(
 
 
 @router.get("/income-vs-expenses", response_model=IncomeVsExpensesResponse)
+@_cached_report
 def get_income_vs_expenses(
     months: int = Query(6, ge=1, le=24, description="Number of months to include"),
     db: Session = Depends(get_db),
@@ -267,21 +664,9 @@ def get_income_vs_expenses(
     start_date = end_date - relativedelta(months=months)
 
     # Current period totals
-    income_query = db.query(func.sum(TransactionModel.amount)).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.CREDIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
+    total_income, total_expenses = _income_expense_totals(
+        db, [TransactionModel.user_id == current_user.id], start_date, end_date
     )
-    total_income = income_query.scalar() or Decimal("0.00")
-
-    expense_query = db.query(func.sum(TransactionModel.amount)).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    )
-    total_expenses = expense_query.scalar() or Decimal("0.00")
 
     net = total_income - total_expenses
     savings_rate = (net / total_income * 100) if total_income > 0 else Decimal("0.00")
@@ -293,31 +678,21 @@ def get_income_vs_expenses(
         savings_rate=savings_rate
     )
 
-    # Monthly trends
-    monthly_trends = []
-    for i in range(months):
-        month_start = end_date - relativedelta(months=i)
-        month_start = date(month_start.year, month_start.month, 1)
-        month_end = month_start + relativedelta(months=1) - relativedelta(days=1)
-
-        month_income = db.query(func.sum(TransactionModel.amount)).filter(
-            TransactionModel.user_id == current_user.id,
-            TransactionModel.type == TransactionType.CREDIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
-
-        month_expenses = db.query(func.sum(TransactionModel.amount)).filter(
-            TransactionModel.user_id == current_user.id,
-            TransactionModel.type == TransactionType.DEBIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
+    # Monthly trends (one grouped query for all months)
+    month_ranges = _month_ranges(end_date, months)
+    monthly_totals = _monthly_income_expenses(
+        db, [TransactionModel.user_id == current_user.id], month_ranges
+    )
 
+    monthly_trends = []
+    for month_str, month_start, _ in month_ranges:
+        month_income, month_expenses = monthly_totals.get(
+            (month_start.year, month_start.month), (Decimal("0.00"), Decimal("0.00"))
+        )
         month_net = month_income - month_expenses
 
-        monthly_trends.insert(0, MonthlyTrend(
-            month=month_start.strftime("%Y-%m"),
+        monthly_trends.append(MonthlyTrend(
+            month=month_str,
             income=month_income,
             expenses=month_expenses,
             net=month_net
@@ -332,6 +707,7 @@ def get_income_vs_expenses(
 
 
 @router.get("/net-worth-history", response_model=NetWorthHistoryResponse)
+@_cached_report
 def get_net_worth_history(
     months: int = Query(12, ge=1, le=60, description="Number of months of history to include"),
     account_id: Optional[int] = Query(None, description="Filter by specific account (optional)"),
@@ -344,7 +720,7 @@ def get_net_worth_history(
     start_date = end_date - relativedelta(months=months)
 
     # Get all user accounts (or filtered by account_id)
-    accounts_query = db.query(AccountModel).filter(
+    accounts_query = db.query(*BALANCE_ACCOUNT_COLUMNS, AccountModel.name).filter(
         AccountModel.user_id == current_user.id,
         AccountModel.is_active == True
     )
@@ -356,13 +732,21 @@ def get_net_worth_history(
     asset_types = [AccountType.CHECKING, AccountType.SAVINGS, AccountType.INVESTMENT, AccountType.CASH]
     liability_types = [AccountType.CREDIT_CARD, AccountType.LOAN]
 
-    # Calculate current balances for each account
+    # End-of-month dates going back from today, oldest first: month ends
+    # from `months` months back through two months back, then today
+    month_dates = [month_end for _, _, month_end in _month_ranges(end_date, months + 1)[:months - 1]]
+    month_dates.append(end_date)
+
+    # One aggregate query for every account at every month end
+    balance_history = AccountBalanceService(db).get_balance_history(accounts, month_dates)
+
+    # Calculate current balances for each account (the last point is end_date)
     account_balances = []
     current_assets = Decimal("0.00")
     current_liabilities = Decimal("0.00")
 
     for account in accounts:
-        balance = account.calculate_balance(db, as_of_date=end_date)
+        balance = balance_history[account.id][-1]
         is_asset = account.type in asset_types
 
         if is_asset:
@@ -389,18 +773,12 @@ def get_net_worth_history(
 
     # Calculate historical net worth for each month
     history = []
-    for i in range(months):
-        # Calculate date for end of each month going back
-        month_date = end_date - relativedelta(months=i)
-        # Get the last day of that month
-        if i > 0:
-            month_date = date(month_date.year, month_date.month, 1) - relativedelta(days=1)
-
+    for index, month_date in enumerate(month_dates):
         month_assets = Decimal("0.00")
         month_liabilities = Decimal("0.00")
 
         for account in accounts:
-            balance = account.calculate_balance(db, as_of_date=month_date)
+            balance = balance_history[account.id][index]
 
             if account.type in asset_types:
                 month_assets += balance
@@ -409,7 +787,7 @@ def get_net_worth_history(
 
         month_net_worth = month_assets - month_liabilities
 
-        history.insert(0, NetWorthDataPoint(
+        history.append(NetWorthDataPoint(
             date=month_date,
             total_assets=month_assets,
             total_liabilities=month_liabilities,
@@ -428,7 +806,11 @@ def get_net_worth_history(
 @router.get("/spending-trends", response_model=SpendingTrendsResponse)
 def get_spending_trends(
     months: int = Query(6, ge=1, le=24, description="Number of months to include"),
-    category_ids: Optional[str] = Query(None, description="Comma-separated category IDs to filter (optional)"),
+    category_ids: Optional[str] = Query(
+        None,
+        pattern=ID_LIST_PATTERN,
+        description="Comma-separated category IDs to filter (optional)"
+    ),
     account_id: Optional[int] = Query(None, description="Filter by specific account (optional)"),
     db: Session = Depends(get_db),
     current_user: UserModel = Depends(get_current_active_user)
@@ -441,14 +823,10 @@ def get_spending_trends(
     # Parse category IDs if provided
     filter_category_ids = None
     if category_ids:
-        filter_category_ids = [int(id.strip()) for id in category_ids.split(",") if id.strip()]
+        filter_category_ids = [int(id) for id in _ID_RE.findall(category_ids)]
 
     # Build list of months
-    month_list = []
-    for i in range(months):
-        month_date = end_date - relativedelta(months=i)
-        month_str = date(month_date.year, month_date.month, 1).strftime("%Y-%m")
-        month_list.insert(0, month_str)
+    month_list = [month_str for month_str, _, _ in _month_ranges(end_date, months)]
 
     # Base query filters
     base_filters = [
@@ -465,54 +843,51 @@ def get_spending_trends(
     total_query = db.query(func.sum(TransactionModel.amount)).filter(*base_filters)
     total_spending = total_query.scalar() or Decimal("0.00")
 
-    # Get all categories with spending in this period
-    category_query = db.query(
+    # Spending per category per calendar month (closed months from the rollup)
+    totals = _category_month_totals(
+        current_user.id, account_id, [TransactionType.DEBIT], start_date, end_date
+    )
+    pivot_query = db.query(
         CategoryModel.id,
-        CategoryModel.name
+        CategoryModel.name,
+        totals.c.year,
+        totals.c.month,
+        totals.c.total,
+        totals.c.count
     ).join(
-        TransactionModel,
-        TransactionModel.category_id == CategoryModel.id
-    ).filter(*base_filters).group_by(
-        CategoryModel.id,
-        CategoryModel.name
-    ).order_by(
-        func.sum(TransactionModel.amount).desc()
+        totals,
+        totals.c.category_id == CategoryModel.id
     )
 
     if filter_category_ids:
-        category_query = category_query.filter(CategoryModel.id.in_(filter_category_ids))
+        pivot_query = pivot_query.filter(CategoryModel.id.in_(filter_category_ids))
+
+    pivot_rows = pivot_query.all()
 
-    categories_result = category_query.all()
+    # Categories ordered by total spending in the period (which may start
+    # partway through a month before the first one listed)
+    category_names: Dict[int, str] = {}
+    category_spending: Dict[int, Decimal] = {}
+    monthly_spending: Dict[Tuple[int, str], Tuple[Decimal, int]] = {}
+    for cat_id, cat_name, row_year, row_month, amount, count in pivot_rows:
+        category_names[cat_id] = cat_name
+        category_spending[cat_id] = category_spending.get(cat_id, Decimal("0.00")) + amount
+        monthly_spending[(cat_id, f"{int(row_year):04d}-{int(row_month):02d}")] = (amount, count)
 
     # Build category trends
+    # months x categories items built from already-typed query results;
+    # model_construct skips per-item validation, and FastAPI still validates
+    # the whole response against response_model
     category_trends = []
-    for cat_id, cat_name in categories_result:
+    for cat_id in sorted(category_spending, key=category_spending.get, reverse=True):
         monthly_data = []
         total_amount = Decimal("0.00")
 
         for month_str in month_list:
-            # Parse month string to get date range
-            year, month = map(int, month_str.split("-"))
-            month_start = date(year, month, 1)
-            month_end = month_start + relativedelta(months=1) - relativedelta(days=1)
-
-            # Query for this category in this month
-            month_filters = base_filters + [
-                TransactionModel.category_id == cat_id,
-                TransactionModel.date >= month_start,
-                TransactionModel.date <= month_end
-            ]
-
-            result = db.query(
-                func.sum(TransactionModel.amount).label("amount"),
-                func.count(TransactionModel.id).label("count")
-            ).filter(*month_filters).first()
-
-            amount = result.amount or Decimal("0.00")
-            count = result.count or 0
+            amount, count = monthly_spending.get((cat_id, month_str), (Decimal("0.00"), 0))
             total_amount += amount
 
-            monthly_data.append(CategoryMonthlySpending(
+            monthly_data.append(CategoryMonthlySpending.model_construct(
                 month=month_str,
                 amount=amount,
                 transaction_count=count
@@ -520,9 +895,9 @@ def get_spending_trends(
 
         average_amount = total_amount / len(month_list) if month_list else Decimal("0.00")
 
-        category_trends.append(CategoryTrend(
+        category_trends.append(CategoryTrend.model_construct(
             category_id=cat_id,
-            category_name=cat_name,
+            category_name=category_names[cat_id],
             total_amount=total_amount,
             average_amount=average_amount,
             monthly_data=monthly_data
@@ -555,19 +930,7 @@ def get_income_expense_detail(
         base_filters.append(TransactionModel.account_id == account_id)
 
     # Overall summary
-    total_income = db.query(func.sum(TransactionModel.amount)).filter(
-        *base_filters,
-        TransactionModel.type == TransactionType.CREDIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    ).scalar() or Decimal("0.00")
-
-    total_expenses = db.query(func.sum(TransactionModel.amount)).filter(
-        *base_filters,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    ).scalar() or Decimal("0.00")
+    total_income, total_expenses = _income_expense_totals(db, base_filters, start_date, end_date)
 
     net = total_income - total_expenses
     savings_rate = (net / total_income * 100) if total_income > 0 else Decimal("0.00")
@@ -584,7 +947,8 @@ def get_income_expense_detail(
         CategoryModel.id,
         CategoryModel.name,
         func.sum(TransactionModel.amount).label("total"),
-        func.count(TransactionModel.id).label("count")
+        func.count(TransactionModel.id).label("count"),
+        _percentage_of(func.sum(TransactionModel.amount), total_income).label("percentage")
     ).join(
         TransactionModel,
         TransactionModel.category_id == CategoryModel.id
@@ -601,8 +965,7 @@ def get_income_expense_detail(
     ).all()
 
     income_sources = []
-    for cat_id, cat_name, total, count in income_by_category:
-        percentage = (total / total_income * 100) if total_income > 0 else Decimal("0.00")
+    for cat_id, cat_name, total, count, percentage in income_by_category:
         income_sources.append(IncomeSource(
             category_id=cat_id,
             category_name=cat_name,
@@ -611,58 +974,31 @@ def get_income_expense_detail(
             transaction_count=count
         ))
 
-    # Monthly breakdown
+    # Monthly breakdown (income/expense totals and top categories from one
+    # grouped query each)
+    month_ranges = _month_ranges(end_date, months)
+    monthly_totals = _monthly_income_expenses(db, base_filters, month_ranges)
+    monthly_top_categories = _monthly_top_categories(db, current_user.id, account_id, month_ranges)
+
+    # Items are built with model_construct, as in spending trends
     monthly_breakdown = []
-    for i in range(months):
-        month_date = end_date - relativedelta(months=i)
-        month_start = date(month_date.year, month_date.month, 1)
-        month_end = month_start + relativedelta(months=1) - relativedelta(days=1)
-        month_str = month_start.strftime("%Y-%m")
-
-        # Month income
-        month_income = db.query(func.sum(TransactionModel.amount)).filter(
-            *base_filters,
-            TransactionModel.type == TransactionType.CREDIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
-
-        # Month expenses
-        month_expenses = db.query(func.sum(TransactionModel.amount)).filter(
-            *base_filters,
-            TransactionModel.type == TransactionType.DEBIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
+    for month_str, month_start, _ in month_ranges:
+        month_income, month_expenses = monthly_totals.get(
+            (month_start.year, month_start.month), (Decimal("0.00"), Decimal("0.00"))
+        )
 
         month_net = month_income - month_expenses
         month_savings_rate = (month_net / month_income * 100) if month_income > 0 else Decimal("0.00")
 
         # Month income sources
-        month_income_by_cat = db.query(
-            CategoryModel.id,
-            CategoryModel.name,
-            func.sum(TransactionModel.amount).label("total"),
-            func.count(TransactionModel.id).label("count")
-        ).join(
-            TransactionModel,
-            TransactionModel.category_id == CategoryModel.id
-        ).filter(
-            *base_filters,
-            TransactionModel.type == TransactionType.CREDIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).group_by(
-            CategoryModel.id,
-            CategoryModel.name
-        ).order_by(
-            func.sum(TransactionModel.amount).desc()
-        ).limit(5).all()
+        month_income_by_cat = monthly_top_categories.get(
+            (month_start.year, month_start.month, TransactionType.CREDIT), []
+        )
 
         month_income_sources = []
         for cat_id, cat_name, total, count in month_income_by_cat:
             percentage = (total / month_income * 100) if month_income > 0 else Decimal("0.00")
-            month_income_sources.append(IncomeSource(
+            month_income_sources.append(IncomeSource.model_construct(
                 category_id=cat_id,
                 category_name=cat_name,
                 amount=total,
@@ -671,30 +1007,14 @@ def get_income_expense_detail(
             ))
 
         # Month top expenses
-        month_expense_by_cat = db.query(
-            CategoryModel.id,
-            CategoryModel.name,
-            func.sum(TransactionModel.amount).label("total"),
-            func.count(TransactionModel.id).label("count")
-        ).join(
-            TransactionModel,
-            TransactionModel.category_id == CategoryModel.id
-        ).filter(
-            *base_filters,
-            TransactionModel.type == TransactionType.DEBIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).group_by(
-            CategoryModel.id,
-            CategoryModel.name
-        ).order_by(
-            func.sum(TransactionModel.amount).desc()
-        ).limit(5).all()
+        month_expense_by_cat = monthly_top_categories.get(
+            (month_start.year, month_start.month, TransactionType.DEBIT), []
+        )
 
         month_top_expenses = []
         for cat_id, cat_name, total, count in month_expense_by_cat:
             percentage = (total / month_expenses * 100) if month_expenses > 0 else Decimal("0.00")
-            month_top_expenses.append(CategorySpending(
+            month_top_expenses.append(CategorySpending.model_construct(
                 category_id=cat_id,
                 category_name=cat_name,
                 amount=total,
@@ -702,7 +1022,7 @@ def get_income_expense_detail(
                 transaction_count=count
             ))
 
-        monthly_breakdown.insert(0, MonthlyIncomeExpense(
+        monthly_breakdown.append(MonthlyIncomeExpense.model_construct(
             month=month_str,
             income=month_income,
             expenses=month_expenses,
@@ -743,45 +1063,34 @@ def get_cash_flow_forecast(
     asset_types = [AccountType.CHECKING, AccountType.SAVINGS, AccountType.INVESTMENT, AccountType.CASH]
     liability_types = [AccountType.CREDIT_CARD, AccountType.LOAN]
 
-    accounts_query = db.query(AccountModel).filter(
+    accounts_query = db.query(*BALANCE_ACCOUNT_COLUMNS).filter(
         AccountModel.user_id == current_user.id,
         AccountModel.is_active == True
     )
     if account_id:
         accounts_query = accounts_query.filter(AccountModel.id == account_id)
     accounts = accounts_query.all()
+    balances = AccountBalanceService(db).get_balances(accounts)
 
     current_balance = Decimal("0.00")
     for account in accounts:
-        balance = account.calculate_balance(db)
+        balance = balances[account.id]
         if account.type in asset_types:
             current_balance += balance
         elif account.type in liability_types:
             current_balance -= abs(balance)
 
     # Calculate monthly averages from historical data
+    month_ranges = _month_ranges(end_date, historical_months)
+    monthly_totals = _monthly_income_expenses(db, base_filters, month_ranges)
     monthly_incomes = []
     monthly_expenses = []
 
-    for i in range(historical_months):
-        month_date = end_date - relativedelta(months=i)
-        month_start = date(month_date.year, month_date.month, 1)
-        month_end = month_start + relativedelta(months=1) - relativedelta(days=1)
-
-        month_income = db.query(func.sum(TransactionModel.amount)).filter(
-            *base_filters,
-            TransactionModel.type == TransactionType.CREDIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
-
-        month_expenses = db.query(func.sum(TransactionModel.amount)).filter(
-            *base_filters,
-            TransactionModel.type == TransactionType.DEBIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
-
+    for _, month_start, _ in month_ranges:
+        month_income, month_expenses = monthly_totals.get(
+            (month_start.year, month_start.month),
+            (Decimal("0.00"), Decimal("0.00"))
+        )
         monthly_incomes.append(month_income)
         monthly_expenses.append(month_expenses)
 
@@ -794,29 +1103,28 @@ def get_cash_flow_forecast(
     income_variance = sum((x - avg_income) ** 2 for x in monthly_incomes) / len(monthly_incomes) if monthly_incomes else Decimal("0.00")
     expense_variance = sum((x - avg_expenses) ** 2 for x in monthly_expenses) / len(monthly_expenses) if monthly_expenses else Decimal("0.00")
 
+    # Determine confidence based on variance (the same for every projected month)
+    total_variance = float(income_variance + expense_variance)
+    total_volume = float(avg_income + avg_expenses)
+    if total_variance < total_volume * 0.1:
+        confidence = "high"
+    elif total_variance < total_volume * 0.3:
+        confidence = "medium"
+    else:
+        confidence = "low"
+
     # Generate projections
     projections = []
     projected_balance = current_balance
 
-    for i in range(1, forecast_months + 1):
-        future_month = end_date + relativedelta(months=i)
-        month_str = date(future_month.year, future_month.month, 1).strftime("%Y-%m")
-
+    forecast_ranges = _month_ranges(end_date + relativedelta(months=forecast_months), forecast_months)
+    for month_str, _, _ in forecast_ranges:
         # Simple linear projection using averages
         projected_income = avg_income
         projected_expenses = avg_expenses
         projected_net = projected_income - projected_expenses
         projected_balance += projected_net
 
-        # Determine confidence based on variance
-        total_variance = float(income_variance + expense_variance)
-        if total_variance < float(avg_income + avg_expenses) * 0.1:
-            confidence = "high"
-        elif total_variance < float(avg_income + avg_expenses) * 0.3:
-            confidence = "medium"
-        else:
-            confidence = "low"
-
         projections.append(CashFlowProjection(
             month=month_str,
             projected_income=projected_income,
@@ -831,15 +1139,23 @@ def get_cash_flow_forecast(
     recurring_bills = []
 
     # Get all debit transactions with payee info in the historical period
-    from app.models.payee import Payee as PayeeModel
     from collections import defaultdict
 
+    # Payee and category names are joined here rather than looked up per payee
     expense_txns = db.query(
         TransactionModel.payee_id,
         TransactionModel.payee,
         TransactionModel.amount,
         TransactionModel.date,
-        TransactionModel.category_id
+        TransactionModel.category_id,
+        PayeeModel.canonical_name.label("payee_name"),
+        CategoryModel.name.label("category_name")
+    ).outerjoin(
+        PayeeModel,
+        PayeeModel.id == TransactionModel.payee_id
+    ).outerjoin(
+        CategoryModel,
+        CategoryModel.id == TransactionModel.category_id
     ).filter(
         *base_filters,
         TransactionModel.type == TransactionType.DEBIT,
@@ -858,7 +1174,9 @@ def get_cash_flow_forecast(
                 "date": txn.date,
                 "category_id": txn.category_id,
                 "payee_id": txn.payee_id,
-                "payee_str": txn.payee
+                "payee_str": txn.payee,
+                "payee_name": txn.payee_name,
+                "category_name": txn.category_name
             })
 
     # Analyze each payee for recurring patterns
@@ -898,21 +1216,9 @@ def get_cash_flow_forecast(
         else:
             continue  # Not a recognized frequency pattern
 
-        # Get payee name
-        payee_name = None
-        if transactions[0]["payee_id"]:
-            payee = db.query(PayeeModel).filter(PayeeModel.id == transactions[0]["payee_id"]).first()
-            if payee:
-                payee_name = payee.canonical_name
-        if not payee_name:
-            payee_name = transactions[0]["payee_str"] or "Unknown"
-
-        # Get category name
-        category_name = None
-        if transactions[0]["category_id"]:
-            category = db.query(CategoryModel).filter(CategoryModel.id == transactions[0]["category_id"]).first()
-            if category:
-                category_name = category.name
+        # Get payee and category names
+        payee_name = transactions[0]["payee_name"] or transactions[0]["payee_str"] or "Unknown"
+        category_name = transactions[0]["category_name"]
 
         # Calculate next expected date
         last_paid = dates[0]
@@ -978,56 +1284,43 @@ def get_sankey_diagram(
     if account_id:
         base_filters.append(TransactionModel.account_id == account_id)
 
-    # Get total income
-    total_income = db.query(func.sum(TransactionModel.amount)).filter(
-        *base_filters,
-        TransactionModel.type == TransactionType.CREDIT
-    ).scalar() or Decimal("0.00")
-
-    # Get total expenses
-    total_expenses = db.query(func.sum(TransactionModel.amount)).filter(
-        *base_filters,
-        TransactionModel.type == TransactionType.DEBIT
-    ).scalar() or Decimal("0.00")
-
-    net_savings = total_income - total_expenses
-
-    # Get income by category
-    income_by_category = db.query(
+    # Income and expenses per category in one scan. Uncategorized amounts
+    # (category columns NULL) count towards the totals but get no node.
+    category_totals = db.query(
         CategoryModel.id,
         CategoryModel.name,
+        TransactionModel.type,
         func.sum(TransactionModel.amount).label("total")
-    ).join(
-        TransactionModel,
+    ).select_from(TransactionModel).outerjoin(
+        CategoryModel,
         TransactionModel.category_id == CategoryModel.id
     ).filter(
         *base_filters,
-        TransactionModel.type == TransactionType.CREDIT
+        TransactionModel.type.in_([TransactionType.CREDIT, TransactionType.DEBIT])
     ).group_by(
-        CategoryModel.id,
-        CategoryModel.name
-    ).order_by(
-        func.sum(TransactionModel.amount).desc()
-    ).all()
-
-    # Get expenses by category
-    expense_by_category = db.query(
         CategoryModel.id,
         CategoryModel.name,
-        func.sum(TransactionModel.amount).label("total")
-    ).join(
-        TransactionModel,
-        TransactionModel.category_id == CategoryModel.id
-    ).filter(
-        *base_filters,
-        TransactionModel.type == TransactionType.DEBIT
-    ).group_by(
-        CategoryModel.id,
-        CategoryModel.name
+        TransactionModel.type
     ).order_by(
         func.sum(TransactionModel.amount).desc()
     ).all()
 
+    total_income = Decimal("0.00")
+    total_expenses = Decimal("0.00")
+    income_by_category = []
+    expense_by_category = []
+    for cat_id, cat_name, txn_type, total in category_totals:
+        if txn_type == TransactionType.CREDIT:
+            total_income += total
+            by_category = income_by_category
+        else:
+            total_expenses += total
+            by_category = expense_by_category
+        if cat_id is not None:
+            by_category.append((cat_id, cat_name, total))
+
+    net_savings = total_income - total_expenses
+
     # Build nodes
     nodes = []
 
@@ -1117,8 +1410,28 @@ def export_transactions_csv(
     if not end_date:
         end_date = date.today()
 
-    # Query transactions
-    query = db.query(TransactionModel).filter(
+    # Query transactions with their account, category and payee names joined
+    # in, as plain rows
+    query = db.query(
+        TransactionModel.date,
+        TransactionModel.description,
+        TransactionModel.amount,
+        TransactionModel.type,
+        TransactionModel.payee,
+        TransactionModel.notes,
+        AccountModel.name.label("account_name"),
+        CategoryModel.name.label("category_name"),
+        PayeeModel.canonical_name.label("payee_name")
+    ).outerjoin(
+        AccountModel,
+        AccountModel.id == TransactionModel.account_id
+    ).outerjoin(
+        CategoryModel,
+        CategoryModel.id == TransactionModel.category_id
+    ).outerjoin(
+        PayeeModel,
+        PayeeModel.id == TransactionModel.payee_id
+    ).filter(
         TransactionModel.user_id == current_user.id,
         TransactionModel.date <= end_date
     )
@@ -1138,50 +1451,31 @@ def export_transactions_csv(
 
     transactions = query.order_by(TransactionModel.date.desc()).all()
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
-        "Date", "Description", "Amount", "Type", "Account", "Category", "Payee", "Notes"
-    ])
-
-    # Write data rows
-    for txn in transactions:
-        # Get account and category names
-        account = db.query(AccountModel).filter(AccountModel.id == txn.account_id).first()
-        category = db.query(CategoryModel).filter(CategoryModel.id == txn.category_id).first() if txn.category_id else None
-
-        # Use linked payee entity name if available, otherwise fall back to legacy payee field
-        payee_name = ""
-        if txn.payee_entity:
-            payee_name = txn.payee_entity.canonical_name
-        elif txn.payee:
-            payee_name = txn.payee
-
-        writer.writerow([
+    # Formatted while the response streams; the rows need no further queries
+    rows = (
+        [
             txn.date.strftime("%Y-%m-%d"),
             txn.description,
             str(txn.amount),
             txn.type.value,
-            account.name if account else "",
-            category.name if category else "",
-            payee_name,
+            txn.account_name or "",
+            txn.category_name or "",
+            # Use linked payee entity name if available, otherwise fall back to legacy payee field
+            txn.payee_name if txn.payee_name is not None else (txn.payee or ""),
             txn.notes or ""
-        ])
+        ]
+        for txn in transactions
+    )
 
-    # Create streaming response
-    output.seek(0)
     if start_date:
         filename = f"transactions_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv"
     else:
         filename = f"transactions_all_to_{end_date.strftime('%Y%m%d')}.csv"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    return _csv_response(
+        filename,
+        ["Date", "Description", "Amount", "Type", "Account", "Category", "Payee", "Notes"],
+        rows
     )
 
 
@@ -1201,52 +1495,28 @@ def export_spending_by_category_csv(
         start_date = date(end_date.year, end_date.month, 1)
 
     # Get spending data
-    total_spending = db.query(func.sum(TransactionModel.amount)).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    ).scalar() or Decimal("0.00")
-
-    category_spending = db.query(
-        CategoryModel.name,
-        func.sum(TransactionModel.amount).label("total"),
-        func.count(TransactionModel.id).label("count")
-    ).join(
-        TransactionModel,
-        TransactionModel.category_id == CategoryModel.id
-    ).filter(
-        TransactionModel.user_id == current_user.id,
-        TransactionModel.type == TransactionType.DEBIT,
-        TransactionModel.date >= start_date,
-        TransactionModel.date <= end_date
-    ).group_by(
+    total_spending, category_spending = _category_spending(
+        db,
+        [
+            TransactionModel.user_id == current_user.id,
+            TransactionModel.type == TransactionType.DEBIT,
+            TransactionModel.date >= start_date,
+            TransactionModel.date <= end_date
+        ],
         CategoryModel.name
-    ).order_by(
-        func.sum(TransactionModel.amount).desc()
-    ).all()
-
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow(["Category", "Amount", "Percentage", "Transaction Count"])
+    )
 
-    for cat_name, total, count in category_spending:
-        percentage = (total / total_spending * 100) if total_spending > 0 else Decimal("0.00")
-        writer.writerow([cat_name, str(total), f"{percentage:.2f}%", count])
+    rows = [
+        [cat_name, str(total), f"{percentage:.2f}%", count]
+        for cat_name, total, count, percentage in category_spending
+    ]
 
     # Add total row
-    writer.writerow(["Total", str(total_spending), "100%", sum(c[2] for c in category_spending)])
+    rows.append(["Total", str(total_spending), "100%", sum(c[2] for c in category_spending)])
 
-    output.seek(0)
     filename = f"spending_by_category_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return _csv_response(filename, ["Category", "Amount", "Percentage", "Transaction Count"], rows)
 
 
 @router.get("/export/income-vs-expenses")
@@ -1260,50 +1530,32 @@ def export_income_vs_expenses_csv(
     end_date = date.today()
     start_date = end_date - relativedelta(months=months)
 
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow(["Month", "Income", "Expenses", "Net", "Savings Rate"])
-
-    for i in range(months):
-        month_date = end_date - relativedelta(months=i)
-        month_start = date(month_date.year, month_date.month, 1)
-        month_end = month_start + relativedelta(months=1) - relativedelta(days=1)
-
-        month_income = db.query(func.sum(TransactionModel.amount)).filter(
-            TransactionModel.user_id == current_user.id,
-            TransactionModel.type == TransactionType.CREDIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
+    month_ranges = _month_ranges(end_date, months)
+    monthly_totals = _monthly_income_expenses(
+        db, [TransactionModel.user_id == current_user.id], month_ranges
+    )
+    rows = []
 
-        month_expenses = db.query(func.sum(TransactionModel.amount)).filter(
-            TransactionModel.user_id == current_user.id,
-            TransactionModel.type == TransactionType.DEBIT,
-            TransactionModel.date >= month_start,
-            TransactionModel.date <= month_end
-        ).scalar() or Decimal("0.00")
+    # Newest month first
+    for month_str, month_start, _ in reversed(month_ranges):
+        month_income, month_expenses = monthly_totals.get(
+            (month_start.year, month_start.month), (Decimal("0.00"), Decimal("0.00"))
+        )
 
         month_net = month_income - month_expenses
         savings_rate = (month_net / month_income * 100) if month_income > 0 else Decimal("0.00")
 
-        writer.writerow([
-            month_start.strftime("%Y-%m"),
+        rows.append([
+            month_str,
             str(month_income),
             str(month_expenses),
             str(month_net),
             f"{savings_rate:.2f}%"
         ])
 
-    output.seek(0)
     filename = f"income_vs_expenses_{months}months.csv"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return _csv_response(filename, ["Month", "Income", "Expenses", "Net", "Savings Rate"], rows)
 
 
 @router.get("/export/net-worth-history")
@@ -1316,7 +1568,7 @@ def export_net_worth_history_csv(
 
     end_date = date.today()
 
-    accounts = db.query(AccountModel).filter(
+    accounts = db.query(*BALANCE_ACCOUNT_COLUMNS).filter(
         AccountModel.user_id == current_user.id,
         AccountModel.is_active == True
     ).all()
@@ -1324,24 +1576,23 @@ def export_net_worth_history_csv(
     asset_types = [AccountType.CHECKING, AccountType.SAVINGS, AccountType.INVESTMENT, AccountType.CASH]
     liability_types = [AccountType.CREDIT_CARD, AccountType.LOAN]
 
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow(["Date", "Total Assets", "Total Liabilities", "Net Worth", "Change"])
-
+    rows = []
     prev_net_worth = None
 
-    for i in range(months - 1, -1, -1):  # Iterate in chronological order
-        month_date = end_date - relativedelta(months=i)
-        if i > 0:
-            month_date = date(month_date.year, month_date.month, 1) - relativedelta(days=1)
+    # Same dates as the net-worth history report: month ends from `months`
+    # months back through two months back, then today
+    month_dates = [month_end for _, _, month_end in _month_ranges(end_date, months + 1)[:months - 1]]
+    month_dates.append(end_date)
+
+    # One aggregate query for every account at every month end
+    balance_history = AccountBalanceService(db).get_balance_history(accounts, month_dates)
 
+    for index, month_date in enumerate(month_dates):
         month_assets = Decimal("0.00")
         month_liabilities = Decimal("0.00")
 
         for account in accounts:
-            balance = account.calculate_balance(db, as_of_date=month_date)
+            balance = balance_history[account.id][index]
             if account.type in asset_types:
                 month_assets += balance
             elif account.type in liability_types:
@@ -1350,7 +1601,7 @@ def export_net_worth_history_csv(
         month_net_worth = month_assets - month_liabilities
         change = (month_net_worth - prev_net_worth) if prev_net_worth is not None else Decimal("0.00")
 
-        writer.writerow([
+        rows.append([
             month_date.strftime("%Y-%m-%d"),
             str(month_assets),
             str(month_liabilities),
@@ -1360,11 +1611,10 @@ def export_net_worth_history_csv(
 
         prev_net_worth = month_net_worth
 
-    output.seek(0)
     filename = f"net_worth_history_{months}months.csv"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    return _csv_response(
+        filename,
+        ["Date", "Total Assets", "Total Liabilities", "Net Worth", "Change"],
+        rows
     )
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from app.api.deps import get_current_active_user, get_db
+from app.services.report_cache_service import invalidate_report_cache
 from app.models.user import User
 from app.models.categorization_rule import CategorizationRule
 from app.models.transaction import Transaction
@@ -271,6 +272,7 @@ def apply_rules(
             skipped += 1
 
     db.commit()
+    invalidate_report_cache(current_user.id)
 
     return BulkApplyRulesResponse(
         total_processed=len(transactions),
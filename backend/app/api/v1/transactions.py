@@ -8,6 +8,7 @@ from sqlalchemy.sql import select
 
 from app.core.database import get_db
 from app.api.deps import get_current_active_user
+from app.services.report_cache_service import invalidate_report_cache
 from app.models.user import User as UserModel
 from app.models.transaction import Transaction as TransactionModel, TransactionType
 from app.models.account import Account as AccountModel
@@ -81,6 +82,7 @@ def create_transaction(
     )
     db.add(db_transaction)
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(db_transaction)
 
     # Increment payee usage after transaction creation
@@ -388,6 +390,7 @@ def update_transaction(
         setattr(transaction, field, value)
 
     db.commit()
+    invalidate_report_cache(current_user.id)
     db.refresh(transaction)
     return _transaction_to_response(transaction)
 
@@ -412,6 +415,7 @@ def delete_transaction(
 
     db.delete(transaction)
     db.commit()
+    invalidate_report_cache(current_user.id)
     return None
 
 
@@ -432,28 +436,22 @@ def get_payee_suggestions(
 
     if q:
         # Use Payee entity search
-        payees = payee_service.search_payees(user_id=current_user.id, query=q, limit=limit)
+        payees = payee_service.search_payee_rows(user_id=current_user.id, query=q, limit=limit)
     else:
         # Get most frequently used payees
-        payees = payee_service.get_all(user_id=current_user.id, skip=0, limit=limit)
+        payees = payee_service.get_all_rows(user_id=current_user.id, skip=0, limit=limit)
 
-    # Enrich with category information
-    results = []
-    for payee in payees:
-        payee_dict = {
+    # Category name is a joined column on each row
+    return [
+        {
             "id": payee.id,
             "canonical_name": payee.canonical_name,
             "default_category_id": payee.default_category_id,
             "transaction_count": payee.transaction_count,
-            "default_category_name": None
+            "default_category_name": payee.default_category_name
         }
-
-        if payee.default_category:
-            payee_dict["default_category_name"] = payee.default_category.name
-
-        results.append(payee_dict)
-
-    return results
+        for payee in payees
+    ]
 
 
 @router.get("/suggestions/category", response_model=Dict[str, Optional[int]])
@@ -0,0 +1,167 @@
+"""
+Shared cache for per-user generation counters and serialized responses.
+
+Production runs several uvicorn workers, so state that every worker must
+see (a generation bumped by a write, a cached response) lives in Redis when
+REDIS_URL is set. Without it (local development, a single process) a
+process-local store is used instead.
+
+A generation is a per-user counter bumped by writes. Callers put the
+current generation in their cache keys, so a write makes every entry
+computed before it unreachable on all workers. If Redis cannot be reached,
+get_generation returns None and callers skip caching rather than risk
+serving stale data.
+"""
+import logging
+import threading
+from typing import Dict, Optional
+
+import redis
+from cachetools import TLRUCache
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Prefix for every key this module writes, so clear() only touches our keys
+KEY_PREFIX = "sharkfin:"
+
+# Keep a slow or unreachable Redis from stalling requests
+REDIS_TIMEOUT_SECONDS = 0.5
+
+# Process-local fallback, used when REDIS_URL is unset. Values are stored as
+# (payload, ttl_seconds) so each entry expires after its own TTL.
+LOCAL_CACHE_SIZE = 1024
+_local_values = TLRUCache(
+    maxsize=LOCAL_CACHE_SIZE,
+    ttu=lambda key, value, now: now + value[1]
+)
+_local_generations: Dict[str, int] = {}
+_local_lock = threading.Lock()
+
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+
+
+def _redis() -> Optional[redis.Redis]:
+    """Get the shared Redis client, or None when REDIS_URL is unset."""
+    global _client
+    if not settings.REDIS_URL:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(
+                    settings.REDIS_URL,
+                    socket_timeout=REDIS_TIMEOUT_SECONDS,
+                    socket_connect_timeout=REDIS_TIMEOUT_SECONDS
+                )
+    return _client
+
+
+def _generation_key(namespace: str, user_id: int) -> str:
+    return f"{KEY_PREFIX}{namespace}:gen:{user_id}"
+
+
+def get_generation(namespace: str, user_id: int) -> Optional[int]:
+    """
+    Get a user's current generation in a namespace.
+
+    Args:
+        namespace: Cache namespace (e.g. "reports", "payees")
+        user_id: User ID
+
+    Returns:
+        Counter that changes after every bump, or None if the shared store
+        is unavailable (callers should not cache in that case)
+    """
+    key = _generation_key(namespace, user_id)
+    client = _redis()
+    if client is None:
+        with _local_lock:
+            return _local_generations.get(key, 0)
+
+    try:
+        value = client.get(key)
+    except redis.RedisError:
+        logger.warning("Redis unavailable; not caching %s for user %s", namespace, user_id, exc_info=True)
+        return None
+    return int(value) if value is not None else 0
+
+
+def bump_generation(namespace: str, user_id: int) -> None:
+    """
+    Bump a user's generation, invalidating entries keyed on the old one.
+
+    Args:
+        namespace: Cache namespace
+        user_id: User ID
+    """
+    key = _generation_key(namespace, user_id)
+    client = _redis()
+    if client is None:
+        with _local_lock:
+            _local_generations[key] = _local_generations.get(key, 0) + 1
+        return
+
+    try:
+        client.incr(key)
+    except redis.RedisError:
+        logger.error("Could not bump %s generation for user %s", namespace, user_id, exc_info=True)
+
+
+def get_value(key: str) -> Optional[bytes]:
+    """
+    Get a cached value.
+
+    Args:
+        key: Cache key (without KEY_PREFIX)
+
+    Returns:
+        Stored bytes, or None on a miss or if the shared store is unavailable
+    """
+    client = _redis()
+    if client is None:
+        with _local_lock:
+            entry = _local_values.get(key)
+        return entry[0] if entry is not None else None
+
+    try:
+        return client.get(KEY_PREFIX + key)
+    except redis.RedisError:
+        logger.warning("Redis unavailable; cache miss for %s", key, exc_info=True)
+        return None
+
+
+def set_value(key: str, value: bytes, ttl_seconds: int) -> None:
+    """
+    Store a value for ttl_seconds.
+
+    Args:
+        key: Cache key (without KEY_PREFIX)
+        value: Serialized value
+        ttl_seconds: Time to live
+    """
+    client = _redis()
+    if client is None:
+        with _local_lock:
+            _local_values[key] = (value, ttl_seconds)
+        return
+
+    try:
+        client.set(KEY_PREFIX + key, value, ex=ttl_seconds)
+    except redis.RedisError:
+        logger.warning("Redis unavailable; not storing %s", key, exc_info=True)
+
+
+def clear() -> None:
+    """Drop every cached value and generation (used by tests)."""
+    with _local_lock:
+        _local_values.clear()
+        _local_generations.clear()
+
+    client = _redis()
+    if client is not None:
+        keys = list(client.scan_iter(match=KEY_PREFIX + "*"))
+        if keys:
+            client.delete(*keys)
@@ -33,6 +33,15 @@ class Settings(BaseSettings):
         """Logo.dev is enabled when an API key is configured."""
         return self.LOGO_DEV_API_KEY is not None
 
+    # Optional: Redis for caches shared by all workers (response caches and the
+    # generation counters that invalidate them). Unset means a per-process
+    # cache, which is only correct with a single worker.
+    REDIS_URL: Optional[str] = None
+
+    # Raise on unexpected relationship lazy loads in the payee pattern list
+    # (guards against N+1 regressions; set to false to fall back to lazy loading)
+    SHARKFIN_RAISELOAD: bool = True
+
     # Application
     APP_NAME: str = "Shark Fin API"
     APP_VERSION: str = "0.1.0"
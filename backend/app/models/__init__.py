@@ -2,6 +2,7 @@ from app.models.user import User
 from app.models.account import Account
 from app.models.category import Category
 from app.models.transaction import Transaction
+from app.models.monthly_category_rollup import MonthlyCategoryRollup
 from app.models.budget import Budget
 from app.models.import_history import ImportHistory, ImportedTransaction
 from app.models.categorization_rule import CategorizationRule
@@ -14,6 +15,7 @@ __all__ = [
     "Account",
     "Category",
     "Transaction",
+    "MonthlyCategoryRollup",
     "Budget",
     "ImportHistory",
     "ImportedTransaction",
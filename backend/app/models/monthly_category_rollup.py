@@ -0,0 +1,85 @@
+"""
+Monthly Category Rollup Model
+
+Per-month, per-category transaction totals used by the multi-month reports.
+Closed months are read from this table instead of re-aggregating the full
+transaction history on every request.
+"""
+from sqlalchemy import Column, Integer, Numeric, Date, DDL, Enum as SQLEnum, event
+from app.core.database import Base
+from app.models.transaction import Transaction, TransactionType
+
+
+class MonthlyCategoryRollup(Base):
+    """
+    SUM(amount) and COUNT(*) of categorized transactions per
+    (user, account, category, type, month).
+
+    Maintained by a trigger on the transactions table, so every write path
+    (ORM, bulk inserts, query deletes and FK cascades) keeps it in sync.
+    Rows are never deleted by the trigger; a row whose transactions are all
+    gone is left with transaction_count = 0 and must be filtered out.
+
+    There are deliberately no foreign keys: cascaded deletes of accounts and
+    categories fire the trigger, which must still be able to upsert the
+    negative delta while the parent row is being removed.
+    """
+    __tablename__ = "monthly_category_rollups"
+
+    user_id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, primary_key=True)
+    category_id = Column(Integer, primary_key=True)
+    type = Column(SQLEnum(TransactionType), primary_key=True)
+    month = Column(Date, primary_key=True)  # First day of the month
+
+    total_amount = Column(Numeric(15, 2), nullable=False, default=0)
+    transaction_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<MonthlyCategoryRollup(user_id={self.user_id}, category_id={self.category_id}, "
+            f"type='{self.type}', month={self.month}, total_amount={self.total_amount})>"
+        )
+
+
+# Trigger keeping the rollup in sync with transactions. Uncategorized
+# transactions are skipped; the reports that use the rollup join categories.
+ROLLUP_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION apply_monthly_category_rollup() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.category_id IS NOT NULL THEN
+        INSERT INTO monthly_category_rollups
+            (user_id, account_id, category_id, type, month, total_amount, transaction_count)
+        VALUES
+            (OLD.user_id, OLD.account_id, OLD.category_id, OLD.type,
+             date_trunc('month', OLD.date)::date, -OLD.amount, -1)
+        ON CONFLICT (user_id, account_id, category_id, type, month) DO UPDATE SET
+            total_amount = monthly_category_rollups.total_amount + EXCLUDED.total_amount,
+            transaction_count = monthly_category_rollups.transaction_count + EXCLUDED.transaction_count;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.category_id IS NOT NULL THEN
+        INSERT INTO monthly_category_rollups
+            (user_id, account_id, category_id, type, month, total_amount, transaction_count)
+        VALUES
+            (NEW.user_id, NEW.account_id, NEW.category_id, NEW.type,
+             date_trunc('month', NEW.date)::date, NEW.amount, 1)
+        ON CONFLICT (user_id, account_id, category_id, type, month) DO UPDATE SET
+            total_amount = monthly_category_rollups.total_amount + EXCLUDED.total_amount,
+            transaction_count = monthly_category_rollups.transaction_count + EXCLUDED.transaction_count;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+ROLLUP_TRIGGER_DDL = """
+CREATE TRIGGER transactions_monthly_category_rollup
+AFTER INSERT OR DELETE OR UPDATE OF user_id, account_id, category_id, type, amount, date
+ON transactions
+FOR EACH ROW EXECUTE PROCEDURE apply_monthly_category_rollup()
+"""
+
+# create_all (used by the tests) has no migrations, so install the trigger
+# whenever the transactions table is created
+event.listen(Transaction.__table__, "after_create", DDL(ROLLUP_FUNCTION_DDL))
+event.listen(Transaction.__table__, "after_create", DDL(ROLLUP_TRIGGER_DDL))
@@ -84,5 +84,10 @@ class Payee(Base):
         Index('idx_payees_autocomplete', 'user_id', 'transaction_count', 'last_used_at'),
     )
 
+    @property
+    def default_category_name(self):
+        """Name of the default category (lets schemas read it via from_attributes)."""
+        return self.default_category.name if self.default_category else None
+
     def __repr__(self):
         return f"<Payee(id={self.id}, name='{self.canonical_name}', user_id={self.user_id})>"
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, Date, Text, Boolean, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, Date, Text, Boolean, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship, backref
 from sqlalchemy.sql import func
 import enum
 from app.core.database import Base
@@ -57,12 +57,42 @@ class Transaction(Base):
 
     # Relationships
     user = relationship("User", back_populates="transactions")
-    account = relationship("Account", foreign_keys=[account_id], backref="transactions")
-    category = relationship("Category", backref="transactions")
+    # The reverse collections are never loaded: balances and reports use
+    # aggregate queries, so iterating account.transactions would be an
+    # accidental N-row load (lazy="raise"). Deletes leave them to the
+    # database's ON DELETE CASCADE / SET NULL (passive_deletes).
+    account = relationship(
+        "Account",
+        foreign_keys=[account_id],
+        backref=backref("transactions", lazy="raise", passive_deletes=True)
+    )
+    category = relationship(
+        "Category",
+        backref=backref("transactions", lazy="raise", passive_deletes=True)
+    )
     transfer_account = relationship("Account", foreign_keys=[transfer_account_id])
 
     # NEW: Payee entity relationship
     payee_entity = relationship("Payee", back_populates="transactions")
 
+    # Indexes for performance
+    __table_args__ = (
+        # Covering index for report aggregations: filter on (user_id, type, date)
+        # and read category/account/amount without touching the heap
+        Index(
+            'idx_transactions_report_cover',
+            'user_id', 'type', 'date',
+            postgresql_include=['category_id', 'account_id', 'amount']
+        ),
+        # Destination side of account balances (transfers into an account);
+        # also serves the ON DELETE SET NULL lookup when an account is deleted
+        Index(
+            'idx_transactions_transfer_account',
+            'transfer_account_id',
+            postgresql_include=['date', 'type', 'amount', 'account_id'],
+            postgresql_where=transfer_account_id.isnot(None)
+        ),
+    )
+
     def __repr__(self):
         return f"<Transaction(id={self.id}, amount={self.amount}, date={self.date}, type='{self.type}')>"
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, Field, model_validator
+from typing import Literal, Optional, List
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -81,6 +81,13 @@ class PayeeStats(BaseModel):
 
 # Pattern Management Schemas
 
+# Pattern types accepted when creating, updating or testing a pattern
+PatternType = Literal["description_contains", "exact_match", "fuzzy_match_base", "description_regex"]
+
+# Shorter description_contains values match too many unrelated descriptions
+MIN_DESCRIPTION_CONTAINS_LENGTH = 4
+
+
 class PayeePatternBase(BaseModel):
     """Base schema for payee matching patterns."""
     pattern_type: str = Field(
@@ -97,12 +104,26 @@ class PayeePatternBase(BaseModel):
 
 class PayeePatternCreate(PayeePatternBase):
     """Schema for creating a new pattern."""
-    pass
+    pattern_type: PatternType = Field(
+        ...,
+        description="Pattern type: description_contains, exact_match, fuzzy_match_base, description_regex"
+    )
+
+    @model_validator(mode="after")
+    def validate_description_contains_length(self) -> "PayeePatternCreate":
+        """Reject description_contains values too short to be selective"""
+        if (self.pattern_type == "description_contains" and
+                len(self.pattern_value) < MIN_DESCRIPTION_CONTAINS_LENGTH):
+            raise ValueError(
+                f"Pattern value must be at least {MIN_DESCRIPTION_CONTAINS_LENGTH} "
+                "characters for description_contains type"
+            )
+        return self
 
 
 class PayeePatternUpdate(BaseModel):
     """Schema for updating a pattern."""
-    pattern_type: Optional[str] = None
+    pattern_type: Optional[PatternType] = None
     pattern_value: Optional[str] = Field(None, min_length=1, max_length=500)
     confidence_score: Optional[Decimal] = Field(
         None,
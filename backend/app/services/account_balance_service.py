@@ -5,12 +5,15 @@ Handles balance calculations for accounts based on transactions.
 All balances are calculated on-the-fly from opening_balance + transactions,
 ensuring single source of truth and data integrity.
 """
-from typing import Dict, Optional
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import date
 from decimal import Decimal
+from sqlalchemy import case, func, literal, or_, union_all
 from sqlalchemy.orm import Session
 
 from app.models.account import Account
+from app.models.transaction import Transaction, TransactionType
 
 
 class AccountBalanceService:
@@ -71,12 +74,151 @@ class AccountBalanceService:
             Dictionary mapping account_id -> current_balance
         """
         accounts = self.db.query(Account).filter(Account.user_id == user_id).all()
+        return self.get_balances(accounts)
 
-        balances = {}
-        for account in accounts:
-            balances[account.id] = account.calculate_balance(self.db)
+    def get_balances(
+        self,
+        accounts: Sequence[Account],
+        as_of_date: Optional[date] = None
+    ) -> Dict[int, Decimal]:
+        """
+        Get balances for several accounts with one aggregate query.
+
+        Bulk equivalent of calling Account.calculate_balance on each account.
+
+        Args:
+            accounts: Accounts to calculate (instances or rows with id and
+                opening_balance)
+            as_of_date: Optional date to calculate balances as of (default: all
+                transactions, like calculate_balance)
+
+        Returns:
+            Dictionary mapping account_id -> balance
+        """
+        if as_of_date is None:
+            totals = self._transaction_totals(accounts, None)
+            return {
+                account.id: account.opening_balance + totals.get((account.id, 0), 0)
+                for account in accounts
+            }
+
+        history = self.get_balance_history(accounts, [as_of_date])
+        return {account_id: balances[0] for account_id, balances in history.items()}
+
+    def get_balance_history(
+        self,
+        accounts: Sequence[Account],
+        as_of_dates: Sequence[date]
+    ) -> Dict[int, List[Decimal]]:
+        """
+        Get balances for several accounts at several dates with one aggregate query.
+
+        Each transaction is bucketed by the first as-of date on or after it, the
+        buckets are summed per account in SQL, and balances are the running
+        totals of those buckets on top of the opening balance. This replaces
+        len(accounts) * len(as_of_dates) calculate_balance queries.
+
+        Args:
+            accounts: Accounts to calculate (instances or rows with id and
+                opening_balance)
+            as_of_dates: Dates to calculate balances as of, in ascending order
+
+        Returns:
+            Dictionary mapping account_id -> balances, one per as_of_date
+        """
+        totals = self._transaction_totals(accounts, as_of_dates)
+        return {
+            account.id: list(accumulate(
+                (totals.get((account.id, bucket), 0) for bucket in range(len(as_of_dates))),
+                initial=account.opening_balance
+            ))[1:]
+            for account in accounts
+        }
+
+    def _transaction_totals(
+        self,
+        accounts: Sequence[Account],
+        as_of_dates: Optional[Sequence[date]]
+    ) -> Dict[Tuple[int, int], Decimal]:
+        """
+        Sum signed transaction amounts per (account, as-of bucket).
+
+        Applies the same sign rules as Account.calculate_balance: credits add,
+        debits subtract, transfers subtract from the source account and add to
+        the destination. Transactions before an account's opening_balance_date
+        are ignored.
+
+        Args:
+            accounts: Accounts to aggregate (instances or rows with id)
+            as_of_dates: Ascending bucket boundaries (inclusive); transactions
+                after the last are excluded. None puts every transaction in
+                bucket 0.
+
+        Returns:
+            Dictionary mapping (account_id, bucket index) -> signed total
+        """
+        account_ids = [account.id for account in accounts]
+        if not account_ids:
+            return {}
+
+        if as_of_dates:
+            bucket = case(*[
+                (Transaction.date <= as_of, index)
+                for index, as_of in enumerate(as_of_dates)
+            ])
+        else:
+            bucket = literal(0)
+
+        # Source side (account_id) and destination side (transfer_account_id).
+        # A transaction is counted once per account even if both sides match,
+        # so the destination side skips self-transfers.
+        sides = []
+        for account_column, transfer_amount, extra_filters in (
+            (Transaction.account_id, -Transaction.amount, []),
+            (
+                Transaction.transfer_account_id,
+                Transaction.amount,
+                [Transaction.account_id != Transaction.transfer_account_id]
+            ),
+        ):
+            signed_amount = case(
+                (Transaction.type == TransactionType.CREDIT, Transaction.amount),
+                (Transaction.type == TransactionType.DEBIT, -Transaction.amount),
+                (Transaction.type == TransactionType.TRANSFER, transfer_amount),
+                else_=0
+            )
+            query = self.db.query(
+                account_column.label("account_id"),
+                bucket.label("bucket"),
+                signed_amount.label("amount")
+            ).join(
+                Account, Account.id == account_column
+            ).filter(
+                account_column.in_(account_ids),
+                or_(
+                    Account.opening_balance_date.is_(None),
+                    Transaction.date >= Account.opening_balance_date
+                ),
+                *extra_filters
+            )
+            if as_of_dates:
+                query = query.filter(Transaction.date <= as_of_dates[-1])
+            sides.append(query.statement)
+
+        # Both sides in one round trip, grouped in an outer query: the bucket
+        # CASE carries bound parameters, which can't be repeated in a GROUP BY
+        signed = union_all(*sides).subquery()
+        rows = self.db.query(
+            signed.c.account_id,
+            signed.c.bucket,
+            func.sum(signed.c.amount)
+        ).group_by(signed.c.account_id, signed.c.bucket)
 
-        return balances
+        return {
+            (account_id, bucket_index): amount
+            for account_id, bucket_index, amount in rows
+            if amount
+        }
 
     def recalculate_opening_balance(
         self,
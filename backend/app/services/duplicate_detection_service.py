@@ -1,5 +1,6 @@
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable, Set
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from app.models.transaction import Transaction
@@ -32,49 +33,53 @@ class DuplicateDetectionService:
         - Medium (0.70-0.85): Within 2 days, exact amount, somewhat similar description
         """
         duplicates = []
-
-        for idx, new_txn in enumerate(new_transactions):
+        if not new_transactions:
+            return duplicates
+
+        # Exact FITID matches for the whole batch (one query)
+        existing_by_fitid = self._get_transactions_by_fitid(
+            user_id,
+            account_id,
+            (t.get('fitid') for t in new_transactions)
+        )
+
+        # Candidates for fuzzy matching: every existing transaction inside the
+        # batch's date window (±2 days) with an amount that appears in the
+        # batch, loaded once and grouped by amount for in-memory lookup
+        parsed = [
+            (datetime.strptime(t['date'], '%Y-%m-%d').date(), abs(float(t['amount'])))
+            for t in new_transactions
+        ]
+        candidates_by_amount = self._get_candidates_by_amount(
+            user_id,
+            account_id,
+            min(d for d, _ in parsed) - timedelta(days=2),
+            max(d for d, _ in parsed) + timedelta(days=2),
+            {a for _, a in parsed}
+        )
+
+        for idx, (new_txn, (txn_date, amount)) in enumerate(zip(new_transactions, parsed)):
             # First check for exact FITID match (OFX/QFX imports)
-            fitid = new_txn.get('fitid')
-            if fitid and self.check_fitid_duplicate(user_id, account_id, fitid):
+            existing_txn = existing_by_fitid.get(new_txn.get('fitid'))
+            if existing_txn:
                 # FITID match is 100% confidence - exact duplicate
-                existing_txn = self.db.query(Transaction).filter(
-                    and_(
-                        Transaction.user_id == user_id,
-                        Transaction.account_id == account_id,
-                        Transaction.fitid == fitid
-                    )
-                ).first()
-
-                if existing_txn:
-                    duplicates.append(PotentialDuplicate(
-                        existing_transaction_id=existing_txn.id,
-                        existing_date=existing_txn.date.isoformat(),
-                        existing_amount=str(existing_txn.amount),
-                        existing_description=existing_txn.description,
-                        new_transaction={'row': new_txn.get('row', idx), **new_txn},
-                        confidence_score=1.00
-                    ))
-                    continue  # Skip fuzzy matching for exact FITID matches
+                duplicates.append(PotentialDuplicate(
+                    existing_transaction_id=existing_txn.id,
+                    existing_date=existing_txn.date.isoformat(),
+                    existing_amount=str(existing_txn.amount),
+                    existing_description=existing_txn.description,
+                    new_transaction={'row': new_txn.get('row', idx), **new_txn},
+                    confidence_score=1.00
+                ))
+                continue  # Skip fuzzy matching for exact FITID matches
 
             # Fuzzy matching: date + amount + description
-            txn_date = datetime.strptime(new_txn['date'], '%Y-%m-%d').date()
-            amount = float(new_txn['amount'])
-
-            # Query existing transactions within ±2 days with exact amount match
-            # Check against ALL transactions in the account, not just recent imports
-            existing = self.db.query(Transaction).filter(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.account_id == account_id,
-                    Transaction.date >= txn_date - timedelta(days=2),
-                    Transaction.date <= txn_date + timedelta(days=2),
-                    Transaction.amount == abs(amount)
-                )
-            ).all()
-
-            # Check for fuzzy description match
-            for existing_txn in existing:
+            # Existing transactions within ±2 days with exact amount match
+            # (checks ALL transactions in the account, not just recent imports)
+            for existing_txn in candidates_by_amount.get(amount, ()):
+                if abs((existing_txn.date - txn_date).days) > 2:
+                    continue
+
                 confidence = self._calculate_confidence(new_txn, existing_txn)
 
                 if confidence >= 0.70:  # 70% confidence threshold
@@ -89,6 +94,54 @@ class DuplicateDetectionService:
 
         return duplicates
 
+    def _get_transactions_by_fitid(
+        self,
+        user_id: int,
+        account_id: int,
+        fitids: Iterable[str]
+    ) -> Dict[str, Transaction]:
+        """Load existing transactions matching any of the FITIDs, keyed by FITID"""
+        incoming = {fitid for fitid in fitids if fitid}
+        if not incoming:
+            return {}
+
+        existing = self.db.query(Transaction).filter(
+            and_(
+                Transaction.user_id == user_id,
+                Transaction.account_id == account_id,
+                Transaction.fitid.in_(incoming)
+            )
+        ).order_by(Transaction.id).all()
+
+        by_fitid = {}
+        for txn in existing:
+            by_fitid.setdefault(txn.fitid, txn)
+        return by_fitid
+
+    def _get_candidates_by_amount(
+        self,
+        user_id: int,
+        account_id: int,
+        start_date: date,
+        end_date: date,
+        amounts: Set[float]
+    ) -> Dict[float, List[Transaction]]:
+        """Load fuzzy-match candidates in a date window, grouped by amount"""
+        existing = self.db.query(Transaction).filter(
+            and_(
+                Transaction.user_id == user_id,
+                Transaction.account_id == account_id,
+                Transaction.date >= start_date,
+                Transaction.date <= end_date,
+                Transaction.amount.in_(amounts)
+            )
+        ).order_by(Transaction.id).all()
+
+        by_amount = defaultdict(list)
+        for txn in existing:
+            by_amount[float(txn.amount)].append(txn)
+        return by_amount
+
     def _calculate_confidence(self, new_txn: Dict[str, Any], existing_txn: Transaction) -> float:
         """Calculate duplicate confidence score (0.0 to 1.0)"""
         score = 0.0
@@ -141,3 +194,29 @@ class DuplicateDetectionService:
         ).first()
 
         return existing is not None
+
+    def get_existing_fitids(
+        self,
+        user_id: int,
+        account_id: int,
+        fitids: Iterable[str]
+    ) -> Set[str]:
+        """
+        Return the subset of FITIDs that already exist in the account.
+
+        Resolves the whole batch with a single indexed IN query, so import loops
+        can skip exact duplicates without a per-row lookup.
+        """
+        incoming = {fitid for fitid in fitids if fitid}
+        if not incoming:
+            return set()
+
+        rows = self.db.query(Transaction.fitid).filter(
+            and_(
+                Transaction.user_id == user_id,
+                Transaction.account_id == account_id,
+                Transaction.fitid.in_(incoming)
+            )
+        ).all()
+
+        return {row.fitid for row in rows}
@@ -1,14 +1,95 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple, BinaryIO
+import math
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 import chardet
-import gzip
+import hashlib
+import logging
+import sys
+import threading
+from chardet.universaldetector import UniversalDetector
+from isal import igzip
 from io import BytesIO, StringIO
 from datetime import datetime
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 from app.models.import_history import ImportHistory, ImportedTransaction
-from app.models.transaction import Transaction
+from app.models.transaction import Transaction, TransactionType
 from app.schemas.imports import CSVColumnMapping
 from app.services.duplicate_detection_service import DuplicateDetectionService
+from app.services.ofx_service import OFXService
+
+logger = logging.getLogger(__name__)
+
+# Read size when streaming uploads (encoding detection, compression)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Date formats tried in order when parsing CSV dates
+DATE_FORMATS = [
+    '%Y-%m-%d',      # 2024-01-15
+    '%m/%d/%Y',      # 01/15/2024
+    '%m/%d/%y',      # 01/15/24
+    '%d/%m/%Y',      # 15/01/2024
+    '%Y/%m/%d',      # 2024/01/15
+    '%m-%d-%Y',      # 01-15-2024
+    '%d-%m-%Y',      # 15-01-2024
+    '%b %d, %Y',     # Jan 15, 2024
+    '%B %d, %Y',     # January 15, 2024
+    '%d %b %Y',      # 15 Jan 2024
+    '%Y%m%d',        # 20240115
+]
+
+# Mapped transaction type by "amount is negative" (object array keeps plain str values)
+TRANSACTION_TYPE_LABELS = np.array(['CREDIT', 'DEBIT'], dtype=object)
+
+# Rows parsed for the CSV preview (sample rows, format and mapping detection)
+PREVIEW_MAX_ROWS = 200
+
+# Parsed uploads keyed by (kind, user_id, content digest). The import wizard
+# sends the same file to preview, duplicate detection, payee analysis and
+# execute; only the first request pays for parsing. Cached values are shared
+# between requests, so callers must treat them as read-only.
+# The cache is bounded by the parsed results' memory, per worker process;
+# a single result over PARSED_UPLOAD_CACHE_MAX_ENTRY_BYTES is not cached, so
+# one large upload can't evict everyone else's.
+PARSED_UPLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+PARSED_UPLOAD_CACHE_MAX_ENTRY_BYTES = 64 * 1024 * 1024
+PARSED_UPLOAD_CACHE_TTL_SECONDS = 900
+# Entries are (result, size in bytes), sized once when they are stored
+_parsed_upload_cache = TTLCache(
+    maxsize=PARSED_UPLOAD_CACHE_MAX_BYTES,
+    ttl=PARSED_UPLOAD_CACHE_TTL_SECONDS,
+    getsizeof=lambda entry: entry[1]
+)
+_parsed_upload_cache_lock = threading.Lock()
+
+
+def _parsed_upload_size(value: Any) -> int:
+    """
+    Approximate memory held by a parsed upload.
+
+    Args:
+        value: Parsed DataFrame, or OFX parse result (dicts/lists of scalars)
+
+    Returns:
+        Size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _parsed_upload_size(k) + _parsed_upload_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_parsed_upload_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+# ISA-L gzip level (0-3) for stored import files - level 1 is its fast
+# deflate path, still well ahead of zlib -3 in speed at a similar ratio.
+# Output is standard gzip, so stdlib gzip can still read it.
+FILE_COMPRESSLEVEL = 1
 
 
 class ImportService:
@@ -144,124 +225,385 @@ class ImportService:
 
         return mapping
 
+    def detect_csv_encoding_stream(self, file_obj: BinaryIO) -> str:
+        """
+        Detect file encoding by feeding a file object to chardet in chunks.
+
+        Gives the same answer as detect_csv_encoding without holding the whole
+        upload in memory, and stops early once chardet is confident.
+
+        Args:
+            file_obj: Binary file object positioned anywhere (rewound first)
+
+        Returns:
+            Detected encoding name (defaults to utf-8)
+        """
+        detector = UniversalDetector()
+        file_obj.seek(0)
+        for chunk in iter(lambda: file_obj.read(UPLOAD_CHUNK_SIZE), b''):
+            detector.feed(chunk)
+            if detector.done:
+                break
+        detector.close()
+        file_obj.seek(0)
+        return detector.result['encoding'] or 'utf-8'
+
     def parse_csv(self, file_bytes: bytes) -> pd.DataFrame:
         """Parse CSV with smart encoding detection"""
-        encoding = self.detect_csv_encoding(file_bytes)
+        return self.parse_csv_file(BytesIO(file_bytes))
+
+    def parse_csv_file(self, file_obj: BinaryIO, nrows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Parse CSV from a binary file object with smart encoding detection.
+
+        Lets routes hand pandas the spooled upload file directly instead of
+        reading the whole upload into a bytes object first.
+
+        Args:
+            file_obj: Binary file object (e.g. UploadFile.file)
+            nrows: Only parse this many data rows (None parses the whole file)
+
+        Returns:
+            Parsed DataFrame with stripped column names
+        """
+        encoding = self.detect_csv_encoding_stream(file_obj)
 
         try:
             # Try with detected encoding
-            df = pd.read_csv(BytesIO(file_bytes), encoding=encoding)
+            df = pd.read_csv(file_obj, encoding=encoding, nrows=nrows)
         except Exception:
             # Fallback to UTF-8 with error handling
             try:
-                df = pd.read_csv(BytesIO(file_bytes), encoding='utf-8', encoding_errors='ignore')
+                file_obj.seek(0)
+                df = pd.read_csv(file_obj, encoding='utf-8', encoding_errors='ignore', nrows=nrows)
             except Exception:
                 # Last resort: Latin-1 (accepts all byte sequences)
-                df = pd.read_csv(BytesIO(file_bytes), encoding='latin-1')
+                file_obj.seek(0)
+                df = pd.read_csv(file_obj, encoding='latin-1', nrows=nrows)
 
         # Clean column names
         df.columns = df.columns.str.strip()
 
         return df
 
+    def parse_csv_preview(
+        self,
+        file_obj: BinaryIO,
+        max_rows: int = PREVIEW_MAX_ROWS
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Parse just the head of a CSV for the preview step.
+
+        Columns, sample rows and format detection only need the first few
+        rows, so the rest of the file is line-counted instead of parsed.
+
+        Args:
+            file_obj: Binary file object (e.g. UploadFile.file)
+            max_rows: Number of data rows to parse
+
+        Returns:
+            Tuple of (DataFrame with at most max_rows rows, total data row count)
+        """
+        df = self.parse_csv_file(file_obj, nrows=max_rows)
+        if len(df) < max_rows:
+            # Whole file fit in the preview - the parsed count is exact
+            return df, len(df)
+
+        return df, self.count_csv_rows(file_obj)
+
+    @staticmethod
+    def count_csv_rows(file_obj: BinaryIO) -> int:
+        """
+        Count data rows in a CSV by counting line breaks (rewound before and after).
+
+        Quoted fields containing newlines and blank lines are counted as rows,
+        which is close enough for the preview's row count.
+
+        Args:
+            file_obj: Binary file object
+
+        Returns:
+            Number of lines after the header
+        """
+        file_obj.seek(0)
+        lines = 0
+        last_byte = b'\n'
+        for chunk in iter(lambda: file_obj.read(UPLOAD_CHUNK_SIZE), b''):
+            lines += chunk.count(b'\n')
+            last_byte = chunk[-1:]
+        file_obj.seek(0)
+
+        if last_byte != b'\n':
+            # Final line has no trailing newline
+            lines += 1
+        return max(lines - 1, 0)
+
+    @staticmethod
+    def file_digest(file_obj: BinaryIO) -> str:
+        """
+        Hash a file object in chunks (rewound before and after).
+
+        Args:
+            file_obj: Binary file object
+
+        Returns:
+            Hex blake2b digest of the contents
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        file_obj.seek(0)
+        for chunk in iter(lambda: file_obj.read(UPLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        file_obj.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _get_or_parse_upload(key: Tuple, parse):
+        """Return the cached parse result for key, parsing and caching on a miss"""
+        with _parsed_upload_cache_lock:
+            cached = _parsed_upload_cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        result = parse()
+        size = _parsed_upload_size(result)
+        if size <= PARSED_UPLOAD_CACHE_MAX_ENTRY_BYTES:
+            with _parsed_upload_cache_lock:
+                _parsed_upload_cache[key] = (result, size)
+        return result
+
+    def parse_csv_upload(self, user_id: int, file_obj: BinaryIO) -> pd.DataFrame:
+        """
+        Parse an uploaded CSV, reusing the result of an earlier request for the same file.
+
+        Args:
+            user_id: User who uploaded the file
+            file_obj: Binary file object (e.g. UploadFile.file)
+
+        Returns:
+            Parsed DataFrame (shared - do not modify)
+        """
+        key = ('csv', user_id, self.file_digest(file_obj))
+        return self._get_or_parse_upload(key, lambda: self.parse_csv_file(file_obj))
+
+    @classmethod
+    def parse_ofx_upload(cls, user_id: int, file_bytes: bytes) -> Dict[str, Any]:
+        """
+        Parse an uploaded OFX/QFX, reusing the result of an earlier request for the same file.
+
+        Args:
+            user_id: User who uploaded the file
+            file_bytes: Raw file contents
+
+        Returns:
+            Result of OFXService.parse_ofx (shared - do not modify)
+        """
+        key = ('ofx', user_id, hashlib.blake2b(file_bytes, digest_size=16).hexdigest())
+        return cls._get_or_parse_upload(key, lambda: OFXService.parse_ofx(file_bytes))
+
+    @staticmethod
+    def compress_bytes(data: bytes) -> bytes:
+        """
+        Gzip an in-memory upload for storage on the import record.
+
+        Args:
+            data: Original file contents
+
+        Returns:
+            Compressed bytes
+        """
+        return igzip.compress(data, compresslevel=FILE_COMPRESSLEVEL)
+
+    @staticmethod
+    def compress_file(file_obj: BinaryIO) -> Tuple[bytes, int]:
+        """
+        Gzip a file object chunk by chunk for storage on the import record.
+
+        Args:
+            file_obj: Binary file object (rewound before and after)
+
+        Returns:
+            Tuple of (compressed bytes, original size in bytes)
+        """
+        buffer = BytesIO()
+        original_size = 0
+        file_obj.seek(0)
+        with igzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=FILE_COMPRESSLEVEL) as gz:
+            for chunk in iter(lambda: file_obj.read(UPLOAD_CHUNK_SIZE), b''):
+                original_size += len(chunk)
+                gz.write(chunk)
+        file_obj.seek(0)
+        return buffer.getvalue(), original_size
+
     def map_csv_to_transactions(
         self,
         df: pd.DataFrame,
         column_mapping: CSVColumnMapping,
-        skip_rows: List[int] = None
+        skip_rows: Iterable[int] = None
     ) -> List[Dict[str, Any]]:
-        """Map CSV rows to transaction dictionaries using column mapping"""
-        transactions = []
-        skip_rows = skip_rows or []
+        """
+        Map CSV rows to transaction dictionaries using column mapping.
 
-        for idx, row in df.iterrows():
-            if idx in skip_rows:
-                continue
+        Amounts, dates and debit/credit classification are computed as whole
+        column operations; Python dicts are only built for the rows that
+        survive, in a single to_dict('records') call at the end.
 
-            # Extract fields based on mapping
-            try:
-                date_str = str(row[column_mapping.date]).strip()
-
-                # Handle amount - check if it's split debit/credit columns
-                if '|' in column_mapping.amount:
-                    # Split column format: "Withdrawal|Deposit"
-                    debit_col, credit_col = column_mapping.amount.split('|')
-                    debit_val = str(row[debit_col]).strip() if debit_col in row.index else ''
-                    credit_val = str(row[credit_col]).strip() if credit_col in row.index else ''
-
-                    # Parse both values - _parse_amount now returns None for invalid/NaN values
-                    debit_amount = self._parse_amount(debit_val) if debit_val and debit_val.lower() not in ['nan', 'none', ''] else None
-                    credit_amount = self._parse_amount(credit_val) if credit_val and credit_val.lower() not in ['nan', 'none', ''] else None
-
-                    # Determine net amount and type
-                    if debit_amount is not None and debit_amount > 0:
-                        amount = -abs(debit_amount)  # Withdrawal is negative
-                    elif credit_amount is not None and credit_amount > 0:
-                        amount = abs(credit_amount)  # Deposit is positive
-                    else:
-                        continue  # Skip if both are empty/zero/invalid
-                else:
-                    # Single amount column
-                    amount_str = str(row[column_mapping.amount]).strip()
-                    amount = self._parse_amount(amount_str)
-                    if amount is None:
-                        continue  # Skip invalid amounts
-
-                # Parse date
-                trans_date = self._parse_date(date_str)
-                if not trans_date:
-                    continue  # Skip invalid dates
-
-                # Final safety check: ensure amount is a valid finite number
-                import math
-                if not isinstance(amount, (int, float)) or math.isnan(amount) or math.isinf(amount):
-                    continue  # Skip if amount is somehow invalid
-
-                transaction = {
-                    'date': trans_date.strftime('%Y-%m-%d'),
-                    'amount': abs(amount),  # Store as positive
-                    'type': 'DEBIT' if amount < 0 else 'CREDIT',
-                    'row': idx,
-                }
+        Args:
+            df: Parsed CSV (from parse_csv)
+            column_mapping: Which CSV columns hold each transaction field
+            skip_rows: Row indexes to leave out
 
-                # Optional fields
-                if column_mapping.description and column_mapping.description in row:
-                    transaction['description'] = str(row[column_mapping.description]).strip()[:500]
+        Returns:
+            List of transaction dicts with date, amount, type, row and any
+            mapped optional fields
+        """
+        columns = set(df.columns)
+        is_split = '|' in column_mapping.amount
+
+        # Required columns missing means no row can be mapped
+        required = [column_mapping.date]
+        if not is_split:
+            required.append(column_mapping.amount)
+        missing = [col for col in required if col not in columns]
+        if missing:
+            logger.warning("CSV mapping references missing column(s) %s", missing)
+            return []
+
+        if is_split:
+            # Split column format: "Withdrawal|Deposit"
+            debit_col, credit_col = column_mapping.amount.split('|', 1)
+            no_amounts = np.full(len(df), np.nan)
+            debits = self._parse_amount_column(df[debit_col]) if debit_col in columns else no_amounts
+            credits = self._parse_amount_column(df[credit_col]) if credit_col in columns else no_amounts
+
+            # Withdrawal is negative, deposit positive; rows with neither are dropped
+            amounts = np.where(
+                debits > 0,
+                -np.abs(debits),
+                np.where(credits > 0, np.abs(credits), np.nan)
+            )
+        else:
+            amounts = self._parse_amount_column(df[column_mapping.amount])
+
+        keep = np.isfinite(amounts)
+        if skip_rows:
+            keep &= ~df.index.isin(list(skip_rows))
+
+        # Only parse dates for rows that are still candidates
+        dates = self._parse_date_column(df[column_mapping.date][keep])
+        keep[keep] = dates.notna().to_numpy()
+        dates = dates[dates.notna()]
+
+        kept_amounts = amounts[keep]
+        mapped = pd.DataFrame({
+            'date': dates.to_numpy(dtype=object),
+            'amount': np.abs(kept_amounts),  # Store as positive
+            'type': TRANSACTION_TYPE_LABELS[(kept_amounts < 0).astype(np.intp)],
+            'row': df.index[keep].to_numpy(),
+        })
+
+        # Optional fields
+        for field, col, max_length in (
+            ('description', column_mapping.description, 500),
+            ('payee', column_mapping.payee, 200),
+            ('notes', column_mapping.notes, 1000),
+        ):
+            if col and col in columns:
+                mapped[field] = self._text_column(df[col][keep], max_length).to_numpy()
+
+        return mapped.to_dict('records')
+
+    @staticmethod
+    def _text_column(values: pd.Series, max_length: int) -> pd.Series:
+        """Stringify, strip and truncate a whole column"""
+        return values.astype(str).str.strip().str[:max_length]
+
+    @staticmethod
+    def _parse_amount_column(values: pd.Series) -> np.ndarray:
+        """
+        Parse a whole amount column, vectorized counterpart of _parse_amount.
 
-                if column_mapping.payee and column_mapping.payee in row:
-                    transaction['payee'] = str(row[column_mapping.payee]).strip()[:200]
+        Args:
+            values: Raw CSV column
 
-                if column_mapping.notes and column_mapping.notes in row:
-                    transaction['notes'] = str(row[column_mapping.notes]).strip()[:1000]
+        Returns:
+            float64 array with NaN wherever the amount is missing or invalid
+        """
+        if is_numeric_dtype(values) and not is_bool_dtype(values):
+            amounts = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            # Remove common currency symbols and whitespace
+            cleaned = (
+                values.astype(str).str.strip()
+                .str.replace('$', '', regex=False)
+                .str.replace(',', '', regex=False)
+                .str.replace(' ', '', regex=False)
+            )
+
+            # Handle parentheses for negative amounts
+            negative = cleaned.str.startswith('(') & cleaned.str.endswith(')')
+            cleaned = cleaned.where(~negative, '-' + cleaned.str[1:-1])
 
-                transactions.append(transaction)
+            amounts = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
 
-            except Exception as e:
-                # Skip rows with errors - log details for debugging
-                print(f"Error parsing row {idx}: {e}")
-                print(f"  Row data: {row.to_dict() if hasattr(row, 'to_dict') else row}")
-                continue
+        # Treat infinity the same as unparseable
+        return np.where(np.isfinite(amounts), amounts, np.nan)
+
+    def _parse_date_column(self, values: pd.Series) -> pd.Series:
+        """
+        Parse a whole date column, vectorized counterpart of _parse_date.
+
+        Each format in DATE_FORMATS is tried in order on the values that are
+        still unparsed, matching _parse_date's first-format-wins behaviour.
+        Values pandas can't handle fall back to _parse_date.
+
+        Args:
+            values: Raw CSV column
+
+        Returns:
+            Series of 'YYYY-MM-DD' strings aligned with values (None where invalid)
+        """
+        values = values.astype(str).str.strip()
+        parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+
+        for fmt in DATE_FORMATS:
+            pending = parsed.isna()
+            if not pending.any():
+                break
+            parsed[pending] = pd.to_datetime(values[pending], format=fmt, errors='coerce')
 
-        return transactions
+        formatted = parsed.dt.strftime('%Y-%m-%d').astype(object)
+        formatted = formatted.where(parsed.notna(), None)
+
+        for idx in formatted.index[parsed.isna()]:
+            trans_date = self._parse_date(values.at[idx])
+            if trans_date:
+                formatted.at[idx] = trans_date.strftime('%Y-%m-%d')
+
+        return formatted
+
+    @staticmethod
+    def finite_amount_mask(transactions: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Flag which mapped transactions carry a usable amount.
+
+        Runs a single vectorized isfinite pass instead of per-row NaN/inf checks.
+        Missing amounts (None) are treated as invalid.
+
+        Args:
+            transactions: Mapped transaction dicts (from map_csv_to_transactions)
+
+        Returns:
+            Boolean array aligned with transactions; True where amount is finite
+        """
+        amounts = np.array(
+            [t.get('amount') for t in transactions],
+            dtype=np.float64
+        )
+        return np.isfinite(amounts)
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string with multiple format attempts"""
-        # Common date formats
-        formats = [
-            '%Y-%m-%d',      # 2024-01-15
-            '%m/%d/%Y',      # 01/15/2024
-            '%m/%d/%y',      # 01/15/24
-            '%d/%m/%Y',      # 15/01/2024
-            '%Y/%m/%d',      # 2024/01/15
-            '%m-%d-%Y',      # 01-15-2024
-            '%d-%m-%Y',      # 15-01-2024
-            '%b %d, %Y',     # Jan 15, 2024
-            '%B %d, %Y',     # January 15, 2024
-            '%d %b %Y',      # 15 Jan 2024
-            '%Y%m%d',        # 20240115
-        ]
-
-        for fmt in formats:
+        for fmt in DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -286,7 +628,6 @@ class ImportService:
             result = float(cleaned)
 
             # Explicitly check for NaN and infinity
-            import math
             if math.isnan(result) or math.isinf(result):
                 return None
 
@@ -302,7 +643,8 @@ class ImportService:
         import_type: str,
         total_rows: int,
         file_size: int = 0,
-        file_data: Optional[bytes] = None
+        file_data: Optional[bytes] = None,
+        compressed_file_data: Optional[bytes] = None
     ) -> ImportHistory:
         """
         Create import history record with optional original file storage.
@@ -315,6 +657,8 @@ class ImportService:
             total_rows: Total number of rows/transactions
             file_size: Original file size in bytes
             file_data: Original file contents (will be compressed with gzip)
+            compressed_file_data: Already gzipped original file (from compress_file);
+                file_size is then used as the original size
 
         Returns:
             ImportHistory record
@@ -324,9 +668,13 @@ class ImportService:
         original_file_size = None
         is_compressed = False
 
-        if file_data:
+        if compressed_file_data:
+            original_file_size = file_size
+            compressed_data = compressed_file_data
+            is_compressed = True
+        elif file_data:
             original_file_size = len(file_data)
-            compressed_data = gzip.compress(file_data, compresslevel=9)
+            compressed_data = self.compress_bytes(file_data)
             is_compressed = True
 
         import_record = ImportHistory(
@@ -346,20 +694,95 @@ class ImportService:
         self.db.refresh(import_record)
         return import_record
 
+    def build_transaction_row(
+        self,
+        user_id: int,
+        account_id: int,
+        trans_data: Dict[str, Any],
+        payee_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        include_payee_text: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Build a raw ``transactions`` column dict for bulk insertion.
+
+        Every row carries the same keys so the batch can be sent as a single
+        executemany statement.
+        """
+        return {
+            'user_id': user_id,
+            'account_id': account_id,
+            'amount': trans_data['amount'],
+            'type': TransactionType[trans_data['type']],
+            'date': trans_data['date'],
+            'description': trans_data.get('description'),
+            'payee': trans_data.get('payee') if include_payee_text else None,
+            'payee_id': payee_id,
+            'category_id': category_id,
+            'fitid': trans_data.get('fitid'),
+            'notes': trans_data.get('notes'),
+        }
+
+    def bulk_insert_transactions(
+        self,
+        import_id: int,
+        rows: List[Dict[str, Any]],
+        row_numbers: List[int]
+    ) -> List[int]:
+        """
+        Insert transactions and their import links without building ORM objects.
+
+        Args:
+            import_id: ImportHistory ID the transactions belong to
+            rows: Column dicts from build_transaction_row
+            row_numbers: Original file row number for each entry in rows
+
+        Returns:
+            IDs of the inserted transactions, in the same order as rows
+        """
+        if not rows:
+            return []
+
+        transactions_table = Transaction.__table__
+        transaction_ids = self.db.execute(
+            transactions_table.insert().returning(
+                transactions_table.c.id,
+                sort_by_parameter_order=True
+            ),
+            rows
+        ).scalars().all()
+
+        self.db.execute(
+            ImportedTransaction.__table__.insert(),
+            [
+                {
+                    'import_id': import_id,
+                    'transaction_id': transaction_id,
+                    'row_number': row_number,
+                }
+                for transaction_id, row_number in zip(transaction_ids, row_numbers)
+            ]
+        )
+
+        return transaction_ids
+
     def complete_import_record(
         self,
         import_id: int,
         imported_count: int,
         duplicate_count: int,
         error_count: int,
-        status: str = "completed"
+        status: str = "completed",
+        error_message: Optional[str] = None
     ):
-        """Update import record with final counts"""
+        """Update import record with final counts (and a summary of failed rows, if any)"""
         import_record = self.db.query(ImportHistory).filter(ImportHistory.id == import_id).first()
         if import_record:
             import_record.imported_count = imported_count
             import_record.duplicate_count = duplicate_count
             import_record.error_count = error_count
             import_record.status = status
+            if error_message:
+                import_record.error_message = error_message
             import_record.completed_at = datetime.utcnow()
             self.db.commit()
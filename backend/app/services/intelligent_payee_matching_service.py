@@ -4,7 +4,7 @@ Intelligent Payee Matching Service
 Provides smart payee matching during imports using:
 1. Known merchant patterns (known_merchants.json)
 2. User's learned patterns (from previous imports)
-3. Fuzzy string matching (Levenshtein distance)
+3. Fuzzy string matching (Levenshtein ratio, batched via RapidFuzz)
 
 Classifies matches into three confidence tiers:
 - HIGH_CONFIDENCE (0.85+): Auto-apply with user review option
@@ -13,8 +13,10 @@ Classifies matches into three confidence tiers:
 """
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from Levenshtein import ratio
+from rapidfuzz import fuzz, process
+from app.models.category import Category
 from app.models.payee import Payee
 from app.models.payee_matching_pattern import PayeeMatchingPattern
 from app.services.payee_extraction_service import PayeeExtractionService
@@ -83,6 +85,7 @@ class IntelligentPayeeMatchingService:
         self.db = db
         self.extraction_service = PayeeExtractionService(db)
         self._pattern_cache = {}  # Cache patterns during import analysis
+        self._fuzzy_choices_cache = {}  # id(payees) -> (eligible payees, lowercased names)
 
     def analyze_transactions_for_import(
         self,
@@ -226,8 +229,15 @@ class IntelligentPayeeMatchingService:
         self._pattern_cache[user_id] = patterns
 
     def _get_user_payees(self, user_id: int) -> List[Payee]:
-        """Get all user's payees for fuzzy matching."""
-        return self.db.query(Payee).filter(
+        """
+        Get all user's payees for fuzzy matching.
+
+        The default category is joined in, since every matched payee's category
+        name becomes the suggested category.
+        """
+        return self.db.query(Payee).options(
+            joinedload(Payee.default_category).load_only(Category.name)
+        ).filter(
             Payee.user_id == user_id
         ).all()
 
@@ -324,26 +334,42 @@ class IntelligentPayeeMatchingService:
         if not extracted_name or len(extracted_name) < 2:
             return []
 
-        matches = []
-
-        for payee in payees:
-            # Skip payees with very short names - they create false positives
-            # e.g., "An" matching "Amazon" with high similarity
-            if len(payee.canonical_name) < self.MIN_PAYEE_NAME_LENGTH:
-                continue
+        eligible_payees, names = self._get_fuzzy_choices(payees)
+        if not names:
+            return []
 
-            similarity = ratio(
-                extracted_name.lower(),
-                payee.canonical_name.lower()
-            )
+        # Score every payee name in one C-level pass. fuzz.ratio is the same
+        # normalized InDel similarity as Levenshtein.ratio, scaled to 0-100.
+        results = process.extract(
+            extracted_name.lower(),
+            names,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=threshold * 100,
+            limit=None
+        )
 
-            if similarity >= threshold:
-                matches.append((payee, similarity))
+        # Results are already sorted by similarity score descending
+        return [(eligible_payees[index], score / 100) for _, score, index in results]
 
-        # Sort by similarity score descending
-        matches.sort(key=lambda x: x[1], reverse=True)
+    def _get_fuzzy_choices(self, payees: List[Payee]) -> Tuple[List[Payee], List[str]]:
+        """
+        Build (and memoize per payee list) the candidates used for fuzzy matching.
 
-        return matches
+        Payees with very short names are dropped - they create false positives,
+        e.g., "An" matching "Amazon" with high similarity.
+        """
+        cached = self._fuzzy_choices_cache.get(id(payees))
+        if cached is not None and cached[0] is payees:
+            return cached[1], cached[2]
+
+        eligible_payees = [
+            p for p in payees
+            if len(p.canonical_name) >= self.MIN_PAYEE_NAME_LENGTH
+        ]
+        names = [p.canonical_name.lower() for p in eligible_payees]
+        self._fuzzy_choices_cache[id(payees)] = (payees, eligible_payees, names)
+        return eligible_payees, names
 
     def _classify_confidence(self, confidence: float) -> str:
         """
@@ -403,7 +429,8 @@ class IntelligentPayeeMatchingService:
         payee_id: int,
         description: str,
         pattern_type: str = 'description_contains',
-        source: str = 'import_learning'
+        source: str = 'import_learning',
+        commit: bool = True
     ) -> PayeeMatchingPattern:
         """
         Create new matching pattern based on user accepting a match.
@@ -418,6 +445,8 @@ class IntelligentPayeeMatchingService:
             description: Original transaction description
             pattern_type: Type of pattern to create
             source: Source of pattern ('import_learning', 'user_created', etc.)
+            commit: Commit immediately; when False the change is only flushed
+                and the caller commits the whole batch
 
         Returns:
             Created PayeeMatchingPattern
@@ -446,7 +475,10 @@ class IntelligentPayeeMatchingService:
                 1.0,
                 float(existing.confidence_score) + 0.01  # Small confidence boost
             )
-            self.db.commit()
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
             return existing
 
         # Create new pattern
@@ -461,8 +493,11 @@ class IntelligentPayeeMatchingService:
         )
 
         self.db.add(pattern)
-        self.db.commit()
-        self.db.refresh(pattern)
+        if commit:
+            self.db.commit()
+            self.db.refresh(pattern)
+        else:
+            self.db.flush()
 
         return pattern
 
@@ -3,6 +3,10 @@ from ofxparse import OfxParser
 from io import BytesIO
 from datetime import datetime
 
+# OFX TRNTYPE values mapped to our transaction types
+OFX_DEBIT_TYPES = frozenset(['DEBIT', 'PAYMENT', 'CHECK', 'XFER', 'WITHDRAWAL', 'ATM', 'POS', 'FEE', 'SRVCHG'])
+OFX_CREDIT_TYPES = frozenset(['CREDIT', 'DEP', 'DEPOSIT', 'INT', 'DIV', 'DIRECTDEP'])
+
 
 class OFXService:
     @staticmethod
@@ -14,11 +18,12 @@ class OFXService:
             raise ValueError(f"Failed to parse OFX file: {str(e)}")
 
         account = ofx.account
+        statement = getattr(account, 'statement', None)
         transactions = []
 
         # Extract transactions
-        if hasattr(account, 'statement') and account.statement:
-            for txn in account.statement.transactions:
+        if statement:
+            for txn in statement.transactions:
                 try:
                     amount = float(txn.amount)
 
@@ -28,9 +33,9 @@ class OFXService:
                         # OFX transaction type is authoritative
                         # Map OFX types to our transaction types
                         ofx_type = str(txn.type).upper()
-                        if ofx_type in ['DEBIT', 'PAYMENT', 'CHECK', 'XFER', 'WITHDRAWAL', 'ATM', 'POS', 'FEE', 'SRVCHG']:
+                        if ofx_type in OFX_DEBIT_TYPES:
                             trans_type = 'DEBIT'
-                        elif ofx_type in ['CREDIT', 'DEP', 'DEPOSIT', 'INT', 'DIV', 'DIRECTDEP']:
+                        elif ofx_type in OFX_CREDIT_TYPES:
                             trans_type = 'CREDIT'
                         else:
                             # Unknown OFX type, fall back to amount-based logic
@@ -75,11 +80,11 @@ class OFXService:
                 account_info['bank_name'] = ofx.account.institution.organization
 
         # Extract statement date range if available
-        if hasattr(account, 'statement') and account.statement:
-            if hasattr(account.statement, 'start_date') and account.statement.start_date:
-                account_info['start_date'] = account.statement.start_date.strftime('%Y-%m-%d')
-            if hasattr(account.statement, 'end_date') and account.statement.end_date:
-                account_info['end_date'] = account.statement.end_date.strftime('%Y-%m-%d')
+        if statement:
+            if getattr(statement, 'start_date', None):
+                account_info['start_date'] = statement.start_date.strftime('%Y-%m-%d')
+            if getattr(statement, 'end_date', None):
+                account_info['end_date'] = statement.end_date.strftime('%Y-%m-%d')
 
         return account_info
 
@@ -14,6 +14,7 @@ import json
 import os
 from typing import Optional, Tuple, List, Dict, Any
 from dataclasses import dataclass
+from functools import lru_cache
 from sqlalchemy.orm import Session
 from app.models.payee import Payee
 from Levenshtein import ratio
@@ -30,19 +31,115 @@ class MerchantInfo:
     logo_dev_domain: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
+def load_merchant_config() -> Tuple[List[Tuple[str, str, Optional[str]]], List[MerchantInfo]]:
+    """
+    Load known merchant patterns from JSON config files.
+
+    Supports both:
+    - New multi-file structure: config/merchants/*.json
+    - Legacy single file: config/known_merchants.json (fallback)
+
+    The files are read once per process; every PayeeExtractionService shares
+    the result, so callers must not modify the returned lists.
+
+    Returns:
+        Tuple of (merchants, merchant_info_list):
+        - merchants: [(pattern, canonical_name, category), ...]
+          category may be None if not specified in config
+        - merchant_info_list: full MerchantInfo objects that include
+          logo_dev_domain and simple_icons_slug
+    """
+    config_dir = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        'config'
+    )
+
+    merchants = []
+    merchant_info_list = []
+
+    # Try new multi-file structure first
+    merchants_dir = os.path.join(config_dir, 'merchants')
+    if os.path.isdir(merchants_dir):
+        for filename in sorted(os.listdir(merchants_dir)):
+            # Skip index and hidden files
+            if filename.startswith('_') or filename.startswith('.'):
+                continue
+            if not filename.endswith('.json'):
+                continue
+
+            filepath = os.path.join(merchants_dir, filename)
+            try:
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
+                    for merchant in data.get('merchants', []):
+                        pattern = merchant.get('pattern')
+                        name = merchant.get('name')
+                        category = merchant.get('category')
+                        if pattern and name:
+                            merchants.append((pattern, name, category))
+                            # Also store full merchant info
+                            merchant_info_list.append(MerchantInfo(
+                                pattern=pattern,
+                                name=name,
+                                category=category,
+                                simple_icons_slug=merchant.get('simple_icons_slug'),
+                                logo_dev_domain=merchant.get('logo_dev_domain')
+                            ))
+            except json.JSONDecodeError as e:
+                print(f"Error parsing {filename}: {e}")
+            except Exception as e:
+                print(f"Error loading {filename}: {e}")
+
+    # If we loaded merchants from the new structure, return them
+    if merchants:
+        print(f"Loaded {len(merchants)} known merchants from {merchants_dir}")
+        return merchants, merchant_info_list
+
+    # Fall back to legacy single file
+    legacy_path = os.path.join(config_dir, 'known_merchants.json')
+    try:
+        with open(legacy_path, 'r') as f:
+            data = json.load(f)
+            for merchant in data.get('merchants', []):
+                pattern = merchant.get('pattern')
+                name = merchant.get('name')
+                category = merchant.get('category')
+                if pattern and name:
+                    merchants.append((pattern, name, category))
+                    # Also store full merchant info
+                    merchant_info_list.append(MerchantInfo(
+                        pattern=pattern,
+                        name=name,
+                        category=category,
+                        simple_icons_slug=merchant.get('simple_icons_slug'),
+                        logo_dev_domain=merchant.get('logo_dev_domain')
+                    ))
+            print(f"Loaded {len(merchants)} known merchants from legacy file")
+            return merchants, merchant_info_list
+    except FileNotFoundError:
+        print(f"Warning: No known merchants config found")
+        return [], []
+    except json.JSONDecodeError as e:
+        print(f"Error parsing known merchants config: {e}")
+        return [], []
+    except Exception as e:
+        print(f"Error loading known merchants config: {e}")
+        return [], []
+
+
 class PayeeExtractionService:
     def __init__(self, db: Session):
         self.db = db
         self._merchant_info_list: List[MerchantInfo] = []
         self.known_merchants = self._load_known_merchants()
+        # Extraction is a pure function of the description, and bank statements
+        # repeat the same descriptions many times - memoize per instance.
+        self._extraction_cache: Dict[str, Tuple[str, float, Optional[str]]] = {}
 
     def _load_known_merchants(self) -> List[Tuple[str, str, Optional[str]]]:
         """
-        Load known merchant patterns from JSON config files.
-
-        Supports both:
-        - New multi-file structure: config/merchants/*.json
-        - Legacy single file: config/known_merchants.json (fallback)
+        Load known merchant patterns (cached per process by load_merchant_config).
 
         Returns:
             List of tuples: [(pattern, canonical_name, category), ...]
@@ -51,82 +148,8 @@ class PayeeExtractionService:
         Also populates self._merchant_info_list with full MerchantInfo objects
         that include logo_dev_domain and simple_icons_slug.
         """
-        config_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            'config'
-        )
-
-        merchants = []
-        self._merchant_info_list = []
-
-        # Try new multi-file structure first
-        merchants_dir = os.path.join(config_dir, 'merchants')
-        if os.path.isdir(merchants_dir):
-            for filename in sorted(os.listdir(merchants_dir)):
-                # Skip index and hidden files
-                if filename.startswith('_') or filename.startswith('.'):
-                    continue
-                if not filename.endswith('.json'):
-                    continue
-
-                filepath = os.path.join(merchants_dir, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        for merchant in data.get('merchants', []):
-                            pattern = merchant.get('pattern')
-                            name = merchant.get('name')
-                            category = merchant.get('category')
-                            if pattern and name:
-                                merchants.append((pattern, name, category))
-                                # Also store full merchant info
-                                self._merchant_info_list.append(MerchantInfo(
-                                    pattern=pattern,
-                                    name=name,
-                                    category=category,
-                                    simple_icons_slug=merchant.get('simple_icons_slug'),
-                                    logo_dev_domain=merchant.get('logo_dev_domain')
-                                ))
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing {filename}: {e}")
-                except Exception as e:
-                    print(f"Error loading {filename}: {e}")
-
-        # If we loaded merchants from the new structure, return them
-        if merchants:
-            print(f"Loaded {len(merchants)} known merchants from {merchants_dir}")
-            return merchants
-
-        # Fall back to legacy single file
-        legacy_path = os.path.join(config_dir, 'known_merchants.json')
-        try:
-            with open(legacy_path, 'r') as f:
-                data = json.load(f)
-                for merchant in data.get('merchants', []):
-                    pattern = merchant.get('pattern')
-                    name = merchant.get('name')
-                    category = merchant.get('category')
-                    if pattern and name:
-                        merchants.append((pattern, name, category))
-                        # Also store full merchant info
-                        self._merchant_info_list.append(MerchantInfo(
-                            pattern=pattern,
-                            name=name,
-                            category=category,
-                            simple_icons_slug=merchant.get('simple_icons_slug'),
-                            logo_dev_domain=merchant.get('logo_dev_domain')
-                        ))
-                print(f"Loaded {len(merchants)} known merchants from legacy file")
-                return merchants
-        except FileNotFoundError:
-            print(f"Warning: No known merchants config found")
-            return []
-        except json.JSONDecodeError as e:
-            print(f"Error parsing known merchants config: {e}")
-            return []
-        except Exception as e:
-            print(f"Error loading known merchants config: {e}")
-            return []
+        merchants, self._merchant_info_list = load_merchant_config()
+        return merchants
 
     def get_merchant_info(self, merchant_name: str) -> Optional[MerchantInfo]:
         """
@@ -181,6 +204,16 @@ class PayeeExtractionService:
         if not description or not description.strip():
             return ("", 0.0, None)
 
+        cached = self._extraction_cache.get(description)
+        if cached is not None:
+            return cached
+
+        result = self._extract_payee_name_with_category(description)
+        self._extraction_cache[description] = result
+        return result
+
+    def _extract_payee_name_with_category(self, description: str) -> Tuple[str, float, Optional[str]]:
+        """Uncached implementation of extract_payee_name_with_category."""
         original = description.strip()
 
         # STEP 0: Check for well-known merchants FIRST (highest priority)
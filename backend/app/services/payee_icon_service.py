@@ -4,10 +4,17 @@ Payee Icon Service - Provides brand logo URLs and emoji fallbacks for payees.
 Uses Simple Icons CDN for brand logos and a comprehensive emoji mapping system
 for fallbacks when no brand logo is available.
 """
+import hashlib
 import re
+import orjson
+from functools import lru_cache
 from typing import Optional, Dict, Tuple
 from difflib import SequenceMatcher
 
+# Distinct normalized payee names whose suggestions are memoized.
+# BRAND_MAPPINGS and EMOJI_MAPPINGS are static, so entries never go stale.
+SUGGESTION_CACHE_SIZE = 4096
+
 
 class PayeeIconService:
     """
@@ -1082,6 +1089,13 @@ class PayeeIconService:
         # Pre-compile name normalization patterns
         self._normalize_pattern = re.compile(r'[^a-z0-9\s]')
         self._whitespace_pattern = re.compile(r'\s+')
+        # Per-instance memo of suggestions keyed by normalized name
+        self._suggest_normalized = lru_cache(maxsize=SUGGESTION_CACHE_SIZE)(
+            self._build_suggestion
+        )
+        self._brands: Optional[list] = None
+        self._brands_json: Optional[bytes] = None
+        self._brands_etag: Optional[str] = None
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a payee name for matching."""
@@ -1177,14 +1191,20 @@ class PayeeIconService:
         The icon_value can be stored directly in the payee's logo_url field.
         For emojis, the format is "emoji:{emoji_char}" (e.g., "emoji:☕")
         For brands, it's the full CDN URL.
+
+        Results depend only on the normalized name, so they are memoized;
+        a copy is returned so callers can't mutate the cached entry.
         """
+        return dict(self._suggest_normalized(self._normalize_name(payee_name)))
+
+    def _build_suggestion(self, normalized: str) -> dict:
+        """Compute the icon suggestion for an already-normalized payee name."""
         # Try to find a brand match first
-        brand_match = self._find_best_brand_match(payee_name)
+        brand_match = self._find_best_brand_match(normalized)
 
         if brand_match:
             slug, color, matched = brand_match
             # Calculate confidence based on match type
-            normalized = self._normalize_name(payee_name)
             if normalized == matched:
                 confidence = 1.0
             elif matched in normalized:
@@ -1215,7 +1235,7 @@ class PayeeIconService:
             }
 
         # Fall back to emoji
-        emoji, matched = self._find_best_emoji(payee_name)
+        emoji, matched = self._find_best_emoji(normalized)
         confidence = 0.8 if matched else 0.3  # Lower confidence for default emoji
 
         return {
@@ -1272,7 +1292,31 @@ class PayeeIconService:
         }
 
     def get_all_brands(self) -> list:
-        """Get list of all available brand mappings for documentation."""
+        """
+        Get list of all available brand mappings for documentation.
+
+        BRAND_MAPPINGS is static, so the list is built once per instance
+        and the same list is returned on every call.
+        """
+        if self._brands is None:
+            self._brands = self._build_brand_list()
+        return self._brands
+
+    def get_all_brands_json(self) -> bytes:
+        """Get the brand list serialized as JSON, encoded once per instance."""
+        if self._brands_json is None:
+            self._brands_json = orjson.dumps(self.get_all_brands())
+        return self._brands_json
+
+    def get_all_brands_etag(self) -> str:
+        """Get a strong ETag (quoted content hash) for get_all_brands_json."""
+        if self._brands_etag is None:
+            digest = hashlib.blake2b(self.get_all_brands_json(), digest_size=16).hexdigest()
+            self._brands_etag = f'"{digest}"'
+        return self._brands_etag
+
+    def _build_brand_list(self) -> list:
+        """Build the de-duplicated, name-sorted brand list."""
         brands = []
         seen_slugs = set()
 
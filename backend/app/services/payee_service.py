@@ -1,10 +1,16 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy.orm import Load, Session, joinedload
+from sqlalchemy import and_, bindparam, delete, func, or_, update
+from sqlalchemy.engine import Row
+import base64
 import re
 import logging
+import orjson
 
+from app.core import cache
+from app.core.config import settings
+from app.models.category import Category
 from app.models.payee import Payee
 from app.schemas.payee import PayeeCreate, PayeeUpdate
 from app.services.payee_icon_service import payee_icon_service
@@ -12,6 +18,125 @@ from app.services.icon_provider_service import get_icon_provider_service, IconPr
 
 logger = logging.getLogger(__name__)
 
+# Prefixes stripped from raw payee text by _normalize_payee_name
+PAYEE_PREFIX_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'^DEBIT\s+CARD\s+PURCHASE\s*-?\s*',
+    r'^CREDIT\s+CARD\s+PURCHASE\s*-?\s*',
+    r'^POS\s+PURCHASE\s*-?\s*',
+    r'^PURCHASE\s+AUTHORIZED\s+ON\s+\d{2}/\d{2}\s+',
+    r'^XX\d+\s+',  # Transaction ID like XX7800
+    r'^\d{4,}\s+',  # Long number at start
+    r'^SQ\s*\*\s*',  # Square payments
+    r'^TST\s*\*\s*',  # Toast payments
+    r'^PAYPAL\s*\*\s*',  # PayPal
+]]
+
+# Suffixes stripped from raw payee text by _normalize_payee_name
+PAYEE_SUFFIX_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\s+STORE\s*#?\d+$',  # Store number with "STORE" keyword (do this first)
+    r'\s+\d{1,2}/\d{1,2}$',  # Date like 8/18
+    r'\s+#\d+$',  # Store number
+    r'\s+\.\.\.\d+$',  # ...123456 format
+    r'\s+\d{10,}$',  # Long number at end
+    r'\s+(INC|LLC|CORP|CO|LTD)\.?$',  # Company suffixes
+    r'\s+CHRG\s+SVCS$',
+    r'\s+HTTPS?://.*$',  # Remove URLs
+    r'\s+HTTPS?:/.*$',  # Remove partial URLs (malformed)
+    r'\s+WWW\..*$',  # Remove web addresses
+    r'\s+[A-Z0-9]+\.COM$',  # Remove .com domains
+    r'\s+[A-Z0-9]+\.NET$',  # Remove .net domains
+    r'\s+[A-Z0-9]+\.ORG$',  # Remove .org domains
+    # Remove common city suffixes (usually at end after business name)
+    r'\s+(AUSTIN|LEANDER|CEDAR PARK|GEORGETOWN|ROUND ROCK)$',
+]]
+
+# Fixes .title() output like "Mcdonald'S"
+APOSTROPHE_S_PATTERN = re.compile(r"'S\b")
+
+# Every field the Payee response schema reads, for queries and RETURNING
+# clauses that hand back plain rows instead of ORM entities
+PAYEE_COLUMNS = (
+    Payee.id,
+    Payee.user_id,
+    Payee.canonical_name,
+    Payee.default_category_id,
+    Payee.payee_type,
+    Payee.logo_url,
+    Payee.notes,
+    Payee.transaction_count,
+    Payee.last_used_at,
+    Payee.created_at,
+    Payee.updated_at,
+)
+
+# Columns for the row-based list queries: PAYEE_COLUMNS plus the category
+# name joined in rather than loaded through the relationship, so no ORM
+# entities are built for read-only payee lists
+PAYEE_LIST_COLUMNS = PAYEE_COLUMNS + (Category.name.label("default_category_name"),)
+
+# Per-user counter bumped whenever a user's payee names, categories, set
+# of payees or matching patterns change. Callers caching search results include
+# it in their cache key so a write makes earlier entries unreachable. It lives
+# in the shared cache, so a write on one worker invalidates all of them.
+PAYEES_CACHE_NAMESPACE = "payees"
+
+
+def payee_generation(user_id: int) -> Optional[int]:
+    """
+    Get the current payee generation for a user.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Counter that changes after every payee write for the user, or None
+        if the shared cache is unavailable (callers should not cache)
+    """
+    return cache.get_generation(PAYEES_CACHE_NAMESPACE, user_id)
+
+
+def bump_payee_generation(user_id: int) -> None:
+    """Mark a user's payees as changed, invalidating generation-keyed caches."""
+    cache.bump_generation(PAYEES_CACHE_NAMESPACE, user_id)
+
+
+def encode_payee_cursor(payee) -> str:
+    """
+    Build the get_all keyset cursor for the page after ``payee``.
+
+    Args:
+        payee: Last payee (entity or list row) of the current page
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    position = [
+        payee.transaction_count,
+        payee.last_used_at.isoformat() if payee.last_used_at else None,
+        payee.canonical_name,
+    ]
+    return base64.urlsafe_b64encode(orjson.dumps(position)).decode('ascii')
+
+
+def decode_payee_cursor(cursor: str) -> Tuple[int, Optional[datetime], str]:
+    """
+    Decode a cursor from encode_payee_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        transaction_count, last_used_at, canonical_name = orjson.loads(
+            base64.urlsafe_b64decode(cursor.encode('ascii'))
+        )
+        return (
+            int(transaction_count),
+            datetime.fromisoformat(last_used_at) if last_used_at else None,
+            str(canonical_name),
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 
 class PayeeService:
     """
@@ -28,7 +153,8 @@ class PayeeService:
         user_id: int,
         canonical_name: str,
         default_category_id: Optional[int] = None,
-        icon_provider: Optional[str] = None
+        icon_provider: Optional[str] = None,
+        commit: bool = True
     ) -> Payee:
         """
         Get existing payee or create new one.
@@ -40,6 +166,8 @@ class PayeeService:
             canonical_name: Raw payee name (will be normalized)
             default_category_id: Optional default category
             icon_provider: User's preferred icon provider ("simple_icons" or "logo_dev")
+            commit: Commit the new payee; when False it is only flushed (so it
+                has an id) and the caller commits the whole batch
 
         Returns:
             Payee entity (existing or newly created)
@@ -79,12 +207,93 @@ class PayeeService:
             transaction_count=0
         )
         self.db.add(payee)
-        self.db.commit()
-        self.db.refresh(payee)
+        if commit:
+            self.db.commit()
+            self.db.refresh(payee)
+        else:
+            self.db.flush()
+        bump_payee_generation(user_id)
 
         logger.info(f"[PayeeService.get_or_create] Created payee id={payee.id}, name='{normalized_name}', logo_url={logo_url[:50] if logo_url else None}")
         return payee
 
+    def get_or_create_many(
+        self,
+        user_id: int,
+        canonical_names: Iterable[str],
+        icon_provider: Optional[str] = None,
+        commit: bool = True
+    ) -> Dict[str, Payee]:
+        """
+        Resolve many payee names at once, creating any that don't exist.
+
+        Bulk counterpart of get_or_create for imports: existing payees are
+        fetched with a single IN query and missing ones are inserted together.
+
+        Args:
+            user_id: User ID who owns the payees
+            canonical_names: Raw payee names (will be normalized); duplicates allowed
+            icon_provider: User's preferred icon provider ("simple_icons" or "logo_dev")
+            commit: Commit the new payees; when False they are only flushed (so
+                they have ids) and the caller commits them with the rest of
+                the import
+
+        Returns:
+            Map of each raw name -> Payee entity (existing or newly created)
+        """
+        normalized_by_raw = {}
+        for raw_name in set(canonical_names):
+            if not raw_name:
+                continue
+            normalized_name = self._normalize_payee_name(raw_name)
+            if not normalized_name:
+                # If normalization results in empty string, use original (truncated)
+                normalized_name = raw_name.strip()[:200]
+            normalized_by_raw[raw_name] = normalized_name
+
+        if not normalized_by_raw:
+            return {}
+
+        wanted = set(normalized_by_raw.values())
+        existing_names = {
+            name for (name,) in self.db.query(Payee.canonical_name).filter(
+                Payee.user_id == user_id,
+                Payee.canonical_name.in_(wanted)
+            )
+        }
+
+        missing = sorted(wanted - existing_names)
+        if missing:
+            logger.info(f"[PayeeService.get_or_create_many] Creating {len(missing)} new payees")
+            self.db.add_all([
+                Payee(
+                    user_id=user_id,
+                    canonical_name=name,
+                    logo_url=self._suggest_icon_for_payee(name, icon_provider),
+                    transaction_count=0
+                )
+                for name in missing
+            ])
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+            bump_payee_generation(user_id)
+
+        # Load existing and new payees together (also refreshes the committed ones)
+        payees_by_name = {
+            payee.canonical_name: payee
+            for payee in self.db.query(Payee).filter(
+                Payee.user_id == user_id,
+                Payee.canonical_name.in_(wanted)
+            )
+        }
+
+        return {
+            raw_name: payees_by_name[normalized_name]
+            for raw_name, normalized_name in normalized_by_raw.items()
+        }
+
     def _suggest_icon_for_payee(
         self,
         payee_name: str,
@@ -274,6 +483,34 @@ class PayeeService:
             payee.last_used_at = datetime.utcnow()
             self.db.commit()
 
+    def increment_usage_bulk(self, usage_counts: Mapping[int, int]) -> None:
+        """
+        Add to transaction_count and touch last_used_at for many payees at once.
+
+        Used by imports so each payee is updated once per batch instead of
+        once per transaction.
+
+        Args:
+            usage_counts: Map of payee_id -> number of new transactions
+        """
+        if not usage_counts:
+            return
+
+        payees_table = Payee.__table__
+        self.db.execute(
+            payees_table.update()
+            .where(payees_table.c.id == bindparam('b_payee_id'))
+            .values(
+                transaction_count=payees_table.c.transaction_count + bindparam('b_count'),
+                last_used_at=datetime.utcnow()
+            ),
+            [
+                {'b_payee_id': payee_id, 'b_count': count}
+                for payee_id, count in usage_counts.items()
+            ]
+        )
+        self.db.commit()
+
     def search_payees(
         self,
         user_id: int,
@@ -297,13 +534,46 @@ class PayeeService:
         Returns:
             List of matching Payee entities (with default_category eager loaded)
         """
-        query_upper = query.upper()
-
-        # Build the search query with eager loading of default_category
         db_query = self.db.query(Payee).options(
-            joinedload(Payee.default_category)
+            joinedload(Payee.default_category).load_only(Category.name)
         ).filter(Payee.user_id == user_id)
 
+        return self._rank_search(db_query, query).limit(limit).all()
+
+    def search_payee_rows(
+        self,
+        user_id: int,
+        query: str,
+        limit: int = 10
+    ) -> List[Row]:
+        """
+        Row-based search_payees for read-only responses.
+
+        Same filter and ranking, but selects PAYEE_LIST_COLUMNS with the
+        category outer-joined, skipping entity construction and the
+        identity map.
+
+        Args:
+            user_id: User ID to search within
+            query: Search query string
+            limit: Maximum number of results
+
+        Returns:
+            List of rows with the PayeeWithCategory fields
+        """
+        return self._rank_search(self._list_row_query(user_id), query).limit(limit).all()
+
+    def _list_row_query(self, user_id: int):
+        """Query a user's payees as PAYEE_LIST_COLUMNS rows."""
+        return self.db.query(*PAYEE_LIST_COLUMNS).outerjoin(
+            Category, Payee.default_category_id == Category.id
+        ).filter(Payee.user_id == user_id)
+
+    @staticmethod
+    def _rank_search(db_query, query: str):
+        """Apply search_payees' name filter and ranking to a payee query."""
+        query_upper = query.upper()
+
         if query:
             # Search in canonical_name (case-insensitive)
             db_query = db_query.filter(
@@ -315,7 +585,7 @@ class PayeeService:
         # 2. Starts with query
         # 3. Transaction count (descending)
         # 4. Last used (descending)
-        db_query = db_query.order_by(
+        return db_query.order_by(
             # Exact match first
             (func.upper(Payee.canonical_name) == query_upper).desc(),
             # Starts with query second
@@ -325,8 +595,6 @@ class PayeeService:
             Payee.last_used_at.desc().nullslast()
         )
 
-        return db_query.limit(limit).all()
-
     def update_default_category(
         self,
         payee_id: int,
@@ -347,6 +615,7 @@ class PayeeService:
             payee.default_category_id = category_id
             self.db.commit()
             self.db.refresh(payee)
+            bump_payee_generation(payee.user_id)
         return payee
 
     def get_by_id(self, payee_id: int, user_id: int) -> Optional[Payee]:
@@ -365,32 +634,129 @@ class PayeeService:
             Payee.user_id == user_id
         ).first()
 
+    def exists(self, payee_id: int, user_id: int) -> bool:
+        """
+        Check that a payee exists and belongs to the user.
+
+        Selects only the primary key, so no Payee entity is loaded.
+
+        Args:
+            payee_id: ID of payee
+            user_id: User ID who should own the payee
+
+        Returns:
+            True if the payee exists and is owned by the user
+        """
+        return self.db.query(Payee.id).filter(
+            Payee.id == payee_id,
+            Payee.user_id == user_id
+        ).first() is not None
+
     def get_all(
         self,
         user_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Payee]:
         """
-        Get all payees for a user.
+        Get all payees for a user, most used first.
+
+        Pass the ``cursor`` from encode_payee_cursor(last payee of the previous
+        page) for keyset pagination: the page starts right after that payee
+        using the ordering columns, so deep pages don't scan and discard
+        ``skip`` rows. ``skip`` is still honoured when no cursor is given.
 
         Args:
             user_id: User ID
-            skip: Number of records to skip (pagination)
+            skip: Number of records to skip (offset pagination, deprecated)
             limit: Maximum number of records to return
+            cursor: Opaque cursor from encode_payee_cursor
 
         Returns:
             List of Payee entities (with default_category eager loaded)
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        return self.db.query(Payee).options(
-            joinedload(Payee.default_category)
+        db_query = self.db.query(Payee).options(
+            joinedload(Payee.default_category).load_only(Category.name)
         ).filter(
             Payee.user_id == user_id
-        ).order_by(
+        )
+
+        return self._page(db_query, skip, limit, cursor).all()
+
+    def get_all_rows(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Row-based get_all for read-only responses.
+
+        Same ordering and pagination, but selects PAYEE_LIST_COLUMNS with
+        the category outer-joined, skipping entity construction and the
+        identity map.
+
+        Args:
+            user_id: User ID
+            skip: Number of records to skip (offset pagination, deprecated)
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from encode_payee_cursor
+
+        Returns:
+            List of rows with the PayeeWithCategory fields
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return self._page(self._list_row_query(user_id), skip, limit, cursor).all()
+
+    def _page(self, db_query, skip: int, limit: int, cursor: Optional[str]):
+        """Apply get_all's ordering and cursor/offset pagination to a payee query."""
+        if cursor:
+            db_query = db_query.filter(self._after_cursor(decode_payee_cursor(cursor)))
+        elif skip:
+            db_query = db_query.offset(skip)
+
+        # canonical_name is unique per user, so it settles every tie
+        return db_query.order_by(
             Payee.transaction_count.desc(),
             Payee.last_used_at.desc().nullslast(),
             Payee.canonical_name
-        ).offset(skip).limit(limit).all()
+        ).limit(limit)
+
+    @staticmethod
+    def _after_cursor(position: Tuple[int, Optional[datetime], str]):
+        """
+        Filter for payees ordered after ``position`` in get_all's ordering
+        (transaction_count DESC, last_used_at DESC NULLS LAST, canonical_name).
+        """
+        transaction_count, last_used_at, canonical_name = position
+
+        if last_used_at is None:
+            # Cursor is already in the NULLS LAST tail
+            same_count_after = and_(
+                Payee.last_used_at.is_(None),
+                Payee.canonical_name > canonical_name
+            )
+        else:
+            same_count_after = or_(
+                Payee.last_used_at < last_used_at,
+                Payee.last_used_at.is_(None),
+                and_(
+                    Payee.last_used_at == last_used_at,
+                    Payee.canonical_name > canonical_name
+                )
+            )
+
+        return or_(
+            Payee.transaction_count < transaction_count,
+            and_(Payee.transaction_count == transaction_count, same_count_after)
+        )
 
     def create(
         self,
@@ -423,6 +789,7 @@ class PayeeService:
                 setattr(payee, field, value)
             self.db.commit()
             self.db.refresh(payee)
+            bump_payee_generation(user_id)
 
         return payee
 
@@ -431,35 +798,48 @@ class PayeeService:
         payee_id: int,
         user_id: int,
         payee_data: PayeeUpdate
-    ) -> Optional[Payee]:
+    ) -> Optional[Row]:
         """
         Update payee metadata.
 
+        Ownership check and write are one UPDATE ... RETURNING statement;
+        the updated payee comes back as a PAYEE_COLUMNS row.
+
         Args:
             payee_id: ID of payee to update
             user_id: User ID (for ownership check)
             payee_data: Updated payee data
 
         Returns:
-            Updated Payee or None if not found/not owned
+            Updated payee row or None if not found/not owned
         """
-        payee = self.get_by_id(payee_id, user_id)
-        if not payee:
-            return None
-
         update_data = payee_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(payee, field, value)
+        if not update_data:
+            return self.db.query(*PAYEE_COLUMNS).filter(
+                Payee.id == payee_id,
+                Payee.user_id == user_id
+            ).first()
+
+        row = self.db.execute(
+            update(Payee).where(
+                Payee.id == payee_id,
+                Payee.user_id == user_id
+            ).values(**update_data).returning(*PAYEE_COLUMNS)
+        ).first()
+        if row is None:
+            return None
 
         self.db.commit()
-        self.db.refresh(payee)
-        return payee
+        bump_payee_generation(user_id)
+        return row
 
     def delete(self, payee_id: int, user_id: int) -> bool:
         """
         Delete a payee.
 
-        Note: This sets transactions.payee_id to NULL (ON DELETE SET NULL).
+        Ownership check and delete are one DELETE ... RETURNING statement.
+        Patterns are removed and transactions.payee_id is set to NULL by the
+        foreign keys (ON DELETE CASCADE / ON DELETE SET NULL).
 
         Args:
             payee_id: ID of payee to delete
@@ -468,12 +848,17 @@ class PayeeService:
         Returns:
             True if deleted, False if not found/not owned
         """
-        payee = self.get_by_id(payee_id, user_id)
-        if not payee:
+        deleted_id = self.db.execute(
+            delete(Payee).where(
+                Payee.id == payee_id,
+                Payee.user_id == user_id
+            ).returning(Payee.id)
+        ).scalar_one_or_none()
+        if deleted_id is None:
             return False
 
-        self.db.delete(payee)
         self.db.commit()
+        bump_payee_generation(user_id)
         return True
 
     def _normalize_payee_name(self, text: str) -> str:
@@ -499,42 +884,12 @@ class PayeeService:
         text = text.strip()
 
         # Remove common prefixes
-        prefixes_to_remove = [
-            r'^DEBIT\s+CARD\s+PURCHASE\s*-?\s*',
-            r'^CREDIT\s+CARD\s+PURCHASE\s*-?\s*',
-            r'^POS\s+PURCHASE\s*-?\s*',
-            r'^PURCHASE\s+AUTHORIZED\s+ON\s+\d{2}/\d{2}\s+',
-            r'^XX\d+\s+',  # Transaction ID like XX7800
-            r'^\d{4,}\s+',  # Long number at start
-            r'^SQ\s*\*\s*',  # Square payments
-            r'^TST\s*\*\s*',  # Toast payments
-            r'^PAYPAL\s*\*\s*',  # PayPal
-        ]
-
-        for prefix_pattern in prefixes_to_remove:
-            text = re.sub(prefix_pattern, '', text, flags=re.IGNORECASE)
+        for prefix_pattern in PAYEE_PREFIX_PATTERNS:
+            text = prefix_pattern.sub('', text)
 
         # Remove common suffixes
-        suffixes_to_remove = [
-            r'\s+STORE\s*#?\d+$',  # Store number with "STORE" keyword (do this first)
-            r'\s+\d{1,2}/\d{1,2}$',  # Date like 8/18
-            r'\s+#\d+$',  # Store number
-            r'\s+\.\.\.\d+$',  # ...123456 format
-            r'\s+\d{10,}$',  # Long number at end
-            r'\s+(INC|LLC|CORP|CO|LTD)\.?$',  # Company suffixes
-            r'\s+CHRG\s+SVCS$',
-            r'\s+HTTPS?://.*$',  # Remove URLs
-            r'\s+HTTPS?:/.*$',  # Remove partial URLs (malformed)
-            r'\s+WWW\..*$',  # Remove web addresses
-            r'\s+[A-Z0-9]+\.COM$',  # Remove .com domains
-            r'\s+[A-Z0-9]+\.NET$',  # Remove .net domains
-            r'\s+[A-Z0-9]+\.ORG$',  # Remove .org domains
-            # Remove common city suffixes (usually at end after business name)
-            r'\s+(AUSTIN|LEANDER|CEDAR PARK|GEORGETOWN|ROUND ROCK)$',
-        ]
-
-        for suffix_pattern in suffixes_to_remove:
-            text = re.sub(suffix_pattern, '', text, flags=re.IGNORECASE)
+        for suffix_pattern in PAYEE_SUFFIX_PATTERNS:
+            text = suffix_pattern.sub('', text)
 
         # Remove city/location suffixes if they duplicate the merchant name
         # For patterns like "CS AUSTIN CAFE AUSTIN" -> "CS AUSTIN CAFE"
@@ -564,7 +919,7 @@ class PayeeService:
 
         # Fix apostrophe-S capitalization (e.g., "Mcdonald'S" -> "McDonald's")
         # Python's .title() capitalizes after any non-letter, so 'S becomes 'S
-        text = re.sub(r"'S\b", "'s", text)
+        text = APOSTROPHE_S_PATTERN.sub("'s", text)
 
         # Truncate to 200 chars
         return text[:200]
@@ -574,60 +929,82 @@ class PayeeService:
         payee_id: int,
         user_id: int,
         limit: int = 50
-    ) -> List[dict]:
+    ) -> Optional[List[dict]]:
         """
         Get recent transactions for a payee.
 
+        The ownership check and the transaction fetch share one query: the
+        payee row is outer-joined to its transactions, so a missing payee
+        yields no rows and a payee without transactions yields one row of
+        NULLs.
+
         Args:
             payee_id: ID of payee
             user_id: User ID (for ownership check)
             limit: Maximum number of transactions to return
 
         Returns:
-            List of transaction dicts with account and category names
+            List of transaction dicts with account and category names,
+            or None if payee not found
         """
         from app.models.transaction import Transaction
         from app.models.account import Account
-        from app.models.category import Category
 
-        # Verify payee exists and belongs to user
-        payee = self.get_by_id(payee_id, user_id)
-        if not payee:
-            return []
-
-        # Query transactions for this payee
-        transactions = self.db.query(Transaction).options(
-            joinedload(Transaction.account),
-            joinedload(Transaction.category)
+        rows = self.db.query(
+            Transaction.id,
+            Transaction.date,
+            Transaction.amount,
+            Transaction.type,
+            Transaction.account_id,
+            Account.name.label("account_name"),
+            Transaction.category_id,
+            Category.name.label("category_name"),
+            Transaction.description
+        ).select_from(Payee).outerjoin(
+            Transaction,
+            and_(
+                Transaction.payee_id == Payee.id,
+                Transaction.user_id == user_id
+            )
+        ).outerjoin(
+            Account, Account.id == Transaction.account_id
+        ).outerjoin(
+            Category, Category.id == Transaction.category_id
         ).filter(
-            Transaction.payee_id == payee_id,
-            Transaction.user_id == user_id
+            Payee.id == payee_id,
+            Payee.user_id == user_id
         ).order_by(
             Transaction.date.desc(),
             Transaction.created_at.desc()
         ).limit(limit).all()
 
-        # Build response
-        results = []
-        for txn in transactions:
-            results.append({
-                "id": txn.id,
-                "date": txn.date,
-                "amount": txn.amount,
-                "type": txn.type.value,
-                "account_id": txn.account_id,
-                "account_name": txn.account.name if txn.account else "Unknown",
-                "category_id": txn.category_id,
-                "category_name": txn.category.name if txn.category else None,
-                "description": txn.description
-            })
-
-        return results
+        if not rows:
+            return None
+
+        return [
+            {
+                "id": row.id,
+                "date": row.date,
+                "amount": row.amount,
+                "type": row.type.value,
+                "account_id": row.account_id,
+                "account_name": row.account_name or "Unknown",
+                "category_id": row.category_id,
+                "category_name": row.category_name,
+                "description": row.description
+            }
+            for row in rows
+            if row.id is not None
+        ]
 
     def get_stats(self, payee_id: int, user_id: int) -> Optional[dict]:
         """
         Get spending statistics for a payee.
 
+        Like get_transactions, the ownership check rides on the same query
+        as the data: the payee is outer-joined to its transactions and only
+        the columns the statistics need are selected.
+
         Args:
             payee_id: ID of payee
             user_id: User ID (for ownership check)
@@ -639,24 +1016,25 @@ class PayeeService:
         from datetime import date
         from decimal import Decimal
 
-        # Verify payee exists and belongs to user
-        payee = self.get_by_id(payee_id, user_id)
-        if not payee:
-            return None
-
-        # Get current month and year
-        today = date.today()
-        first_of_month = date(today.year, today.month, 1)
-        first_of_year = date(today.year, 1, 1)
+        rows = self.db.query(
+            Transaction.date,
+            Transaction.amount,
+            Transaction.type
+        ).select_from(Payee).outerjoin(
+            Transaction,
+            and_(
+                Transaction.payee_id == Payee.id,
+                Transaction.user_id == user_id
+            )
+        ).filter(
+            Payee.id == payee_id,
+            Payee.user_id == user_id
+        ).all()
 
-        # Base query for this payee's transactions
-        base_query = self.db.query(Transaction).filter(
-            Transaction.payee_id == payee_id,
-            Transaction.user_id == user_id
-        )
+        if not rows:
+            return None
 
-        # Get all transactions to calculate stats
-        all_transactions = base_query.all()
+        all_transactions = [row for row in rows if row.date is not None]
 
         if not all_transactions:
             return {
@@ -670,6 +1048,11 @@ class PayeeService:
                 "last_transaction_date": None
             }
 
+        # Get current month and year
+        today = date.today()
+        first_of_month = date(today.year, today.month, 1)
+        first_of_year = date(today.year, 1, 1)
+
         # Calculate stats
         total_spent = Decimal("0.00")
         total_income = Decimal("0.00")
@@ -712,32 +1095,47 @@ class PayeeService:
         self,
         payee_id: int,
         user_id: int
-    ) -> List:
+    ) -> Optional[List]:
         """
         Get all matching patterns for a payee.
 
+        The payee is outer-joined to its patterns so the ownership check
+        and the fetch are a single query.
+
         Args:
             payee_id: ID of payee
             user_id: User ID (for ownership check)
 
         Returns:
-            List of PayeeMatchingPattern entities
+            List of PayeeMatchingPattern entities, or None if payee not found
         """
         from app.models.payee_matching_pattern import PayeeMatchingPattern
 
-        # Verify payee exists and belongs to user
-        payee = self.get_by_id(payee_id, user_id)
-        if not payee:
-            return []
-
-        return self.db.query(PayeeMatchingPattern).filter(
-            PayeeMatchingPattern.payee_id == payee_id,
-            PayeeMatchingPattern.user_id == user_id
+        db_query = self.db.query(Payee.id, PayeeMatchingPattern)
+        if settings.SHARKFIN_RAISELOAD:
+            # The route serializes these entities; a schema field that touches
+            # a relationship should fail loudly, not lazy load per pattern
+            db_query = db_query.options(Load(PayeeMatchingPattern).raiseload('*'))
+
+        rows = db_query.select_from(Payee).outerjoin(
+            PayeeMatchingPattern,
+            and_(
+                PayeeMatchingPattern.payee_id == Payee.id,
+                PayeeMatchingPattern.user_id == user_id
+            )
+        ).filter(
+            Payee.id == payee_id,
+            Payee.user_id == user_id
         ).order_by(
             PayeeMatchingPattern.confidence_score.desc(),
             PayeeMatchingPattern.match_count.desc()
         ).all()
 
+        if not rows:
+            return None
+
+        return [pattern for _, pattern in rows if pattern is not None]
+
     def create_pattern(
         self,
         payee_id: int,
@@ -763,8 +1161,7 @@ class PayeeService:
         from decimal import Decimal
 
         # Verify payee exists and belongs to user
-        payee = self.get_by_id(payee_id, user_id)
-        if not payee:
+        if not self.exists(payee_id, user_id):
             return None
 
         # Check if pattern already exists
@@ -778,6 +1175,7 @@ class PayeeService:
             # Update existing pattern
             existing.confidence_score = Decimal(str(confidence_score))
             self.db.commit()
+            bump_payee_generation(user_id)
             self.db.refresh(existing)
             return existing
 
@@ -793,6 +1191,7 @@ class PayeeService:
         )
         self.db.add(pattern)
         self.db.commit()
+        bump_payee_generation(user_id)
         self.db.refresh(pattern)
         return pattern
 
@@ -853,6 +1252,7 @@ class PayeeService:
             pattern.confidence_score = Decimal(str(confidence_score))
 
         self.db.commit()
+        bump_payee_generation(user_id)
         self.db.refresh(pattern)
         return pattern
 
@@ -873,6 +1273,7 @@ class PayeeService:
 
         self.db.delete(pattern)
         self.db.commit()
+        bump_payee_generation(user_id)
         return True
 
     def test_pattern(
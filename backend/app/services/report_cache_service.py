@@ -0,0 +1,37 @@
+"""
+Report Cache Service
+
+Per-user report generation, shared by every worker through app.core.cache.
+Cached report responses include the generation in their key; routes that
+change report data (transactions, accounts, budgets, categories, rules,
+imports) call invalidate_report_cache after committing.
+"""
+from typing import Optional
+
+from app.core import cache
+
+REPORTS_CACHE_NAMESPACE = "reports"
+
+
+def report_generation(user_id: int) -> Optional[int]:
+    """
+    Get the current report generation for a user.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Counter that changes after every report-affecting write, or None if
+        the shared cache is unavailable
+    """
+    return cache.get_generation(REPORTS_CACHE_NAMESPACE, user_id)
+
+
+def invalidate_report_cache(user_id: int) -> None:
+    """
+    Drop cached reports for a user on every worker.
+
+    Bumps the user's report generation, so responses computed before the
+    write can no longer be served even if they finish storing after this call.
+    """
+    cache.bump_generation(REPORTS_CACHE_NAMESPACE, user_id)
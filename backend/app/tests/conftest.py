@@ -1,9 +1,11 @@
 import pytest
 import os
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
+from app.core import cache
 from app.core.database import Base, get_db
 from app.main import app
 from app.models.user import User
@@ -81,6 +83,13 @@ def setup_test_database():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    """Start every test with no cached responses or generations."""
+    cache.clear()
+    yield
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a new database session for a test with transaction rollback."""
@@ -151,3 +160,30 @@ def auth_headers(client, test_user):
     )
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Context manager factory recording the SQL statements executed inside it.
+
+    Usage::
+
+        with count_queries() as statements:
+            client.get(...)
+        assert len(statements) <= 5
+    """
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -373,3 +373,65 @@ class TestAccountBalanceCalculation:
         # Verify calculated balances
         assert Decimal(acc1_data["current_balance"]) == Decimal("1500.00")  # 1000 + 500
         assert Decimal(acc2_data["current_balance"]) == Decimal("4000.00")  # 5000 - 1000
+
+    def test_bulk_balances_match_calculate_balance(self, test_user, db_session):
+        """Test that bulk balance queries agree with per-account calculate_balance."""
+        from app.models.account import Account
+        from app.models.transaction import Transaction, TransactionType
+        from app.services.account_balance_service import AccountBalanceService
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD",
+            opening_balance=Decimal("1000.00"),
+            opening_balance_date=date(2026, 1, 10)
+        )
+        savings = Account(
+            user_id=test_user.id,
+            name="Savings",
+            type=AccountType.SAVINGS,
+            currency="USD",
+            opening_balance=Decimal("5000.00"),
+            opening_balance_date=None
+        )
+        db_session.add_all([checking, savings])
+        db_session.commit()
+
+        db_session.add_all([
+            # Before checking's opening_balance_date: ignored for checking
+            Transaction(user_id=test_user.id, account_id=checking.id, type=TransactionType.CREDIT,
+                        amount=Decimal("999.00"), date=date(2026, 1, 5), description="Old"),
+            Transaction(user_id=test_user.id, account_id=checking.id, type=TransactionType.CREDIT,
+                        amount=Decimal("500.00"), date=date(2026, 1, 15), description="Deposit"),
+            Transaction(user_id=test_user.id, account_id=checking.id, type=TransactionType.DEBIT,
+                        amount=Decimal("120.00"), date=date(2026, 2, 3), description="Groceries"),
+            Transaction(user_id=test_user.id, account_id=checking.id, transfer_account_id=savings.id,
+                        type=TransactionType.TRANSFER, amount=Decimal("300.00"),
+                        date=date(2026, 2, 20), description="To savings"),
+            Transaction(user_id=test_user.id, account_id=savings.id, type=TransactionType.DEBIT,
+                        amount=Decimal("50.00"), date=date(2026, 3, 1), description="Fee"),
+        ])
+        db_session.commit()
+
+        service = AccountBalanceService(db_session)
+        accounts = [checking, savings]
+        as_of_dates = [date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31)]
+
+        history = service.get_balance_history(accounts, as_of_dates)
+        for account in accounts:
+            assert history[account.id] == [
+                account.calculate_balance(db_session, as_of_date=as_of) for as_of in as_of_dates
+            ]
+        assert history[checking.id] == [Decimal("1500.00"), Decimal("1080.00"), Decimal("1080.00")]
+        assert history[savings.id] == [Decimal("5000.00"), Decimal("5300.00"), Decimal("5250.00")]
+
+        assert service.get_balances(accounts) == {
+            checking.id: Decimal("1080.00"),
+            savings.id: Decimal("5250.00"),
+        }
+        assert service.get_balances(accounts, as_of_date=date(2026, 2, 10)) == {
+            checking.id: Decimal("1380.00"),
+            savings.id: Decimal("5000.00"),
+        }
@@ -91,6 +91,37 @@ class TestAccountCRUD:
         assert data[0]["name"] == "Checking"
         assert data[1]["name"] == "Savings"
 
+    def test_get_accounts_balances_in_one_query(self, client, auth_headers, test_user, db_session, count_queries):
+        """Test that listing accounts computes all balances without a query per account."""
+        from datetime import date
+        from app.models.account import Account
+        from app.models.transaction import Transaction, TransactionType
+
+        accounts = [
+            Account(user_id=test_user.id, name=f"Account {i}", type=AccountType.CHECKING,
+                    currency="USD", opening_balance=Decimal("100.00"))
+            for i in range(5)
+        ]
+        db_session.add_all(accounts)
+        db_session.commit()
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=account.id, type=TransactionType.DEBIT,
+                        amount=Decimal("10.00") * (i + 1), date=date(2024, 1, 1))
+            for i, account in enumerate(accounts)
+        ])
+        db_session.commit()
+
+        with count_queries() as statements:
+            response = client.get("/api/v1/accounts", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [Decimal(a["current_balance"]) for a in data] == [
+            account.calculate_balance(db_session) for account in accounts
+        ]
+        # Auth user, accounts, balances
+        assert len(statements) <= 3
+
     def test_get_account_by_id(self, client, auth_headers, test_user, db_session):
         """Test retrieving a specific account by ID."""
         from app.models.account import Account
@@ -173,6 +204,35 @@ class TestAccountCRUD:
         response = client.get(f"/api/v1/accounts/{account.id}", headers=auth_headers)
         assert response.status_code == 404
 
+    def test_delete_account_with_transactions(self, client, auth_headers, test_user, db_session):
+        """Test deleting an account removes its transactions without loading them."""
+        from datetime import date
+        from app.models.account import Account
+        from app.models.transaction import Transaction, TransactionType
+
+        account = Account(
+            user_id=test_user.id,
+            name="To Delete",
+            type=AccountType.CHECKING,
+            currency="USD"
+        )
+        db_session.add(account)
+        db_session.commit()
+
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=account.id, type=TransactionType.DEBIT,
+                        amount=Decimal("10.00"), date=date(2024, 1, i + 1))
+            for i in range(3)
+        ])
+        db_session.commit()
+        account_id = account.id
+        db_session.expunge_all()
+
+        response = client.delete(f"/api/v1/accounts/{account_id}", headers=auth_headers)
+
+        assert response.status_code == 204
+        assert db_session.query(Transaction).filter(Transaction.account_id == account_id).count() == 0
+
     def test_user_can_only_access_own_accounts(self, client, db_session):
         """Test that users can only access their own accounts."""
         from app.models.user import User
@@ -0,0 +1,36 @@
+"""
+Tests for the shared cache (Redis when REDIS_URL is set, else per-process).
+"""
+from app.core import cache
+
+
+class TestSharedCache:
+    """Tests for generations and cached values."""
+
+    def test_bump_generation_is_per_user_and_namespace(self):
+        """Test that a bump only changes the bumped user's namespace."""
+        assert cache.get_generation("reports", 1) == 0
+
+        cache.bump_generation("reports", 1)
+
+        assert cache.get_generation("reports", 1) == 1
+        assert cache.get_generation("reports", 2) == 0
+        assert cache.get_generation("payees", 1) == 0
+
+    def test_set_and_get_value(self):
+        """Test storing and reading back a value."""
+        assert cache.get_value("reports:test") is None
+
+        cache.set_value("reports:test", b'{"total": "1.00"}', ttl_seconds=30)
+
+        assert cache.get_value("reports:test") == b'{"total": "1.00"}'
+
+    def test_clear_drops_values_and_generations(self):
+        """Test that clear resets the cache."""
+        cache.set_value("reports:test", b"1", ttl_seconds=30)
+        cache.bump_generation("reports", 1)
+
+        cache.clear()
+
+        assert cache.get_value("reports:test") is None
+        assert cache.get_generation("reports", 1) == 0
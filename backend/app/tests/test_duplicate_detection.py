@@ -171,6 +171,28 @@ class TestFITIDExactMatching:
         fitid_duplicates = [d for d in duplicates if d.confidence_score == 1.00]
         assert len(fitid_duplicates) == 0
 
+    def test_get_existing_fitids_batch(self, db_session: Session, test_user: User, test_account: Account, duplicate_service: DuplicateDetectionService):
+        """Batch FITID lookup returns only FITIDs already stored in the account"""
+        db_session.add(Transaction(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            amount=50.00,
+            type=TransactionType.DEBIT,
+            date=datetime(2026, 1, 15).date(),
+            description="Amazon Purchase",
+            fitid="FITID12345"
+        ))
+        db_session.commit()
+
+        existing = duplicate_service.get_existing_fitids(
+            test_user.id,
+            test_account.id,
+            ["FITID12345", "FITID67890", None]
+        )
+
+        assert existing == {"FITID12345"}
+        assert duplicate_service.get_existing_fitids(test_user.id, test_account.id, []) == set()
+
 
 class TestFuzzyMatching:
     """Test date + amount + description fuzzy matching"""
@@ -493,6 +515,35 @@ class TestMultipleTransactions:
         # Should find the old transaction as a duplicate
         assert len(duplicates) == 1
 
+    def test_batch_matches_only_within_each_rows_window(self, db_session: Session, test_user: User, test_account: Account, duplicate_service: DuplicateDetectionService):
+        """Batch prefetch must still apply the ±2 day window per row"""
+        existing = Transaction(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            amount=25.00,
+            type=TransactionType.DEBIT,
+            date=datetime(2026, 6, 10).date(),
+            description="CHIPOTLE"
+        )
+        db_session.add(existing)
+        db_session.commit()
+
+        # Same amount and description, but only the June row is near the existing one
+        new_transactions = [
+            {'date': '2026-01-10', 'amount': 25.00, 'description': 'CHIPOTLE', 'row': 0},
+            {'date': '2026-06-11', 'amount': 25.00, 'description': 'CHIPOTLE', 'row': 1},
+        ]
+
+        duplicates = duplicate_service.find_duplicates(
+            test_user.id,
+            test_account.id,
+            new_transactions
+        )
+
+        assert len(duplicates) == 1
+        assert duplicates[0].existing_transaction_id == existing.id
+        assert duplicates[0].new_transaction['row'] == 1
+
 
 class TestEdgeCases:
     """Test edge cases and error handling"""
@@ -300,3 +300,61 @@ NEWFILEUID:NONE
 
             assert response.status_code == 200
             assert expected_media_type in response.headers['content-type']
+
+    def test_history_includes_account_name_and_file_flag(self, client: TestClient, db_session: Session, test_user: User, test_account: Account, auth_headers):
+        """Test that import history reports account names and stored-file presence"""
+        from app.services.import_service import ImportService
+        service = ImportService(db_session)
+
+        with_file = service.create_import_record(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            filename="with_file.csv",
+            import_type="csv",
+            total_rows=1,
+            file_size=10,
+            file_data=b"Date,Amount\n2026-01-01,100"
+        )
+        without_file = service.create_import_record(
+            user_id=test_user.id,
+            account_id=None,
+            filename="without_file.csv",
+            import_type="csv",
+            total_rows=1
+        )
+
+        response = client.get("/api/v1/imports/history", headers=auth_headers)
+
+        assert response.status_code == 200
+        history = {item['id']: item for item in response.json()}
+        assert history[with_file.id]['account_name'] == "Test Checking"
+        assert history[with_file.id]['has_file_data'] is True
+        assert history[without_file.id]['account_name'] is None
+        assert history[without_file.id]['has_file_data'] is False
+
+    def test_download_streams_large_file(self, client: TestClient, db_session: Session, test_user: User, test_account: Account, auth_headers):
+        """Test that files larger than one stream chunk download intact"""
+        from app.services.import_service import ImportService
+        service = ImportService(db_session)
+
+        csv_content = b"Date,Description,Amount\n" + b"".join(
+            f"2026-01-01,Row {i},{i}.00\n".encode() for i in range(20000)
+        )
+        import_record = service.create_import_record(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            filename="large.csv",
+            import_type="csv",
+            total_rows=20000,
+            file_size=len(csv_content),
+            file_data=csv_content
+        )
+
+        response = client.get(
+            f"/api/v1/imports/{import_record.id}/download",
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert len(csv_content) > 64 * 1024
+        assert response.content == csv_content
@@ -0,0 +1,125 @@
+"""
+Tests for the intelligent payee analysis cache on the import endpoints.
+"""
+
+import json
+from fastapi.testclient import TestClient
+
+from app.api.v1 import imports
+from app.models.user import User
+from app.schemas.imports import CSVColumnMapping
+
+
+CSV_CONTENT = b"""Date,Description,Amount
+2024-01-15,STARBUCKS STORE 1234,-5.50
+2024-01-16,SHELL OIL 5678,-40.00"""
+
+MAPPING = {"date": "Date", "amount": "Amount", "description": "Description"}
+
+
+class TestAnalysisCache:
+    """Test suite for caching repeated intelligent analyses"""
+
+    def _analyze(self, client: TestClient, auth_headers, mapping=MAPPING):
+        return client.post(
+            "/api/v1/imports/csv/analyze-payees-intelligent",
+            files={"file": ("test.csv", CSV_CONTENT, "text/csv")},
+            data={"column_mapping": json.dumps(mapping)},
+            headers=auth_headers
+        )
+
+    def test_cache_key_depends_on_user_content_and_mapping(self):
+        """Test that the key changes with user, file contents and column mapping"""
+        mapping = CSVColumnMapping(**MAPPING)
+        key = imports._analysis_cache_key(1, CSV_CONTENT, mapping)
+
+        assert key == imports._analysis_cache_key(1, CSV_CONTENT, CSVColumnMapping(**MAPPING))
+        assert key != imports._analysis_cache_key(2, CSV_CONTENT, mapping)
+        assert key != imports._analysis_cache_key(1, CSV_CONTENT + b"\n", mapping)
+        assert key != imports._analysis_cache_key(
+            1, CSV_CONTENT, CSVColumnMapping(**{**MAPPING, "payee": "Description"})
+        )
+        assert imports._analysis_cache_key(1, CSV_CONTENT)[3] is None
+
+    def test_repeat_analysis_served_from_cache(self, client: TestClient, test_user: User, auth_headers):
+        """Test that re-submitting the same file returns the cached analysis"""
+        first = self._analyze(client, auth_headers)
+        assert first.status_code == 200
+
+        key = imports._analysis_cache_key(test_user.id, CSV_CONTENT, CSVColumnMapping(**MAPPING))
+        assert key in imports._analysis_cache
+
+        second = self._analyze(client, auth_headers)
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+        imports.invalidate_analysis_cache(test_user.id)
+        assert key not in imports._analysis_cache
+
+    def test_payee_and_pattern_writes_invalidate_cached_analysis(
+        self, client: TestClient, test_user: User, auth_headers, monkeypatch
+    ):
+        """Test that changing payees or patterns between two analyses re-runs the analysis"""
+        calls = []
+        run_analysis = imports._run_intelligent_analysis
+
+        def counting_analysis(*args, **kwargs):
+            calls.append(1)
+            return run_analysis(*args, **kwargs)
+
+        monkeypatch.setattr(imports, "_run_intelligent_analysis", counting_analysis)
+
+        assert self._analyze(client, auth_headers).status_code == 200
+        assert self._analyze(client, auth_headers).status_code == 200
+        assert len(calls) == 1
+
+        # Creating a payee
+        payee = client.post("/api/v1/payees", json={"canonical_name": "Starbucks"}, headers=auth_headers)
+        assert payee.status_code == 200
+        payee_id = payee.json()["id"]
+        assert self._analyze(client, auth_headers).status_code == 200
+        assert len(calls) == 2
+
+        # Adding a pattern
+        pattern = client.post(
+            f"/api/v1/payees/{payee_id}/patterns",
+            json={"pattern_type": "exact_match", "pattern_value": "STARBUCKS STORE 1234"},
+            headers=auth_headers
+        )
+        assert pattern.status_code == 200
+        assert self._analyze(client, auth_headers).status_code == 200
+        assert len(calls) == 3
+
+        # Deleting the payee: the fresh analysis must not point at it
+        assert client.delete(f"/api/v1/payees/{payee_id}", headers=auth_headers).status_code == 200
+        third = self._analyze(client, auth_headers)
+        assert third.status_code == 200
+        assert len(calls) == 4
+        assert payee_id not in [a["matched_payee_id"] for a in third.json()["analyses"]]
+
+    def test_execute_ignores_picked_payee_deleted_since_analysis(
+        self, client: TestClient, test_account, auth_headers
+    ):
+        """Test that a decision naming a deleted payee falls back to extraction"""
+        payee = client.post("/api/v1/payees", json={"canonical_name": "Starbucks"}, headers=auth_headers)
+        payee_id = payee.json()["id"]
+        assert client.delete(f"/api/v1/payees/{payee_id}", headers=auth_headers).status_code == 200
+
+        request_data = {
+            "account_id": test_account.id,
+            "payee_assignments": [{
+                "transaction_index": 0,
+                "original_description": "STARBUCKS STORE 1234",
+                "payee_id": payee_id,
+                "create_pattern": True
+            }]
+        }
+        response = client.post(
+            "/api/v1/imports/csv/execute-with-payee-decisions",
+            files={"file": ("test.csv", CSV_CONTENT, "text/csv")},
+            data={"column_mapping": json.dumps(MAPPING), "request_data": json.dumps(request_data)},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["imported_count"] == 2
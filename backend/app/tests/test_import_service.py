@@ -27,6 +27,66 @@ class TestImportService:
         assert 'Deposit' in df.columns
         assert df.iloc[0]['Description'] == 'GROCERY STORE'
 
+    def test_parse_csv_file_reads_from_file_object(self, import_service):
+        """Test parsing directly from a file object matches parsing bytes"""
+        csv_data = "Date,Description,Amount\n2024-01-15,CAF\u00c9 PARIS,-4.50\n".encode('latin-1')
+
+        df = import_service.parse_csv_file(BytesIO(csv_data))
+
+        assert df.columns.tolist() == ['Date', 'Description', 'Amount']
+        assert df.equals(import_service.parse_csv(csv_data))
+
+    def test_compress_file_streams_gzip(self, import_service):
+        """Test that compress_file gzips a file object and reports its size"""
+        import gzip
+        csv_data = b"Date,Description,Amount\n" + b"2024-01-15,COFFEE,-4.50\n" * 5000
+        file_obj = BytesIO(csv_data)
+
+        compressed, size = import_service.compress_file(file_obj)
+
+        assert size == len(csv_data)
+        assert gzip.decompress(compressed) == csv_data
+        assert file_obj.tell() == 0
+
+    def test_parse_csv_upload_reuses_parsed_dataframe(self, import_service):
+        """Test that the same upload is parsed once and shared per user"""
+        csv_data = b"Date,Description,Amount\n2024-01-15,COFFEE,-4.50\n"
+
+        first = import_service.parse_csv_upload(1, BytesIO(csv_data))
+        second = import_service.parse_csv_upload(1, BytesIO(csv_data))
+        other_user = import_service.parse_csv_upload(2, BytesIO(csv_data))
+
+        assert second is first
+        assert other_user is not first
+        assert list(first.columns) == ['Date', 'Description', 'Amount']
+
+    def test_parse_csv_upload_skips_caching_large_results(self, import_service, monkeypatch):
+        """Test that parsed uploads over the per-entry byte limit are not kept in the cache"""
+        from app.services import import_service as import_service_module
+
+        csv_data = b"Date,Description,Amount\n" + b"2024-01-15,COFFEE,-4.50\n" * 100
+        monkeypatch.setattr(import_service_module, "PARSED_UPLOAD_CACHE_MAX_ENTRY_BYTES", 1024)
+
+        first = import_service.parse_csv_upload(3, BytesIO(csv_data))
+        second = import_service.parse_csv_upload(3, BytesIO(csv_data))
+
+        assert second is not first
+        assert second.equals(first)
+
+    def test_parse_csv_preview_limits_rows_and_counts_all(self, import_service):
+        """Test that the preview parses only the head but reports the full row count"""
+        csv_data = b"Date,Description,Amount\n" + b"2024-01-15,COFFEE,-4.50\n" * 500
+
+        df, row_count = import_service.parse_csv_preview(BytesIO(csv_data), max_rows=50)
+        assert len(df) == 50
+        assert row_count == 500
+
+        small_df, small_count = import_service.parse_csv_preview(
+            BytesIO(b"Date,Description,Amount\n2024-01-15,COFFEE,-4.50"), max_rows=50
+        )
+        assert len(small_df) == 1
+        assert small_count == 1
+
     def test_detect_csv_format_generic(self, import_service):
         """Test format detection for generic CSV with split columns"""
         csv_data = b"""Date,Description,Withdrawal,Deposit
@@ -311,3 +371,178 @@ INVALID_DATE,SHOULD SKIP,200.00
         assert len(transactions) == 2
         assert transactions[0]['amount'] == 100.00
         assert transactions[1]['amount'] == 300.00
+
+    def test_map_transactions_skip_rows_and_optional_columns(self, import_service):
+        """Test skip_rows, optional columns and missing required columns"""
+        csv_data = b"""Date,Description,Amount,Reference
+2024-01-15,FIRST,-10.00,1001
+2024-01-16,SECOND,20.00,1002
+2024-01-17,THIRD,-30.00,1003"""
+
+        df = import_service.parse_csv(csv_data)
+        mapping = CSVColumnMapping(
+            date="Date",
+            amount="Amount",
+            description="Description",
+            notes="Reference"
+        )
+        transactions = import_service.map_csv_to_transactions(df, mapping, skip_rows=[1])
+
+        assert [t['row'] for t in transactions] == [0, 2]
+        assert transactions[0]['description'] == 'FIRST'
+        # Integer column is not upcast to float alongside the amount column
+        assert transactions[0]['notes'] == '1001'
+        assert 'payee' not in transactions[0]
+
+        missing = CSVColumnMapping(date="Posted", amount="Amount")
+        assert import_service.map_csv_to_transactions(df, missing) == []
+
+    def test_map_transactions_matches_scalar_parsers(self, import_service):
+        """Test that column-wise mapping agrees with _parse_date/_parse_amount per row"""
+        csv_data = b"""Date,Description,Amount
+2024-01-15,ISO,-10.00
+01/16/2024,US,"$1,234.56"
+17 Jan 2024,DAY MONTH,(5.25)
+20240118,COMPACT,7
+not a date,BAD DATE,1.00
+2024-01-19,BAD AMOUNT,abc
+2024-01-20,INFINITE,inf"""
+
+        df = import_service.parse_csv(csv_data)
+        mapping = CSVColumnMapping(date="Date", amount="Amount", description="Description")
+        transactions = import_service.map_csv_to_transactions(df, mapping)
+
+        assert [(t['description'], t['date'], t['amount'], t['type']) for t in transactions] == [
+            ('ISO', '2024-01-15', 10.0, 'DEBIT'),
+            ('US', '2024-01-16', 1234.56, 'CREDIT'),
+            ('DAY MONTH', '2024-01-17', 5.25, 'DEBIT'),
+            ('COMPACT', '2024-01-18', 7.0, 'CREDIT'),
+        ]
+        assert [t['row'] for t in transactions] == [0, 1, 2, 3]
+
+    def test_finite_amount_mask_flags_invalid_amounts(self, import_service):
+        """Test that finite_amount_mask rejects NaN, infinity and missing amounts"""
+        transactions = [
+            {'amount': 45.67},
+            {'amount': float('nan')},
+            {'amount': None},
+            {'amount': float('inf')},
+            {},
+            {'amount': 0.0},
+        ]
+
+        mask = import_service.finite_amount_mask(transactions)
+
+        assert mask.tolist() == [True, False, False, False, False, True]
+
+    def test_bulk_insert_transactions_links_rows_to_import(self, import_service, db_session, test_user, test_account):
+        """Test that bulk insertion creates transactions and import links in row order"""
+        from app.models.import_history import ImportedTransaction
+        from app.models.transaction import Transaction, TransactionType
+
+        import_record = import_service.create_import_record(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            filename="bulk.csv",
+            import_type="csv",
+            total_rows=2
+        )
+        rows = [
+            import_service.build_transaction_row(
+                test_user.id, test_account.id,
+                {'date': '2024-01-15', 'amount': 45.67, 'type': 'DEBIT', 'description': 'GROCERY STORE'}
+            ),
+            import_service.build_transaction_row(
+                test_user.id, test_account.id,
+                {'date': '2024-01-16', 'amount': 2000.00, 'type': 'CREDIT', 'description': 'PAYCHECK'}
+            ),
+        ]
+
+        transaction_ids = import_service.bulk_insert_transactions(import_record.id, rows, [0, 3])
+
+        assert len(transaction_ids) == 2
+        first = db_session.query(Transaction).filter(Transaction.id == transaction_ids[0]).one()
+        assert first.description == 'GROCERY STORE'
+        assert first.type == TransactionType.DEBIT
+
+        links = db_session.query(ImportedTransaction).filter(
+            ImportedTransaction.import_id == import_record.id
+        ).order_by(ImportedTransaction.row_number).all()
+        assert [(l.transaction_id, l.row_number) for l in links] == [
+            (transaction_ids[0], 0),
+            (transaction_ids[1], 3),
+        ]
+
+    def test_rollback_import_deletes_imported_transactions(self, import_service, client, db_session, test_user, test_account, auth_headers):
+        """Test that rolling back an import removes only that import's transactions"""
+        from app.models.transaction import Transaction
+
+        import_record = import_service.create_import_record(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            filename="rollback.csv",
+            import_type="csv",
+            total_rows=2
+        )
+        rows = [
+            import_service.build_transaction_row(
+                test_user.id, test_account.id,
+                {'date': '2024-01-15', 'amount': 10.00, 'type': 'DEBIT', 'description': 'FIRST'}
+            ),
+            import_service.build_transaction_row(
+                test_user.id, test_account.id,
+                {'date': '2024-01-16', 'amount': 20.00, 'type': 'DEBIT', 'description': 'SECOND'}
+            ),
+        ]
+        transaction_ids = import_service.bulk_insert_transactions(import_record.id, rows, [0, 1])
+
+        # A transaction outside the import must survive the rollback
+        kept = Transaction(**import_service.build_transaction_row(
+            test_user.id, test_account.id,
+            {'date': '2024-01-17', 'amount': 30.00, 'type': 'DEBIT', 'description': 'MANUAL'}
+        ))
+        db_session.add(kept)
+        db_session.commit()
+        kept_id = kept.id
+
+        response = client.delete(f"/api/v1/imports/history/{import_record.id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()['deleted_count'] == 2
+        remaining = {t.id for t in db_session.query(Transaction.id).filter(Transaction.account_id == test_account.id)}
+        assert remaining == {kept_id}
+        assert not set(transaction_ids) & remaining
+        db_session.refresh(import_record)
+        assert import_record.status == "cancelled"
+        assert import_record.can_rollback is False
+
+    def test_complete_import_record_stores_row_error_summary(self, import_service, db_session, test_user, test_account):
+        """Test that failed rows are summarized once onto the import record"""
+        from app.api.v1.imports import ROW_ERROR_SUMMARY_LIMIT, report_row_errors
+
+        row_errors = [(row, "bad amount") for row in range(ROW_ERROR_SUMMARY_LIMIT + 5)]
+        summary = report_row_errors("csv", row_errors)
+
+        assert summary.startswith(f"{len(row_errors)} CSV row(s) failed to import")
+        assert "row 0: bad amount" in summary
+        assert summary.endswith("(and 5 more)")
+        assert report_row_errors("csv", []) is None
+
+        import_record = import_service.create_import_record(
+            user_id=test_user.id,
+            account_id=test_account.id,
+            filename="test.csv",
+            import_type="csv",
+            total_rows=len(row_errors)
+        )
+        import_service.complete_import_record(
+            import_id=import_record.id,
+            imported_count=0,
+            duplicate_count=0,
+            error_count=len(row_errors),
+            error_message=summary
+        )
+
+        db_session.refresh(import_record)
+        assert import_record.error_message == summary
+        assert import_record.error_count == len(row_errors)
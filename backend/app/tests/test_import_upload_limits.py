@@ -0,0 +1,44 @@
+"""
+Tests for the extension and size gate on import upload endpoints.
+"""
+
+import json
+from fastapi.testclient import TestClient
+
+from app.api.v1 import imports
+from app.models.account import Account
+
+
+CSV_CONTENT = b"""Date,Description,Amount
+2024-01-15,STARBUCKS STORE 1234,-5.50"""
+
+MAPPING = {"date": "Date", "amount": "Amount", "description": "Description"}
+
+
+class TestUploadLimits:
+    """Test suite for rejecting bad uploads before they are parsed"""
+
+    def test_detect_duplicates_rejects_wrong_extension(self, client: TestClient, test_account: Account, auth_headers):
+        """Test that detect-duplicates checks the extension like preview does"""
+        response = client.post(
+            "/api/v1/imports/csv/detect-duplicates",
+            files={"file": ("statement.txt", CSV_CONTENT, "text/plain")},
+            data={"account_id": str(test_account.id), "column_mapping": json.dumps(MAPPING)},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == imports.CSV_FORMAT_ERROR
+
+    def test_execute_rejects_oversized_upload(self, client: TestClient, test_account: Account, auth_headers, monkeypatch):
+        """Test that uploads over MAX_UPLOAD_BYTES get a 413"""
+        monkeypatch.setattr(imports, "MAX_UPLOAD_BYTES", len(CSV_CONTENT) - 1)
+
+        response = client.post(
+            "/api/v1/imports/ofx/execute",
+            files={"file": ("statement.ofx", CSV_CONTENT, "application/x-ofx")},
+            data={"account_id": str(test_account.id)},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 413
@@ -0,0 +1,98 @@
+"""
+Tests for the monthly_category_rollups table maintained by the transactions trigger.
+"""
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import delete, insert
+
+from app.models.category import Category, CategoryType
+from app.models.monthly_category_rollup import MonthlyCategoryRollup
+from app.models.transaction import Transaction, TransactionType
+
+
+class TestMonthlyCategoryRollup:
+    """Test suite for keeping rollup rows in sync with transactions"""
+
+    def _rollup(self, db_session, user_id):
+        rows = db_session.query(MonthlyCategoryRollup).filter(
+            MonthlyCategoryRollup.user_id == user_id,
+            MonthlyCategoryRollup.transaction_count > 0
+        ).all()
+        return {
+            (row.category_id, row.type, row.month): (row.total_amount, row.transaction_count)
+            for row in rows
+        }
+
+    def _categories(self, db_session, test_user):
+        food = Category(user_id=test_user.id, name="Food", type=CategoryType.EXPENSE)
+        fuel = Category(user_id=test_user.id, name="Fuel", type=CategoryType.EXPENSE)
+        db_session.add_all([food, fuel])
+        db_session.commit()
+        return food, fuel
+
+    def test_insert_update_delete_keep_rollup_in_sync(self, db_session, test_user, test_account):
+        """Test that ORM writes add, move and remove amounts in the rollup"""
+        food, fuel = self._categories(db_session, test_user)
+
+        tx1 = Transaction(user_id=test_user.id, account_id=test_account.id, category_id=food.id,
+                          type=TransactionType.DEBIT, amount=Decimal("10.00"), date=date(2024, 1, 5))
+        tx2 = Transaction(user_id=test_user.id, account_id=test_account.id, category_id=food.id,
+                          type=TransactionType.DEBIT, amount=Decimal("15.00"), date=date(2024, 1, 20))
+        uncategorized = Transaction(user_id=test_user.id, account_id=test_account.id,
+                                    type=TransactionType.DEBIT, amount=Decimal("99.00"), date=date(2024, 1, 7))
+        db_session.add_all([tx1, tx2, uncategorized])
+        db_session.commit()
+
+        assert self._rollup(db_session, test_user.id) == {
+            (food.id, TransactionType.DEBIT, date(2024, 1, 1)): (Decimal("25.00"), 2),
+        }
+
+        # Move one transaction to another category and month
+        tx2.category_id = fuel.id
+        tx2.date = date(2024, 2, 3)
+        tx2.amount = Decimal("20.00")
+        db_session.commit()
+
+        assert self._rollup(db_session, test_user.id) == {
+            (food.id, TransactionType.DEBIT, date(2024, 1, 1)): (Decimal("10.00"), 1),
+            (fuel.id, TransactionType.DEBIT, date(2024, 2, 1)): (Decimal("20.00"), 1),
+        }
+
+        db_session.delete(tx1)
+        db_session.commit()
+
+        assert self._rollup(db_session, test_user.id) == {
+            (fuel.id, TransactionType.DEBIT, date(2024, 2, 1)): (Decimal("20.00"), 1),
+        }
+
+    def test_bulk_statements_and_cascades_keep_rollup_in_sync(self, db_session, test_user, test_account):
+        """Test that writes bypassing the ORM (bulk insert/delete, FK SET NULL) are rolled up"""
+        food, fuel = self._categories(db_session, test_user)
+
+        db_session.execute(insert(Transaction), [
+            {"user_id": test_user.id, "account_id": test_account.id, "category_id": food.id,
+             "type": TransactionType.DEBIT, "amount": Decimal("5.00"), "date": date(2024, 3, 1)},
+            {"user_id": test_user.id, "account_id": test_account.id, "category_id": fuel.id,
+             "type": TransactionType.DEBIT, "amount": Decimal("40.00"), "date": date(2024, 3, 2)},
+            {"user_id": test_user.id, "account_id": test_account.id, "category_id": fuel.id,
+             "type": TransactionType.DEBIT, "amount": Decimal("60.00"), "date": date(2024, 3, 9)},
+        ])
+        db_session.commit()
+
+        assert self._rollup(db_session, test_user.id) == {
+            (food.id, TransactionType.DEBIT, date(2024, 3, 1)): (Decimal("5.00"), 1),
+            (fuel.id, TransactionType.DEBIT, date(2024, 3, 1)): (Decimal("100.00"), 2),
+        }
+
+        # Deleting a category sets its transactions' category_id to NULL
+        db_session.execute(delete(Category).where(Category.id == food.id))
+        db_session.execute(delete(Transaction).where(
+            Transaction.category_id == fuel.id,
+            Transaction.amount == Decimal("40.00")
+        ))
+        db_session.commit()
+
+        assert self._rollup(db_session, test_user.id) == {
+            (fuel.id, TransactionType.DEBIT, date(2024, 3, 1)): (Decimal("60.00"), 1),
+        }
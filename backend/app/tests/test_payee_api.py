@@ -157,6 +157,37 @@ class TestPayeeAPI:
         assert response.status_code == 200
         assert len(response.json()) == 5
 
+    def test_get_payees_cursor_pagination(
+        self, client: TestClient, auth_headers, db_session, test_user
+    ):
+        """Test walking pages with X-Next-Cursor matches one big page."""
+        from app.services.payee_service import PayeeService
+
+        service = PayeeService(db_session)
+        for i in range(10):
+            payee = service.get_or_create(user_id=test_user.id, canonical_name=f"Shop {chr(65 + i)}")
+            # Mix of used (with last_used_at) and never-used payees
+            for _ in range(i % 3):
+                service.increment_usage(payee.id)
+
+        full = client.get("/api/v1/payees?limit=100", headers=auth_headers).json()
+
+        walked = []
+        url = "/api/v1/payees?limit=4"
+        while True:
+            response = client.get(url, headers=auth_headers)
+            assert response.status_code == 200
+            walked.extend(p["id"] for p in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            url = f"/api/v1/payees?limit=4&cursor={next_cursor}"
+
+        assert walked == [p["id"] for p in full]
+
+        bad = client.get("/api/v1/payees?cursor=not-a-cursor", headers=auth_headers)
+        assert bad.status_code == 400
+
     def test_autocomplete_payees(
         self, client: TestClient, auth_headers, test_category, db_session
     ):
@@ -213,6 +244,31 @@ class TestPayeeAPI:
         )
         assert response.status_code == 422  # Validation error
 
+    def test_autocomplete_cache_invalidated_by_payee_writes(
+        self, client: TestClient, auth_headers
+    ):
+        """Test that repeat autocomplete hits are cached until a payee changes."""
+        created = client.post(
+            "/api/v1/payees",
+            json={"canonical_name": "Costco"},
+            headers=auth_headers
+        ).json()
+
+        first = client.get("/api/v1/payees/autocomplete?q=cost", headers=auth_headers)
+        second = client.get("/api/v1/payees/autocomplete?q=COST", headers=auth_headers)
+        assert first.status_code == 200
+        assert second.content == first.content
+        assert [p["canonical_name"] for p in first.json()] == ["Costco"]
+
+        client.put(
+            f"/api/v1/payees/{created['id']}",
+            json={"canonical_name": "Costco Wholesale"},
+            headers=auth_headers
+        )
+
+        response = client.get("/api/v1/payees/autocomplete?q=cost", headers=auth_headers)
+        assert [p["canonical_name"] for p in response.json()] == ["Costco Wholesale"]
+
     def test_get_payee_by_id(
         self, client: TestClient, auth_headers, db_session
     ):
@@ -676,8 +732,8 @@ class TestPayeePatternAPI:
             },
             headers=auth_headers
         )
-        assert response.status_code == 400
-        assert "at least 4 characters" in response.json()["detail"]
+        assert response.status_code == 422
+        assert "at least 4 characters" in response.json()["detail"][0]["msg"]
 
     def test_create_pattern_invalid_type_fails(
         self, client: TestClient, auth_headers, db_session
@@ -701,8 +757,8 @@ class TestPayeePatternAPI:
             },
             headers=auth_headers
         )
-        assert response.status_code == 400
-        assert "Invalid pattern type" in response.json()["detail"]
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "pattern_type"]
 
     def test_create_pattern_payee_not_found(
         self, client: TestClient, auth_headers
@@ -913,4 +969,4 @@ class TestPayeePatternAPI:
             json={"description": "TEST DESCRIPTION"},
             headers=auth_headers
         )
-        assert response.status_code == 400
+        assert response.status_code == 422
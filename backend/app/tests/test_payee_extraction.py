@@ -43,6 +43,15 @@ class TestPayeeExtraction:
         assert extracted == "Coffee Shop"
         assert confidence > 0.6  # Should have good confidence
 
+    def test_repeated_description_uses_cached_result(self, extraction_service: PayeeExtractionService):
+        """Test that repeated descriptions return the memoized extraction result"""
+        description = "SQ *COFFEE SHOP"
+        first = extraction_service.extract_payee_name_with_category(description)
+        second = extraction_service.extract_payee_name_with_category(description)
+
+        assert first == second
+        assert extraction_service._extraction_cache[description] == first
+
     def test_extract_toast_prefix(self, extraction_service: PayeeExtractionService):
         """Test removing Toast payment processor prefix"""
         description = "TST* RESTAURANT ABC"
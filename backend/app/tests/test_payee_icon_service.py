@@ -1,5 +1,6 @@
 """Tests for PayeeIconService - brand logo and emoji suggestion functionality."""
 
+import json
 import pytest
 from app.services.payee_icon_service import PayeeIconService, payee_icon_service
 
@@ -257,6 +258,40 @@ class TestPayeeIconService:
 
         assert len(slugs) == len(set(slugs))
 
+    def test_get_all_brands_built_once(self):
+        """Test that the brand list is reused across calls."""
+        assert self.service.get_all_brands() is self.service.get_all_brands()
+
+    def test_get_all_brands_json_matches_list(self):
+        """Test that the pre-serialized brand list decodes to get_all_brands."""
+        assert json.loads(self.service.get_all_brands_json()) == self.service.get_all_brands()
+
+    def test_get_all_brands_etag_is_stable_and_quoted(self):
+        """Test that the brand ETag is a quoted hash identical across instances."""
+        etag = self.service.get_all_brands_etag()
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == PayeeIconService().get_all_brands_etag()
+
+    # =========================================================================
+    # Caching Tests
+    # =========================================================================
+
+    def test_suggest_icon_memoized_by_normalized_name(self):
+        """Test that names normalizing to the same key share one computation."""
+        first = self.service.suggest_icon("STARBUCKS #123")
+        second = self.service.suggest_icon("starbucks 123")
+
+        assert first == second
+        assert self.service._suggest_normalized.cache_info().hits == 1
+
+    def test_suggest_icon_returns_copy_of_cached_result(self):
+        """Test that mutating a suggestion doesn't leak into later calls."""
+        result = self.service.suggest_icon("Starbucks")
+        result["icon_type"] = "mutated"
+
+        assert self.service.suggest_icon("Starbucks")["icon_type"] == "brand"
+
     # =========================================================================
     # Emoji Categories Tests
     # =========================================================================
@@ -368,6 +403,19 @@ class TestPayeeIconAPIEndpoints:
         data = response.json()
         assert isinstance(data, list)
         assert len(data) > 100
+        assert response.headers["etag"] == payee_icon_service.get_all_brands_etag()
+
+    def test_list_brands_endpoint_not_modified(self, client, auth_headers):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get("/api/v1/payees/icons/brands", headers=auth_headers).headers["etag"]
+
+        response = client.get(
+            "/api/v1/payees/icons/brands",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
 
     def test_icon_endpoints_require_auth(self, client):
         """Test that icon endpoints require authentication."""
@@ -148,6 +148,116 @@ class TestPayeeService:
 
         assert payee.transaction_count == 2
 
+    def test_get_or_create_many(self, db_session, test_user):
+        """Test resolving several payee names with one lookup."""
+        service = PayeeService(db_session)
+
+        existing = service.get_or_create(user_id=test_user.id, canonical_name="Target")
+
+        payees = service.get_or_create_many(
+            user_id=test_user.id,
+            canonical_names=["Target", "Costco", "Costco", None, ""]
+        )
+
+        assert set(payees.keys()) == {"Target", "Costco"}
+        assert payees["Target"].id == existing.id
+        assert payees["Costco"].id is not None
+        assert payees["Costco"].canonical_name == "Costco"
+
+        # Second call finds the payee created by the first
+        again = service.get_or_create_many(user_id=test_user.id, canonical_names=["Costco"])
+        assert again["Costco"].id == payees["Costco"].id
+
+    def test_get_or_create_without_commit_flushes(self, db_session, test_user):
+        """Test that commit=False assigns an id and is visible to later lookups."""
+        service = PayeeService(db_session)
+
+        payee = service.get_or_create(user_id=test_user.id, canonical_name="Walmart", commit=False)
+        assert payee.id is not None
+
+        again = service.get_or_create(user_id=test_user.id, canonical_name="Walmart", commit=False)
+        assert again.id == payee.id
+
+        db_session.rollback()
+        assert db_session.query(Payee).filter(Payee.canonical_name == "Walmart").count() == 0
+
+    def test_get_or_create_many_without_commit_flushes(self, db_session, test_user):
+        """Test that commit=False leaves new payees to the caller's transaction."""
+        service = PayeeService(db_session)
+
+        payees = service.get_or_create_many(
+            user_id=test_user.id,
+            canonical_names=["Costco", "Kroger"],
+            commit=False
+        )
+        assert payees["Costco"].id is not None
+        assert payees["Kroger"].id is not None
+
+        db_session.rollback()
+        assert db_session.query(Payee).filter(
+            Payee.canonical_name.in_(["Costco", "Kroger"])
+        ).count() == 0
+
+    def test_get_patterns_raises_on_relationship_lazy_loads(self, db_session, test_user, monkeypatch):
+        """Test that the pattern list blocks lazy loads unless disabled."""
+        from sqlalchemy.exc import InvalidRequestError
+        from app.core.config import settings
+
+        user_id = test_user.id
+        service = PayeeService(db_session)
+        payee = service.get_or_create(user_id=user_id, canonical_name="Kroger")
+        service.create_pattern(payee.id, user_id, "exact_match", "KROGER")
+        payee_id = payee.id
+        db_session.expunge_all()
+
+        monkeypatch.setattr(settings, "SHARKFIN_RAISELOAD", True)
+        pattern = service.get_patterns(payee_id, user_id)[0]
+        assert pattern.pattern_value == "KROGER"
+        with pytest.raises(InvalidRequestError):
+            pattern.payee
+
+        db_session.expunge_all()
+        monkeypatch.setattr(settings, "SHARKFIN_RAISELOAD", False)
+        pattern = service.get_patterns(payee_id, user_id)[0]
+        assert pattern.payee.canonical_name == "Kroger"
+
+    def test_list_rows_match_entity_queries(self, db_session, test_user, test_category):
+        """Test that the row-based list queries return the same payees, in order."""
+        from app.schemas.payee import PayeeWithCategory
+
+        service = PayeeService(db_session)
+        service.get_or_create(test_user.id, "Kroger", default_category_id=test_category.id)
+        starbucks = service.get_or_create(test_user.id, "Starbucks")
+        service.increment_usage(starbucks.id)
+
+        rows = service.get_all_rows(test_user.id)
+        entities = service.get_all(test_user.id)
+        assert [PayeeWithCategory.model_validate(r) for r in rows] == \
+            [PayeeWithCategory.model_validate(p) for p in entities]
+        assert rows[1].default_category_name == test_category.name
+
+        search_rows = service.search_payee_rows(test_user.id, "kro")
+        assert [r.id for r in search_rows] == [p.id for p in service.search_payees(test_user.id, "kro")]
+
+    def test_increment_usage_bulk(self, db_session, test_user):
+        """Test incrementing usage for several payees in one statement."""
+        service = PayeeService(db_session)
+
+        target = service.get_or_create(user_id=test_user.id, canonical_name="Target")
+        costco = service.get_or_create(user_id=test_user.id, canonical_name="Costco")
+        service.increment_usage(target.id)
+
+        service.increment_usage_bulk({target.id: 3, costco.id: 2})
+        db_session.refresh(target)
+        db_session.refresh(costco)
+
+        assert target.transaction_count == 4
+        assert costco.transaction_count == 2
+        assert costco.last_used_at is not None
+
+        # Empty batches are a no-op
+        service.increment_usage_bulk({})
+
     def test_search_payees_exact_match(self, db_session, test_user):
         """Test search prioritizes exact matches."""
         service = PayeeService(db_session)
@@ -293,6 +403,22 @@ class TestPayeeService:
         found = service.get_by_id(payee.id, test_user.id)
         assert found is None
 
+    def test_detail_queries_distinguish_missing_payee_from_empty(self, db_session, test_user):
+        """Test that per-payee lookups return None for a missing payee and empty results otherwise."""
+        service = PayeeService(db_session)
+
+        payee = service.get_or_create(test_user.id, "Quiet Store")
+
+        assert service.exists(payee.id, test_user.id) is True
+        assert service.get_transactions(payee.id, test_user.id) == []
+        assert service.get_patterns(payee.id, test_user.id) == []
+        assert service.get_stats(payee.id, test_user.id)["transaction_count"] == 0
+
+        assert service.exists(99999, test_user.id) is False
+        assert service.get_transactions(99999, test_user.id) is None
+        assert service.get_patterns(99999, test_user.id) is None
+        assert service.get_stats(99999, test_user.id) is None
+
     def test_get_all(self, db_session, test_user):
         """Test getting all payees for a user."""
         service = PayeeService(db_session)
@@ -342,6 +468,24 @@ class TestPayeeService:
         found = service.get_by_id(payee.id, test_user.id)
         assert found is None
 
+    def test_update_and_delete_enforce_ownership(self, db_session, test_user):
+        """Test update/delete of another user's payee report not-found and change nothing."""
+        from app.models.payee_matching_pattern import PayeeMatchingPattern
+
+        service = PayeeService(db_session)
+        payee = service.get_or_create(test_user.id, "Corner Store")
+        pattern = service.create_pattern(payee.id, test_user.id, "exact_match", "CORNER STORE")
+        pattern_id = pattern.id
+        other_user_id = test_user.id + 1
+
+        assert service.update(payee.id, other_user_id, PayeeUpdate(notes="hijacked")) is None
+        assert service.delete(payee.id, other_user_id) is False
+        assert service.get_by_id(payee.id, test_user.id).notes is None
+
+        assert service.delete(payee.id, test_user.id) is True
+        # Patterns go with the payee (ON DELETE CASCADE)
+        assert db_session.get(PayeeMatchingPattern, pattern_id) is None
+
     def test_create_with_default_category(self, db_session, test_user, test_category):
         """Test creating payee with default category."""
         service = PayeeService(db_session)
@@ -118,6 +118,7 @@ class TestReportsAPI:
         assert "budget_status" in data
         assert len(data["budget_status"]) == 1
         assert data["budget_status"][0]["budget_name"] == "Grocery Budget"
+        assert data["budget_status"][0]["category_name"] == "Groceries"
         assert Decimal(data["budget_status"][0]["spent"]) == Decimal("500.00")
         assert Decimal(data["budget_status"][0]["remaining"]) == Decimal("100.00")
 
@@ -183,6 +184,65 @@ class TestReportsAPI:
         data = response.json()
         assert Decimal(data["income_vs_expenses"]["total_expenses"]) == Decimal("100.00")
 
+    def test_dashboard_budget_status_clips_budget_windows(self, client, auth_headers, test_user, db_session):
+        """Test budget spending for budgets sharing and not sharing the dashboard period."""
+        from app.models.account import Account, AccountType
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+        from app.models.budget import Budget, BudgetPeriod
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD",
+            opening_balance=Decimal("1000.00")
+        )
+        db_session.add(checking)
+        db_session.commit()
+
+        food = Category(user_id=test_user.id, name="Food", type=CategoryType.EXPENSE)
+        fuel = Category(user_id=test_user.id, name="Fuel", type=CategoryType.EXPENSE)
+        db_session.add_all([food, fuel])
+        db_session.commit()
+
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=food.id,
+                        type=TransactionType.DEBIT, amount=Decimal("40.00"), date=date(2024, 1, 5)),
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=food.id,
+                        type=TransactionType.DEBIT, amount=Decimal("60.00"), date=date(2024, 1, 25)),
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=fuel.id,
+                        type=TransactionType.DEBIT, amount=Decimal("30.00"), date=date(2024, 1, 10)),
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=fuel.id,
+                        type=TransactionType.DEBIT, amount=Decimal("70.00"), date=date(2024, 1, 20)),
+        ])
+        db_session.add_all([
+            # Covers the whole period
+            Budget(user_id=test_user.id, category_id=food.id, name="Food Budget",
+                   amount=Decimal("200.00"), period=BudgetPeriod.MONTHLY, start_date=date(2023, 12, 1)),
+            # Ends mid-period, so only the first fuel purchase counts
+            Budget(user_id=test_user.id, category_id=fuel.id, name="Fuel Budget",
+                   amount=Decimal("50.00"), period=BudgetPeriod.MONTHLY,
+                   start_date=date(2024, 1, 1), end_date=date(2024, 1, 15)),
+            # Same window as the food budget, different category
+            Budget(user_id=test_user.id, category_id=fuel.id, name="Fuel Month",
+                   amount=Decimal("90.00"), period=BudgetPeriod.MONTHLY, start_date=date(2024, 1, 1)),
+        ])
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/reports/dashboard?start_date=2024-01-01&end_date=2024-01-31",
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        statuses = {b["budget_name"]: b for b in response.json()["budget_status"]}
+        assert Decimal(statuses["Food Budget"]["spent"]) == Decimal("100.00")
+        assert Decimal(statuses["Fuel Budget"]["spent"]) == Decimal("30.00")
+        assert Decimal(statuses["Fuel Month"]["spent"]) == Decimal("100.00")
+        assert statuses["Fuel Month"]["is_over_budget"] is True
+        assert statuses["Fuel Budget"]["category_name"] == "Fuel"
+
     def test_spending_by_category(self, client, auth_headers, test_user, db_session):
         """Test spending by category report."""
         from app.models.account import Account, AccountType
@@ -274,6 +334,38 @@ class TestReportsAPI:
         assert Decimal(data["total_spending"]) == Decimal("0.00")
         assert len(data["categories"]) == 0
 
+    def test_spending_by_category_counts_uncategorized_in_total(
+        self, client, auth_headers, test_user, test_account, db_session, count_queries
+    ):
+        """Test that uncategorized spending is in the total and percentages but not listed."""
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+
+        groceries = Category(user_id=test_user.id, name="Groceries", type=CategoryType.EXPENSE)
+        db_session.add(groceries)
+        db_session.commit()
+
+        today = date.today()
+        month_start = date(today.year, today.month, 1)
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=test_account.id, category_id=groceries.id,
+                        type=TransactionType.DEBIT, amount=Decimal("75.00"), date=month_start),
+            Transaction(user_id=test_user.id, account_id=test_account.id,
+                        type=TransactionType.DEBIT, amount=Decimal("25.00"), date=month_start),
+        ])
+        db_session.commit()
+
+        with count_queries() as statements:
+            response = client.get("/api/v1/reports/spending-by-category", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert Decimal(data["total_spending"]) == Decimal("100.00")
+        assert [c["category_name"] for c in data["categories"]] == ["Groceries"]
+        assert Decimal(data["categories"][0]["percentage"]) == Decimal("75")
+        # Auth user and one grouped query
+        assert len(statements) <= 2
+
     def test_income_vs_expenses(self, client, auth_headers, test_user, db_session):
         """Test income vs expenses report with trends."""
         from app.models.account import Account, AccountType
@@ -399,6 +491,101 @@ class TestReportsAPI:
         assert Decimal(data["current_period"]["net"]) == Decimal("-100.00")
         assert Decimal(data["current_period"]["savings_rate"]) == Decimal("0.00")
 
+    def test_income_vs_expenses_fills_empty_months_in_order(self, client, auth_headers, test_user, db_session):
+        """Test monthly trends are oldest first with zeros for months without transactions."""
+        from app.models.account import Account, AccountType
+        from app.models.transaction import Transaction, TransactionType
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD"
+        )
+        db_session.add(checking)
+        db_session.commit()
+        db_session.refresh(checking)
+
+        # Income two months ago, an expense on the last day of last month
+        this_month = date.today().replace(day=1)
+        db_session.add_all([
+            Transaction(
+                user_id=test_user.id,
+                account_id=checking.id,
+                type=TransactionType.CREDIT,
+                amount=Decimal("500.00"),
+                date=this_month - relativedelta(months=2)
+            ),
+            Transaction(
+                user_id=test_user.id,
+                account_id=checking.id,
+                type=TransactionType.DEBIT,
+                amount=Decimal("75.00"),
+                date=this_month - relativedelta(days=1)
+            ),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/v1/reports/income-vs-expenses?months=3", headers=auth_headers)
+
+        assert response.status_code == 200
+        trends = response.json()["monthly_trends"]
+        assert [t["month"] for t in trends] == [
+            (this_month - relativedelta(months=i)).strftime("%Y-%m") for i in (2, 1, 0)
+        ]
+        assert [(Decimal(t["income"]), Decimal(t["expenses"])) for t in trends] == [
+            (Decimal("500.00"), Decimal("0.00")),
+            (Decimal("0.00"), Decimal("75.00")),
+            (Decimal("0.00"), Decimal("0.00")),
+        ]
+
+    def test_dashboard_cached_until_data_changes(self, client, auth_headers, test_user, db_session):
+        """Test that dashboard responses are cached and invalidated by transaction writes."""
+        from app.models.account import Account, AccountType
+        from app.models.transaction import Transaction, TransactionType
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD",
+            opening_balance=Decimal("1000.00")
+        )
+        db_session.add(checking)
+        db_session.commit()
+
+        url = "/api/v1/reports/dashboard?start_date=2024-01-01&end_date=2024-01-31"
+        first = client.get(url, headers=auth_headers)
+        assert first.status_code == 200
+        assert Decimal(first.json()["income_vs_expenses"]["total_expenses"]) == Decimal("0.00")
+
+        # A write that bypasses the API is not seen until the cache is invalidated
+        db_session.add(Transaction(
+            user_id=test_user.id,
+            account_id=checking.id,
+            type=TransactionType.DEBIT,
+            amount=Decimal("20.00"),
+            date=date(2024, 1, 10)
+        ))
+        db_session.commit()
+        assert client.get(url, headers=auth_headers).json() == first.json()
+
+        response = client.post(
+            "/api/v1/transactions",
+            json={
+                "account_id": checking.id,
+                "type": "debit",
+                "amount": "30.00",
+                "date": "2024-01-15",
+                "description": "Lunch"
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+
+        data = client.get(url, headers=auth_headers).json()
+        assert Decimal(data["income_vs_expenses"]["total_expenses"]) == Decimal("50.00")
+
     def test_reports_require_authentication(self, client):
         """Test that all report endpoints require authentication."""
         endpoints = [
@@ -680,6 +867,51 @@ class TestReportsAPI:
             assert "average_amount" in category
             assert len(category["monthly_data"]) == 3
 
+    def test_spending_trends_monthly_pivot(self, client, auth_headers, test_user, db_session):
+        """Test spending trends fill empty months and order categories by spending."""
+        from app.models.account import Account, AccountType
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD"
+        )
+        db_session.add(checking)
+        db_session.commit()
+
+        rent = Category(user_id=test_user.id, name="Rent", type=CategoryType.EXPENSE)
+        coffee = Category(user_id=test_user.id, name="Coffee", type=CategoryType.EXPENSE)
+        db_session.add_all([rent, coffee])
+        db_session.commit()
+
+        this_month = date(date.today().year, date.today().month, 1)
+        last_month = this_month - relativedelta(months=1)
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=coffee.id,
+                        type=TransactionType.DEBIT, amount=Decimal("5.00"), date=last_month),
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=coffee.id,
+                        type=TransactionType.DEBIT, amount=Decimal("7.00"), date=last_month),
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=rent.id,
+                        type=TransactionType.DEBIT, amount=Decimal("900.00"), date=this_month),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/v1/reports/spending-trends?months=2", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["months"] == [last_month.strftime("%Y-%m"), this_month.strftime("%Y-%m")]
+        assert [c["category_name"] for c in data["categories"]] == ["Rent", "Coffee"]
+
+        rent_data, coffee_data = data["categories"]
+        assert [Decimal(m["amount"]) for m in rent_data["monthly_data"]] == [Decimal("0.00"), Decimal("900.00")]
+        assert [m["transaction_count"] for m in coffee_data["monthly_data"]] == [2, 0]
+        assert Decimal(coffee_data["total_amount"]) == Decimal("12.00")
+        assert Decimal(data["total_spending"]) == Decimal("912.00")
+
     def test_spending_trends_with_category_filter(self, client, auth_headers, test_user, db_session):
         """Test spending trends filtering by specific categories."""
         from app.models.account import Account, AccountType
@@ -749,6 +981,21 @@ class TestReportsAPI:
         assert len(data["categories"]) == 1
         assert data["categories"][0]["category_name"] == "Groceries"
 
+    def test_spending_trends_rejects_malformed_category_ids(self, client, auth_headers):
+        """Test that category_ids must be a comma-separated list of IDs."""
+        for category_ids in ["abc", "1;2", "-5"]:
+            response = client.get(
+                f"/api/v1/reports/spending-trends?category_ids={category_ids}",
+                headers=auth_headers
+            )
+            assert response.status_code == 422, category_ids
+
+        response = client.get(
+            "/api/v1/reports/spending-trends?category_ids=1, 2,",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+
     def test_income_expense_detail(self, client, auth_headers, test_user, db_session):
         """Test detailed income and expense breakdown."""
         from app.models.account import Account, AccountType
@@ -840,6 +1087,56 @@ class TestReportsAPI:
         assert Decimal(data["summary"]["total_income"]) == Decimal("6000.00")
         assert Decimal(data["summary"]["total_expenses"]) == Decimal("500.00")
 
+    def test_income_expense_detail_monthly_top_categories(self, client, auth_headers, test_user, db_session):
+        """Test monthly breakdown keeps the top five categories per month and type."""
+        from app.models.account import Account, AccountType
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD"
+        )
+        db_session.add(checking)
+        db_session.commit()
+
+        salary = Category(user_id=test_user.id, name="Salary", type=CategoryType.INCOME)
+        expense_cats = [
+            Category(user_id=test_user.id, name=f"Expense {i}", type=CategoryType.EXPENSE)
+            for i in range(1, 7)
+        ]
+        db_session.add_all([salary] + expense_cats)
+        db_session.commit()
+
+        this_month = date(date.today().year, date.today().month, 1)
+        last_month = this_month - relativedelta(months=1)
+        txns = [
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=salary.id,
+                        type=TransactionType.CREDIT, amount=Decimal("1000.00"), date=last_month),
+        ]
+        # Expense i costs i * 10, so "Expense 1" is the smallest and drops out
+        for i, category in enumerate(expense_cats, start=1):
+            txns.append(Transaction(user_id=test_user.id, account_id=checking.id, category_id=category.id,
+                                    type=TransactionType.DEBIT, amount=Decimal(i * 10), date=this_month))
+        db_session.add_all(txns)
+        db_session.commit()
+
+        response = client.get("/api/v1/reports/income-expense-detail?months=2", headers=auth_headers)
+
+        assert response.status_code == 200
+        previous, current = response.json()["monthly_breakdown"]
+
+        assert [s["category_name"] for s in previous["income_sources"]] == ["Salary"]
+        assert previous["top_expenses"] == []
+
+        assert current["income_sources"] == []
+        assert [c["category_name"] for c in current["top_expenses"]] == [
+            "Expense 6", "Expense 5", "Expense 4", "Expense 3", "Expense 2"
+        ]
+        assert round(Decimal(current["top_expenses"][0]["percentage"]), 2) == Decimal("28.57")
+
     def test_cash_flow_forecast(self, client, auth_headers, test_user, db_session):
         """Test cash flow forecast projection."""
         from app.models.account import Account, AccountType
@@ -1030,6 +1327,40 @@ class TestReportsAPI:
             assert "target" in link
             assert "value" in link
 
+    def test_sankey_diagram_counts_uncategorized_in_totals(
+        self, client, auth_headers, test_user, test_account, db_session
+    ):
+        """Test that uncategorized income/expenses are in the totals but get no category node."""
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+
+        rent = Category(user_id=test_user.id, name="Rent", type=CategoryType.EXPENSE)
+        db_session.add(rent)
+        db_session.commit()
+
+        today = date.today()
+        month_start = date(today.year, today.month, 1)
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=test_account.id,
+                        type=TransactionType.CREDIT, amount=Decimal("1000.00"), date=month_start),
+            Transaction(user_id=test_user.id, account_id=test_account.id, category_id=rent.id,
+                        type=TransactionType.DEBIT, amount=Decimal("400.00"), date=month_start),
+            Transaction(user_id=test_user.id, account_id=test_account.id,
+                        type=TransactionType.DEBIT, amount=Decimal("100.00"), date=month_start),
+        ])
+        db_session.commit()
+
+        response = client.get("/api/v1/reports/sankey-diagram", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert Decimal(data["total_income"]) == Decimal("1000.00")
+        assert Decimal(data["total_expenses"]) == Decimal("500.00")
+        assert Decimal(data["net_savings"]) == Decimal("500.00")
+        assert sorted(n["id"] for n in data["nodes"]) == sorted(
+            ["total_income", f"expense_{rent.id}", "savings"]
+        )
+
     def test_sankey_diagram_with_date_range(self, client, auth_headers, test_user, db_session):
         """Test Sankey diagram with custom date range."""
         from app.models.account import Account, AccountType
@@ -1139,6 +1470,67 @@ class TestReportsAPI:
         assert "Amount" in lines[0]
         assert "50.00" in lines[1]
 
+    def test_export_transactions_csv_streams_in_batches(
+        self, client, auth_headers, test_user, test_account, db_session, monkeypatch
+    ):
+        """Test that a CSV streamed over several chunks has one header and every row."""
+        import csv
+        import io
+        from app.api.v1 import reports
+        from app.models.transaction import Transaction, TransactionType
+
+        monkeypatch.setattr(reports, "CSV_STREAM_BATCH_ROWS", 2)
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=test_account.id, type=TransactionType.DEBIT,
+                        amount=Decimal("1.00") * (i + 1), date=date.today(), description=f"Item, {i}")
+            for i in range(5)
+        ])
+        db_session.commit()
+
+        response = client.get("/api/v1/reports/export/transactions", headers=auth_headers)
+
+        assert response.status_code == 200
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0][0] == "Date"
+        assert sorted(row[1] for row in rows[1:]) == [f"Item, {i}" for i in range(5)]
+
+    def test_export_transactions_csv_single_query(
+        self, client, auth_headers, test_user, test_account, db_session, count_queries
+    ):
+        """Test that exporting many transactions looks up account/category/payee names in one query."""
+        import csv
+        import io
+        from app.models.category import Category, CategoryType
+        from app.models.payee import Payee
+        from app.models.transaction import Transaction, TransactionType
+
+        category = Category(user_id=test_user.id, name="Groceries", type=CategoryType.EXPENSE)
+        payee = Payee(user_id=test_user.id, canonical_name="Corner Shop")
+        db_session.add_all([category, payee])
+        db_session.commit()
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=test_account.id, category_id=category.id,
+                        payee_id=payee.id if i % 2 else None, payee=f"RAW {i}",
+                        type=TransactionType.DEBIT, amount=Decimal("3.00"), date=date.today(),
+                        description=f"Purchase {i}")
+            for i in range(20)
+        ])
+        db_session.commit()
+
+        with count_queries() as statements:
+            response = client.get("/api/v1/reports/export/transactions", headers=auth_headers)
+
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 20
+        assert {row["Account"] for row in rows} == {test_account.name}
+        assert {row["Category"] for row in rows} == {"Groceries"}
+        payees = {row["Description"]: row["Payee"] for row in rows}
+        assert payees["Purchase 1"] == "Corner Shop"
+        assert payees["Purchase 2"] == "RAW 2"
+        # Auth user and the joined transaction query
+        assert len(statements) <= 2
+
     def test_export_transactions_csv_with_payee_entity(self, client, auth_headers, test_user, db_session):
         """Test CSV export uses linked payee name when available."""
         from app.models.account import Account, AccountType
@@ -1217,3 +1609,135 @@ class TestReportsAPI:
         for endpoint in endpoints:
             response = client.get(endpoint)
             assert response.status_code == 401, f"Endpoint {endpoint} should require auth"
+
+    def test_all_report_endpoints_avoid_lazy_loads(self, client, auth_headers, test_user, db_session):
+        """Test that every report loads fresh from the database without lazy relationship loads."""
+        from app.models.account import Account, AccountType
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+        from app.models.budget import Budget, BudgetPeriod
+
+        checking = Account(
+            user_id=test_user.id,
+            name="Checking",
+            type=AccountType.CHECKING,
+            currency="USD",
+            opening_balance=Decimal("1000.00")
+        )
+        db_session.add(checking)
+        db_session.commit()
+
+        groceries = Category(user_id=test_user.id, name="Groceries", type=CategoryType.EXPENSE)
+        db_session.add(groceries)
+        db_session.commit()
+
+        today = date.today()
+        db_session.add_all([
+            Transaction(user_id=test_user.id, account_id=checking.id, category_id=groceries.id,
+                        type=TransactionType.DEBIT, amount=Decimal("45.00"), date=today,
+                        payee="Market", description="Groceries"),
+            Budget(user_id=test_user.id, category_id=groceries.id, name="Groceries",
+                   amount=Decimal("300.00"), period=BudgetPeriod.MONTHLY,
+                   start_date=date(today.year, today.month, 1)),
+        ])
+        db_session.commit()
+
+        # Reports must load their own rows (with raiseload) rather than
+        # reuse the instances created above
+        db_session.expunge_all()
+
+        endpoints = [
+            "/api/v1/reports/dashboard",
+            "/api/v1/reports/spending-by-category",
+            "/api/v1/reports/income-vs-expenses",
+            "/api/v1/reports/net-worth-history",
+            "/api/v1/reports/spending-trends",
+            "/api/v1/reports/income-expense-detail",
+            "/api/v1/reports/cash-flow-forecast",
+            "/api/v1/reports/sankey-diagram",
+            "/api/v1/reports/export/transactions",
+            "/api/v1/reports/export/spending-by-category",
+            "/api/v1/reports/export/income-vs-expenses",
+            "/api/v1/reports/export/net-worth-history",
+        ]
+
+        for endpoint in endpoints:
+            response = client.get(endpoint, headers=auth_headers)
+            assert response.status_code == 200, f"Endpoint {endpoint} failed"
+
+    def test_report_query_counts_do_not_grow_with_data(
+        self, client, auth_headers, test_user, db_session, count_queries
+    ):
+        """Test that report endpoints issue a fixed number of queries regardless of data size."""
+        from app.models.account import Account, AccountType
+        from app.models.category import Category, CategoryType
+        from app.models.transaction import Transaction, TransactionType
+        from app.models.budget import Budget, BudgetPeriod
+
+        accounts = [
+            Account(user_id=test_user.id, name=f"Account {i}", type=AccountType.CHECKING,
+                    currency="USD", opening_balance=Decimal("100.00"))
+            for i in range(20)
+        ]
+        categories = [
+            Category(user_id=test_user.id, name=f"Category {i}", type=CategoryType.EXPENSE)
+            for i in range(20)
+        ]
+        db_session.add_all(accounts + categories)
+        db_session.commit()
+
+        today = date.today()
+        month_start = date(today.year, today.month, 1)
+        for i, (account, category) in enumerate(zip(accounts, categories)):
+            db_session.add_all([
+                Transaction(user_id=test_user.id, account_id=account.id, category_id=category.id,
+                            type=TransactionType.DEBIT, amount=Decimal("10.00") + i, date=month_start),
+                Transaction(user_id=test_user.id, account_id=account.id, category_id=category.id,
+                            type=TransactionType.DEBIT, amount=Decimal("5.00"),
+                            date=month_start - relativedelta(months=2)),
+                Budget(user_id=test_user.id, category_id=category.id, name=f"Budget {i}",
+                       amount=Decimal("50.00"), period=BudgetPeriod.MONTHLY, start_date=month_start),
+            ])
+            # Monthly bills from a distinct payee, for recurring bill detection
+            db_session.add_all([
+                Transaction(user_id=test_user.id, account_id=account.id, category_id=category.id,
+                            type=TransactionType.DEBIT, amount=Decimal("20.00"), payee=f"Biller {i}",
+                            date=month_start - relativedelta(months=months_back))
+                for months_back in (1, 2)
+            ])
+        db_session.commit()
+
+        # Each count includes the current-user lookup done by authentication
+        expected_max_queries = {
+            # accounts, balances, income/expense totals, budgets,
+            # budget spending, top categories
+            "/api/v1/reports/dashboard": 7,
+            # accounts, balances at every month end
+            "/api/v1/reports/net-worth-history?months=3": 3,
+            "/api/v1/reports/net-worth-history?months=24": 3,
+            # period total, category/month pivot
+            "/api/v1/reports/spending-trends?months=3": 3,
+            "/api/v1/reports/spending-trends?months=24": 3,
+            # summary totals, income by source, monthly totals, monthly top categories
+            "/api/v1/reports/income-expense-detail?months=3": 5,
+            "/api/v1/reports/income-expense-detail?months=24": 5,
+            # one grouped query with a windowed total
+            "/api/v1/reports/spending-by-category": 2,
+            # period totals, monthly totals
+            "/api/v1/reports/income-vs-expenses?months=24": 3,
+            # accounts, balances, monthly totals, expense transactions with
+            # payee/category names
+            "/api/v1/reports/cash-flow-forecast?historical_months=24": 5,
+            # monthly totals
+            "/api/v1/reports/export/income-vs-expenses?months=24": 2,
+            # accounts, balances at every month end
+            "/api/v1/reports/export/net-worth-history?months=60": 3,
+            # category totals by type
+            "/api/v1/reports/sankey-diagram": 2,
+        }
+
+        for url, max_queries in expected_max_queries.items():
+            with count_queries() as statements:
+                response = client.get(url, headers=auth_headers)
+            assert response.status_code == 200, url
+            assert len(statements) <= max_queries, f"{url} ran {len(statements)} queries"
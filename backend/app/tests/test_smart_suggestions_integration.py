@@ -379,3 +379,28 @@ class TestRealWorldScenarios:
         suggestion = walmart_suggestions[0]
         # Should match at least 3 of the 4 transactions
         assert len(suggestion.matching_rows) >= 3
+
+
+class TestExistingRuleOverlap:
+    """Test filtering of suggestions already covered by existing rules"""
+
+    def test_pattern_overlap_matcher(self):
+        """Overlap is case-insensitive and checked in both directions"""
+        from app.api.v1.imports import build_pattern_overlap_matcher
+
+        overlaps = build_pattern_overlap_matcher(["Starbucks", "SHELL OIL", None, ""])
+
+        assert overlaps("starbucks")          # exact match
+        assert overlaps("STARBUCKS STORE")    # existing inside suggestion
+        assert overlaps("shell")              # suggestion inside existing
+        assert not overlaps("WALMART")
+        # Separator keeps matches from spanning two existing patterns
+        assert not overlaps("OILSTAR")
+
+    def test_pattern_overlap_matcher_without_rules(self):
+        """No existing rules means nothing overlaps"""
+        from app.api.v1.imports import build_pattern_overlap_matcher
+
+        overlaps = build_pattern_overlap_matcher([])
+
+        assert not overlaps("STARBUCKS")